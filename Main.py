@@ -10,8 +10,12 @@ import sys
 
 from scheduler.config import get_config
 from scheduler.data import load_and_validate
-from scheduler.solver import solve
-from scheduler.export import export_school_schedule, export_student_schedules
+from scheduler.data.cache import CACHE_DIRNAME
+from scheduler.solver import solve_with_trace, STRATEGIES, OBJECTIVES
+from scheduler.solver.hints import load_hints
+from scheduler.solver.lns import improve_lns
+from scheduler.profiling import phase, start_report
+from scheduler.export import OUTPUT_FORMATS, check_output_formats, export_school_schedule, export_student_schedules, export_table, schedule_table
 from scheduler.rotation import apply_rotations_to_schedule
 
 
@@ -20,20 +24,49 @@ def main():
     parser.add_argument("--teachers", default="exampleInput/TeacherCourseMapping.xlsx", help="Teacher/course Excel path")
     parser.add_argument("--students", default="exampleInput/studentCourses.xlsx", help="Student courses Excel path")
     parser.add_argument("--out-dir", default=None, help="Directory for all output Excel files (default: output)")
+    parser.add_argument("--output-format", nargs="+", choices=OUTPUT_FORMATS, default=None, metavar="FORMAT", help=f"One or more of {', '.join(OUTPUT_FORMATS)} (default: config output_formats)")
     parser.add_argument("--no-require-alignment", action="store_true", help="Run even if demand/supply alignment fails")
-    parser.add_argument("--time", type=float, default=None, help="Solver time limit (seconds)")
+    parser.add_argument("--no-cache", action="store_true", help="Always re-parse the input workbooks and solve (don't use OUT_DIR/.cache)")
+    parser.add_argument("--resolve", action="store_true", help="Solve even if a stored result for the same inputs and config exists (the better one is kept)")
+    parser.add_argument("--time", type=float, default=None, help="Solver time limit (seconds; default scales with model size)")
+    parser.add_argument("--plateau", type=float, default=None, metavar="SECONDS", help="Stop after this many seconds without improvement")
+    parser.add_argument("--gap", type=float, default=None, metavar="PCT", help="Stop when within PCT%% of the best bound")
+    parser.add_argument("--stop-when-all-assigned", action="store_true", help="Stop as soon as every request is assigned")
+    parser.add_argument("--hint-from", default=None, metavar="DIR", help="Warm-start from a previous run's output directory (school_schedule.xlsx, student_schedules.xlsx)")
+    parser.add_argument("--no-greedy-hint", action="store_true", help="Don't warm-start the solver from the greedy constructive schedule")
+    parser.add_argument("--anytime", action="store_true", help="Checkpoint improving schedules to OUT_DIR/checkpoint while solving")
+    parser.add_argument("--repair", type=float, default=None, metavar="SECONDS", help="Post-solve repair time for unassigned requests (0 = off; default: config solver_repair_seconds)")
+    parser.add_argument("--lns", type=float, default=None, metavar="SECONDS", help="After solving, improve the schedule by large-neighbourhood search for SECONDS")
+    parser.add_argument("--lns-workers", type=int, default=None, metavar="N", help="LNS worker processes, each with its own model copy (default: config solver_lns_workers, at most the CPU count)")
+    parser.add_argument("--save-model", default=None, metavar="DIR", help="Save the built CP-SAT model and variable index to DIR (solve it again with python -m scheduler.solver.artifact_cli DIR)")
+    parser.add_argument("--profile", action="store_true", help="Print a per-phase time/memory summary (also tracks Python allocation peaks; slower)")
+    parser.add_argument("--strategy", choices=STRATEGIES, default=None, help="Solver formulation (default: config solver_strategy)")
+    parser.add_argument("--objective", choices=OBJECTIVES, default=None, help="weighted sum or lexicographic two-pass (default: config solver_objective)")
     args = parser.parse_args()
 
     cfg = get_config()
+    report = start_report(trace_memory=args.profile)
     time_limit = args.time if args.time is not None else cfg.solver_time_seconds
+    relative_gap = args.gap / 100 if args.gap is not None else None
+
+    out_dir = args.out_dir or cfg.output_dir
+    os.makedirs(out_dir, exist_ok=True)
+    formats = args.output_format or cfg.output_formats
+    try:
+        check_output_formats(formats)
+    except ValueError as e:
+        print("ERROR:", e, file=sys.stderr)
+        sys.exit(1)
 
     print("Loading and validating data...")
     try:
-        students, teachers, alignment = load_and_validate(
-            args.teachers,
-            args.students,
-            require_alignment=not args.no_require_alignment,
-        )
+        with phase("load_and_validate"):
+            students, teachers, alignment = load_and_validate(
+                args.teachers,
+                args.students,
+                require_alignment=not args.no_require_alignment,
+                cache_dir=None if args.no_cache else os.path.join(out_dir, CACHE_DIRNAME),
+            )
     except FileNotFoundError as e:
         print("ERROR: File not found.", e, file=sys.stderr)
         sys.exit(1)
@@ -44,6 +77,13 @@ def main():
     print(alignment.summary())
     print(alignment.detailed_report())
     print(f"\nStudents: {len(students)}, Teachers: {len(teachers)}")
+    report.info.update(
+        students=len(students),
+        teachers=len(teachers),
+        requests=sum(len(s.get("requests") or []) for s in students.values()),
+        strategy=args.strategy or cfg.solver_strategy,
+        time_limit=time_limit,
+    )
     
     # Fail fast if understaffed courses exist
     if alignment.under_supplied or alignment.no_teacher:
@@ -55,41 +95,91 @@ def main():
             print(f"  - Increase teacher capacity for: {', '.join(alignment.under_supplied)}")
         sys.exit(1)
 
-    print("Solving...")
-    schedule = solve(
-        students,
-        teachers,
-        time_limit_seconds=time_limit,
-    )
+    hints = None
+    if args.hint_from:
+        try:
+            hints = load_hints(args.hint_from, students, teachers)
+        except FileNotFoundError as e:
+            print("ERROR: Hint file not found.", e, file=sys.stderr)
+            sys.exit(1)
+        print(f"Loaded {len(hints)} hints from {args.hint_from} ({hints.skipped} stale entries skipped).")
+
+    print("Solving... (Ctrl-C stops the search and keeps the best schedule so far)")
+    with phase("solve"):
+        solved = solve_with_trace(
+            students,
+            teachers,
+            time_limit_seconds=time_limit,
+            strategy=args.strategy,
+            hints=hints,
+            checkpoint_dir=os.path.join(out_dir, "checkpoint") if args.anytime else None,
+            plateau_seconds=args.plateau,
+            relative_gap=relative_gap,
+            stop_when_all_assigned=args.stop_when_all_assigned or None,
+            objective=args.objective,
+            greedy_hint=False if args.no_greedy_hint else None,
+            repair_seconds=args.repair,
+            trace_path=os.path.join(out_dir, "solve_trace.jsonl"),
+            save_model_dir=args.save_model,
+            result_store_dir=None if args.no_cache else os.path.join(out_dir, CACHE_DIRNAME, "results"),
+            resolve=args.resolve,
+        )
+    schedule = solved.schedule
+    report.info.update(status=solved.status, reused_result=solved.reused)
 
     if schedule is None:
         print("No feasible schedule found. Try relaxing constraints or check data.")
+        _write_report(report, out_dir, args.profile)
         sys.exit(1)
 
-    out_dir = args.out_dir or cfg.output_dir
-    os.makedirs(out_dir, exist_ok=True)
+    if args.lns:
+        print(f"Improving by large-neighbourhood search for {args.lns:g}s...")
+        with phase("lns"):
+            result = improve_lns(schedule, students, teachers, time_limit_seconds=args.lns, workers=args.lns_workers)
+        print(result.summary())
+        schedule = result.schedule
+
     print(f"Writing outputs to {out_dir}/...")
-    export_school_schedule(
-        schedule,
-        teachers,
-        output_path=os.path.join(out_dir, "school_schedule.xlsx")
-    )
-    export_student_schedules(
-        schedule,
-        students,
-        output_path=os.path.join(out_dir, "student_schedules.xlsx")
-    )
+    # One seat table for every output format
+    with phase("schedule_table"):
+        table = schedule_table(schedule, students, teachers)
+    if "excel" in formats:
+        with phase("export_school_schedule"):
+            export_school_schedule(
+                table,
+                output_path=os.path.join(out_dir, "school_schedule.xlsx")
+            )
+        with phase("export_student_schedules"):
+            export_student_schedules(
+                table,
+                students,
+                output_path=os.path.join(out_dir, "student_schedules.xlsx")
+            )
+    if any(fmt != "excel" for fmt in formats):
+        with phase("export_table"):
+            export_table(table, out_dir, formats)
 
     # Optional: rotation option assignment for G8 (2-of-3 etc.)
     try:
-        rotation_assignments = apply_rotations_to_schedule(schedule, students)
+        with phase("rotations"):
+            rotation_assignments = apply_rotations_to_schedule(schedule, students)
         if rotation_assignments:
             print(f"Rotation options assigned for {len(rotation_assignments)} students in rotation sections.")
     except Exception as e:
         print("Rotation assignment (optional):", e)
 
+    report.info["assigned"] = sum(len(info["students"]) for courses in schedule.values() for info in courses.values())
+    _write_report(report, out_dir, args.profile)
     print("Done.")
 
 
+def _write_report(report, out_dir, profile):
+    path = os.path.join(out_dir, "run_report.json")
+    report.write(path)
+    print(f"Wrote {path}")
+    if profile:
+        print(report.summary())
+
+
 if __name__ == "__main__":
     main()
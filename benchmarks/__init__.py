@@ -0,0 +1,5 @@
+"""
+Benchmark suite: pinned synthetic schools (instances.py), a runner that times every phase of
+load -> validate -> build -> solve -> export (run.py) and a regression report against a stored
+baseline (compare.py). Everything is generated locally from exampleInput/.
+"""
@@ -0,0 +1,133 @@
+"""
+Export benchmark: the seat-table, write-only openpyxl exporters (scheduler.export; the time
+includes building the table) against the previous name-scan + pandas DataFrame exporters, kept
+below as a reference, on a synthetic schedule for a generated instance (default 5,000 students
+x 8 periods; no solve needed).
+
+    python -m benchmarks.bench_export [--students 5000] [--repeat 3]
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from typing import Any, Callable, Dict, List, Tuple
+
+import pandas as pd
+
+from benchmarks.instances import generate_instance, instance_name
+from benchmarks.run import INSTANCE_DIR
+from scheduler.config import get_config
+from scheduler.data import load_students, load_teachers
+from scheduler.export import export_school_schedule, export_student_schedules, schedule_table
+from scheduler.solver.schedule import build_schedule
+
+Schedule = Dict[str, Dict[str, Dict[str, Any]]]
+
+
+def reference_export_school_schedule(schedule: Schedule, teachers: Dict[str, Dict[str, Any]], output_path: str) -> None:
+    """The school schedule export before streaming: one dict per row, then a DataFrame."""
+    rows = []
+    for p in get_config().periods:
+        for course, data in (schedule.get(p) or {}).items():
+            teacher_names = data.get("teachers") or []
+            students = data.get("students") or []
+            rows.append({
+                "Period": p,
+                "Course": course,
+                "Teacher": ", ".join(teacher_names) if teacher_names else "TBD",
+                "Room": teacher_names[0] if teacher_names else "TBD",
+                "Students": ", ".join(students),
+                "Class Size": len(students),
+            })
+    pd.DataFrame(rows).to_excel(output_path, index=False)
+
+
+def reference_export_student_schedules(schedule: Schedule, students: Dict[int, Dict[str, Any]], output_path: str) -> None:
+    """The student schedule export before the id index: a scan of all students per seat."""
+    periods = get_config().periods
+    student_courses = {sid: {p: "" for p in periods} for sid in students}
+    for period, courses in schedule.items():
+        for course, data in courses.items():
+            for student_name in (data.get("students") or []):
+                sid = next((k for k, v in students.items() if v["name"] == student_name), None)
+                if sid is not None:
+                    student_courses[sid][period] = course
+    rows = []
+    for sid in sorted(students):
+        row = {"Student Name": students[sid]["name"], "Student Number": sid, "Grade": students[sid].get("grade", "")}
+        row.update(student_courses[sid])
+        rows.append(row)
+    pd.DataFrame(rows).to_excel(output_path, index=False)
+
+
+def synthetic_schedule(
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+) -> Schedule:
+    """Each student's first requests in consecutive periods; each section taught by a qualified teacher."""
+    periods = get_config().periods
+    student_assignments: List[Tuple[int, str, str]] = []
+    for i, (sid, s) in enumerate(sorted(students.items())):
+        for j, c in enumerate((s.get("requests") or [])[: len(periods)]):
+            student_assignments.append((sid, c, periods[(i + j) % len(periods)]))
+    by_course: Dict[str, List[str]] = {}
+    for tid, t in teachers.items():
+        for c in t.get("can_teach") or []:
+            by_course.setdefault(c, []).append(tid)
+    sections = sorted({(c, p) for _, c, p in student_assignments if c in by_course})
+    teacher_assignments = [(by_course[c][k % len(by_course[c])], c, p) for k, (c, p) in enumerate(sections)]
+    return build_schedule(students, teachers, student_assignments, teacher_assignments, periods=periods)
+
+
+def _best_of(repeat: int, fn: Callable[[str], None], path: str) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with redirect_stdout(io.StringIO()):  # the exporters print a line per file
+            fn(path)
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the schedule exports")
+    parser.add_argument("--students", type=int, default=5000, help="Students in the generated instance")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per exporter (best is reported)")
+    args = parser.parse_args()
+
+    teachers_path, students_path = generate_instance(args.students, os.path.join(INSTANCE_DIR, instance_name(args.students)))
+    teachers, students = load_teachers(teachers_path), load_students(students_path)
+    schedule = synthetic_schedule(students, teachers)
+    seats = sum(len(info["students"]) for courses in schedule.values() for info in courses.values())
+    print(f"{len(students)} students, {len(get_config().periods)} periods, {seats} seats.")
+
+    cases = [
+        (
+            "school_schedule",
+            lambda path: reference_export_school_schedule(schedule, teachers, path),
+            lambda path: export_school_schedule(schedule_table(schedule, students, teachers), output_path=path),
+        ),
+        (
+            "student_schedules",
+            lambda path: reference_export_student_schedules(schedule, students, path),
+            lambda path: export_student_schedules(schedule_table(schedule, students, teachers), students, output_path=path),
+        ),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, reference, streaming in cases:
+            ref_path, new_path = os.path.join(tmp, f"{name}_ref.xlsx"), os.path.join(tmp, f"{name}.xlsx")
+            ref_seconds = _best_of(args.repeat, reference, ref_path)
+            new_seconds = _best_of(args.repeat, streaming, new_path)
+            if not pd.read_excel(ref_path).equals(pd.read_excel(new_path)):
+                print(f"ERROR: {name} exports disagree.")
+                return 1
+            print(f"{name}: reference {ref_seconds:.2f}s, streaming {new_seconds:.2f}s ({ref_seconds / new_seconds:.1f}x faster)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
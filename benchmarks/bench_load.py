@@ -0,0 +1,96 @@
+"""
+Student loader benchmark: the streaming openpyxl loader (scheduler.data.load_students) against
+the previous pandas read_excel + iterrows loader, kept below as a reference, on a generated
+20,000-row request file.
+
+    python -m benchmarks.bench_load [--rows 20000] [--repeat 3]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+
+from benchmarks.instances import generate_instance, instance_name
+from benchmarks.run import INSTANCE_DIR
+from scheduler.config import get_config
+from scheduler.data import load_students
+from scheduler.data.load import _split_courses_text, _split_simple_text
+
+
+def _reference_split_courses_cell(cell: Any) -> List[str]:
+    if cell is None or (isinstance(cell, float) and pd.isna(cell)):
+        return []
+    s = str(cell).strip()
+    if not s:
+        return []
+    skip_tokens = {"fine_arts_rotation", "adst rotation", "fine arts rotation", ""}
+    out = []
+    for p in re.split(r"[,.\n]+", s):
+        t = re.sub(r"\s+", " ", p.strip())
+        if t and t.lower() not in skip_tokens:
+            out.append(t)
+    return out
+
+
+def _reference_split_simple(cell: Any, sep: str = ",") -> List[str]:
+    if cell is None or (isinstance(cell, float) and pd.isna(cell)):
+        return []
+    s = str(cell).strip()
+    if not s:
+        return []
+    return [re.sub(r"\s+", " ", c.strip()) for c in s.split(sep) if c.strip()]
+
+
+def reference_load_students(path: str) -> Dict[int, Dict[str, Any]]:
+    """The loader before streaming: pd.read_excel, then one Series per row via iterrows."""
+    col = get_config().student_columns
+    df = pd.read_excel(path)
+    out: Dict[int, Dict[str, Any]] = {}
+    for _, r in df.iterrows():
+        num = r.get(col["number"])
+        if num is None or pd.isna(num):
+            continue
+        out[int(num)] = {
+            "name": str(r.get(col["name"], "")).strip(),
+            "grade": int(r.get(col["grade"], 9)),
+            "requests": _reference_split_courses_cell(r.get(col["courses"], "")),
+            "preferences": _reference_split_simple(r.get(col["preferences"], "")),
+        }
+    return out
+
+
+def _best_of(repeat: int, fn: Callable[[str], Any], path: str) -> float:
+    times = []
+    for _ in range(repeat):
+        # Start every run with empty course-parsing caches
+        _split_courses_text.cache_clear()
+        _split_simple_text.cache_clear()
+        started = time.perf_counter()
+        fn(path)
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the student loader")
+    parser.add_argument("--rows", type=int, default=20000, help="Students in the generated file")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per loader (best is reported)")
+    args = parser.parse_args()
+
+    _, path = generate_instance(args.rows, os.path.join(INSTANCE_DIR, instance_name(args.rows)))
+    if reference_load_students(path) != load_students(path):
+        print("ERROR: loaders disagree.")
+        return 1
+    reference = _best_of(args.repeat, reference_load_students, path)
+    streaming = _best_of(args.repeat, load_students, path)
+    print(f"{args.rows} rows: pandas iterrows {reference:.2f}s, streaming {streaming:.2f}s ({reference / streaming:.1f}x faster)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
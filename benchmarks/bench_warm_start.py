@@ -0,0 +1,109 @@
+"""
+Warm-start benchmark: time to first CP-SAT solution with hints from a previous run's outputs
+(--hint-from, hints.load_hints) against a cold start without hints, on the same model of a
+generated instance. The previous run is the greedy schedule exported to Excel unless
+--hint-from points at a real run's output directory.
+
+    python -m benchmarks.bench_warm_start [--students 800] [--time 120] [--repeat 3] [--hint-from DIR]
+"""
+
+import argparse
+import io
+import os
+import statistics
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from typing import Any, Dict, List, Optional
+
+from ortools.sat.python import cp_model
+
+from benchmarks.instances import generate_instance, instance_name
+from benchmarks.run import INSTANCE_DIR, _FirstSolution
+from scheduler.config import get_config
+from scheduler.data import load_students, load_teachers
+from scheduler.export import export_school_schedule, export_student_schedules, schedule_table
+from scheduler.solver.greedy import greedy_schedule
+from scheduler.solver.hints import Hints, load_hints
+from scheduler.solver.model import build_index, build_model
+from scheduler.solver.presolve import presolve
+from scheduler.solver.util import new_solver
+
+
+class _StopAtFirst(_FirstSolution):
+    """Records the first solution's time and stops there; nothing after it is measured."""
+
+    def on_solution_callback(self) -> None:
+        super().on_solution_callback()
+        self.StopSearch()
+
+
+def _export_previous_run(
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    directory: str,
+) -> None:
+    """Write the greedy schedule the way Main.py writes its outputs."""
+    table = schedule_table(greedy_schedule(students, teachers), students, teachers)
+    with redirect_stdout(io.StringIO()):
+        export_school_schedule(table, output_path=os.path.join(directory, "school_schedule.xlsx"))
+        export_student_schedules(table, students, output_path=os.path.join(directory, "student_schedules.xlsx"))
+
+
+def first_solution_seconds(
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    hints: Optional[Hints],
+    time_limit: float,
+    seed: int,
+) -> Optional[float]:
+    """Build the model (hinted or not) and solve until the first solution; None if none in time_limit."""
+    cfg = get_config()
+    presolved = presolve(build_index(students, teachers), teachers, cfg) if cfg.solver_presolve else None
+    model, _, _, _ = build_model(students, teachers, hints=hints, presolved=presolved)
+    solver = new_solver(time_limit, cfg)
+    solver.parameters.random_seed = seed
+    callback = _StopAtFirst()
+    status = solver.Solve(model, callback)
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return None
+    return callback.first_seconds
+
+
+def _fmt(seconds: List[Optional[float]]) -> str:
+    found = [s for s in seconds if s is not None]
+    runs = ", ".join("-" if s is None else f"{s:.2f}s" for s in seconds)
+    median = f"median {statistics.median(found):.2f}s" if found else "no solution"
+    return f"{median} ({runs})"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark time to first solution, warm vs cold start")
+    parser.add_argument("--students", type=int, default=800, help="Students in the generated instance")
+    parser.add_argument("--time", type=float, default=120.0, help="Time limit per solve (seconds)")
+    parser.add_argument("--repeat", type=int, default=3, help="Solves per mode, one random seed each")
+    parser.add_argument("--hint-from", default=None, metavar="DIR", help="A previous run's output directory (default: the greedy schedule)")
+    args = parser.parse_args()
+
+    teachers_path, students_path = generate_instance(args.students, os.path.join(INSTANCE_DIR, instance_name(args.students)))
+    teachers, students = load_teachers(teachers_path), load_students(students_path)
+    with tempfile.TemporaryDirectory() as tmp:
+        hint_dir = args.hint_from
+        if hint_dir is None:
+            _export_previous_run(students, teachers, tmp)
+            hint_dir = tmp
+        hints = load_hints(hint_dir, students, teachers)
+    print(f"{len(students)} students, {len(hints)} hinted assignments from {args.hint_from or 'the greedy schedule'}.")
+
+    results: Dict[str, List[Optional[float]]] = {"cold": [], "warm": []}
+    for seed in range(args.repeat):
+        for mode, mode_hints in (("cold", None), ("warm", hints)):
+            with redirect_stdout(io.StringIO()):
+                results[mode].append(first_solution_seconds(students, teachers, mode_hints, args.time, seed))
+    print(f"First solution, cold start: {_fmt(results['cold'])}")
+    print(f"First solution, warm start: {_fmt(results['warm'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Compare a benchmark report against a stored baseline and flag regressions.
+
+    python -m benchmarks.compare CURRENT.json [--baseline benchmarks/baseline.json]
+
+Flags, per instance: a phase or time to first feasible more than --time-tolerance slower (and
+at least --min-seconds, so sub-second noise is ignored); no feasible solution where the baseline
+had one; more model variables or constraints; objective lower or unassigned requests higher by
+more than --quality-tolerance. Exits with status 1 if anything regressed.
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, Any, List, Optional
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_TIME_TOLERANCE: float = 0.20
+DEFAULT_MIN_SECONDS: float = 0.5
+DEFAULT_QUALITY_TOLERANCE: float = 0.01
+
+
+def _slower(name: str, old: Optional[float], new: Optional[float], tolerance: float, min_seconds: float) -> Optional[str]:
+    if old is None:
+        return None
+    if new is None:
+        return f"{name}: none (baseline {old:.2f}s)"
+    if new > old * (1 + tolerance) and new - old >= min_seconds:
+        return f"{name}: {new:.2f}s vs {old:.2f}s (+{(new - old) / old if old else 1:.0%})"
+    return None
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    *,
+    time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+    min_seconds: float = DEFAULT_MIN_SECONDS,
+    quality_tolerance: float = DEFAULT_QUALITY_TOLERANCE,
+) -> Dict[str, List[str]]:
+    """Instance name -> regression messages (instances without regressions are left out)."""
+    old_by_name = {inst["name"]: inst for inst in baseline.get("instances", [])}
+    out: Dict[str, List[str]] = {}
+    for new in current.get("instances", []):
+        old = old_by_name.get(new["name"])
+        if old is None:
+            continue
+        found: List[str] = []
+        for phase, seconds in old["phases"].items():
+            found.append(_slower(f"{phase} time", seconds, new["phases"].get(phase), time_tolerance, min_seconds))
+        found.append(
+            _slower("first feasible", old["first_feasible_seconds"], new["first_feasible_seconds"], time_tolerance, min_seconds)
+        )
+        for key in ("variables", "constraints"):
+            if new["model"][key] > old["model"][key]:
+                found.append(f"model {key}: {new['model'][key]} vs {old['model'][key]}")
+        if old["objective"] is not None:
+            if new["objective"] is None:
+                found.append("objective: no solution")
+            elif new["objective"] < old["objective"] - quality_tolerance * abs(old["objective"]):
+                found.append(f"objective: {new['objective']:.0f} vs {old['objective']:.0f}")
+        if new["unassigned"] > old["unassigned"] + quality_tolerance * new["requests"]:
+            found.append(f"unassigned requests: {new['unassigned']} vs {old['unassigned']}")
+        found = [msg for msg in found if msg]
+        if found:
+            out[new["name"]] = found
+    return out
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Flag regressions in a benchmark report against a baseline")
+    parser.add_argument("current", help="Report from benchmarks.run")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline report (default: %(default)s)")
+    parser.add_argument("--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE, help="Allowed relative slowdown")
+    parser.add_argument("--min-seconds", type=float, default=DEFAULT_MIN_SECONDS, help="Ignore slowdowns smaller than this")
+    parser.add_argument("--quality-tolerance", type=float, default=DEFAULT_QUALITY_TOLERANCE, help="Allowed relative objective / unassigned loss")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    if (baseline.get("time_limit"), baseline.get("cold")) != (current.get("time_limit"), current.get("cold")):
+        print("WARNING: baseline and current report use different --time / --cold settings.")
+
+    missing = sorted({i["name"] for i in baseline.get("instances", [])} - {i["name"] for i in current.get("instances", [])})
+    if missing:
+        print(f"Not in current report: {', '.join(missing)}")
+    regressions = compare_reports(
+        baseline,
+        current,
+        time_tolerance=args.time_tolerance,
+        min_seconds=args.min_seconds,
+        quality_tolerance=args.quality_tolerance,
+    )
+    if not regressions:
+        print("No regressions.")
+        return 0
+    for name, messages in regressions.items():
+        print(f"REGRESSION {name}:")
+        for msg in messages:
+            print(f"  - {msg}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
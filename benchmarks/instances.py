@@ -0,0 +1,65 @@
+"""
+Deterministic synthetic instances, scaled from the example school: students are drawn (seeded)
+from exampleInput's request lists, so the grade mix and course combinations stay realistic,
+and the teacher mapping is repeated ceil(students / example students) times.
+"""
+
+import math
+import os
+import random
+from typing import List, Tuple
+
+import pandas as pd
+
+from scheduler.config import get_config
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "exampleInput")
+EXAMPLE_TEACHERS = os.path.join(EXAMPLE_DIR, "TeacherCourseMapping.xlsx")
+EXAMPLE_STUDENTS = os.path.join(EXAMPLE_DIR, "studentCourses.xlsx")
+
+SIZES: List[int] = [300, 800, 2000, 5000]
+DEFAULT_SEED: int = 20240601
+FIRST_STUDENT_NUMBER: int = 100000
+# Part of instance names: bump when generated files change so cached instances are not reused.
+GENERATOR_VERSION: int = 2
+
+
+def instance_name(students: int, seed: int = DEFAULT_SEED) -> str:
+    return f"school_{students}_s{seed}_v{GENERATOR_VERSION}"
+
+
+def generate_instance(students: int, out_dir: str, seed: int = DEFAULT_SEED) -> Tuple[str, str]:
+    """
+    Write teachers.xlsx and students.xlsx for a school of this many students into out_dir
+    (reused if already there; the same arguments always give the same files).
+    Returns (teachers path, students path).
+    """
+    teachers_path = os.path.join(out_dir, "teachers.xlsx")
+    students_path = os.path.join(out_dir, "students.xlsx")
+    if os.path.exists(teachers_path) and os.path.exists(students_path):
+        return teachers_path, students_path
+    os.makedirs(out_dir, exist_ok=True)
+    cfg = get_config()
+    tcol, scol = cfg.teacher_columns, cfg.student_columns
+
+    example_students = pd.read_excel(EXAMPLE_STUDENTS)
+    example_teachers = pd.read_excel(EXAMPLE_TEACHERS)
+    rng = random.Random(seed)
+
+    rows = [example_students.iloc[rng.randrange(len(example_students))] for _ in range(students)]
+    out = pd.DataFrame(rows).reset_index(drop=True)
+    out[scol["name"]] = [f"Student {i + 1:05d}" for i in range(students)]
+    out[scol["number"]] = [FIRST_STUDENT_NUMBER + i for i in range(students)]
+
+    copies = max(1, math.ceil(students / len(example_students)))
+    staff = []
+    for k in range(copies):
+        copy = example_teachers.copy()
+        if k:
+            # Teachers are keyed by last name and first initial, so the copies need their own last names
+            copy[tcol["last_name"]] = copy[tcol["last_name"]].astype(str) + f" {k + 1}"
+        staff.append(copy)
+
+    pd.concat(staff, ignore_index=True).to_excel(teachers_path, index=False)
+    out.to_excel(students_path, index=False)
+    return teachers_path, students_path
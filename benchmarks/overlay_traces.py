@@ -0,0 +1,139 @@
+"""
+Overlay solve_trace.jsonl files from several runs (e.g. different solver_num_workers or models).
+
+    python -m benchmarks.overlay_traces RUN_A/solve_trace.jsonl RUN_B/solve_trace.jsonl \
+        [--labels 8w 1w] [--metric objective] [--source cp_sat] [--out overlay.png]
+
+With matplotlib installed and --out given, plots metric against time as one step line per run
+(dashed: best bound, for objective). Otherwise prints the metric of each run at fixed times.
+Traces of component solves are summed per time step. objective and best_bound are on different
+scales per source (lexicographic pass 1 counts assignments, pass 2 is size deviation), so they
+get one series per source ("label [cp_sat_pass_2]"); --source keeps only one source.
+"""
+
+import argparse
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from scheduler.solver.anytime import TracePoint, read_trace
+
+METRICS = ("objective", "assigned", "open_sections", "best_bound")
+# Metrics whose meaning depends on the source that recorded them
+PER_SOURCE_METRICS = ("objective", "best_bound")
+CHECKPOINTS = (1, 2, 5, 10, 20, 30, 60, 120, 300, 600, 900)
+
+
+def series(points: List[TracePoint], metric: str) -> List[Tuple[float, float]]:
+    """(seconds, value) steps; with several components the latest value of each is summed."""
+    latest: Dict[Optional[int], float] = {}
+    out: List[Tuple[float, float]] = []
+    for pt in sorted(points, key=lambda pt: pt.seconds):
+        value = getattr(pt, metric)
+        if value is None:
+            continue
+        latest[pt.component] = value
+        out.append((pt.seconds, sum(latest.values())))
+    return out
+
+
+def group_runs(
+    traces: Dict[str, List[TracePoint]],
+    metric: str,
+    source: Optional[str] = None,
+) -> Dict[str, List[TracePoint]]:
+    """
+    Points per plotted series: only source if given, and one series per source for
+    PER_SOURCE_METRICS. A run without any value for metric keeps one empty series.
+    """
+    out: Dict[str, List[TracePoint]] = {}
+    for label, points in traces.items():
+        points = [pt for pt in points if source is None or pt.source == source]
+        if metric not in PER_SOURCE_METRICS or source is not None:
+            out[label] = points
+            continue
+        sources = list(dict.fromkeys(pt.source for pt in points if getattr(pt, metric) is not None))
+        if not sources:
+            out[label] = []
+        for src in sources:
+            key = label if len(sources) == 1 else f"{label} [{src}]"
+            out[key] = [pt for pt in points if pt.source == src]
+    return out
+
+
+def value_at(steps: List[Tuple[float, float]], seconds: float) -> Optional[float]:
+    found = None
+    for t, value in steps:
+        if t > seconds:
+            break
+        found = value
+    return found
+
+
+def print_table(runs: Dict[str, List[Tuple[float, float]]], metric: str) -> None:
+    """Runs with values as columns; runs without any are listed below the table."""
+    shown = {label: steps for label, steps in runs.items() if steps}
+    if shown:
+        end = max(steps[-1][0] for steps in shown.values())
+        times = [t for t in CHECKPOINTS if t <= end] + [end]
+        width = max([12, *(len(label) + 2 for label in shown)])
+        print(f"{metric} at time (s)")
+        print(f"{'':>8}" + "".join(f"{label:>{width}}" for label in shown))
+        for t in times:
+            cells = [value_at(steps, t) for steps in shown.values()]
+            print(f"{t:>8.1f}" + "".join(f"{'-' if v is None else f'{v:.0f}':>{width}}" for v in cells))
+    for label, steps in runs.items():
+        if not steps:
+            print(f"{label}: no points for {metric}")
+
+
+def plot(traces: Dict[str, List[TracePoint]], metric: str, out: str) -> None:
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(9, 5))
+    for label, points in traces.items():
+        steps = series(points, metric)
+        if not steps:
+            print(f"{label}: no points for {metric}")
+            continue
+        line, = ax.step(*zip(*steps), where="post", label=label)
+        if metric == "objective":
+            bound = series(points, "best_bound")
+            if bound:
+                ax.step(*zip(*bound), where="post", linestyle="--", color=line.get_color(), alpha=0.6)
+    ax.set_xlabel("seconds")
+    ax.set_ylabel(metric)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(out)
+    print(f"Wrote {out}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Overlay solve traces from several runs")
+    parser.add_argument("traces", nargs="+", help="solve_trace.jsonl files")
+    parser.add_argument("--labels", nargs="+", default=None, help="One label per trace (default: file paths)")
+    parser.add_argument("--metric", choices=METRICS, default="objective")
+    parser.add_argument("--source", default=None, help="Only points from this source (e.g. cp_sat, cp_sat_pass_2, greedy)")
+    parser.add_argument("--out", default=None, help="Write a plot here (needs matplotlib)")
+    args = parser.parse_args()
+    labels = args.labels or args.traces
+    if len(labels) != len(args.traces):
+        parser.error("--labels needs one label per trace")
+
+    traces = group_runs(
+        {label: read_trace(path) for label, path in zip(labels, args.traces)}, args.metric, args.source
+    )
+    if args.out:
+        try:
+            plot(traces, args.metric, args.out)
+            return 0
+        except ImportError:
+            print("matplotlib is not installed; printing a table instead.")
+    print_table({label: series(points, args.metric) for label, points in traces.items()}, args.metric)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+Run the benchmark suite and write a JSON report.
+
+    python -m benchmarks.run [--sizes 300 800] [--time 60] [--cold] [--out FILE]
+
+Per instance: wall time of each phase (load, validate, build, hint, solve, export), model
+size, time to first feasible solution, final objective and unassigned requests. The solve is
+one CP-SAT run of build_model's formulation (presolve and teacher pools as configured, no
+decomposition or repair), so differences come from the model and solver, not from post-processing.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional
+
+import ortools
+from ortools.sat.python import cp_model
+
+from benchmarks.instances import DEFAULT_SEED, SIZES, generate_instance, instance_name
+from scheduler.config import get_config
+from scheduler.data import load_students, load_teachers, validate_demand_supply
+from scheduler.export import export_school_schedule, export_student_schedules, schedule_table
+from scheduler.solver.greedy import greedy_hints
+from scheduler.solver.model import build_index, build_model
+from scheduler.solver.pooling import assign_pool_teachers, pool_teachers
+from scheduler.solver.presolve import presolve
+from scheduler.solver.schedule import build_schedule
+from scheduler.solver.util import new_solver
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+INSTANCE_DIR = os.path.join(BENCH_DIR, "instances")
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+DEFAULT_TIME_SECONDS: float = 60.0
+
+
+class _FirstSolution(cp_model.CpSolverSolutionCallback):
+    """Records when the first feasible solution arrives."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.first_seconds: Optional[float] = None
+
+    def on_solution_callback(self) -> None:
+        if self.first_seconds is None:
+            self.first_seconds = self.WallTime()
+
+
+@contextmanager
+def _phase(phases: Dict[str, float], name: str) -> Iterator[None]:
+    started = time.perf_counter()
+    yield
+    phases[name] = round(time.perf_counter() - started, 3)
+
+
+def run_instance(students_count: int, time_limit: float, *, seed: int = DEFAULT_SEED, cold: bool = False) -> Dict[str, Any]:
+    """Generate (or reuse) one instance and run the whole pipeline on it."""
+    cfg = get_config()
+    name = instance_name(students_count, seed)
+    out_dir = os.path.join(INSTANCE_DIR, name)
+    teachers_path, students_path = generate_instance(students_count, out_dir, seed)
+    phases: Dict[str, float] = {}
+
+    with _phase(phases, "load"):
+        teachers = load_teachers(teachers_path)
+        students = load_students(students_path)
+    with _phase(phases, "validate"):
+        validate_demand_supply(students, teachers)
+    with _phase(phases, "hint"):
+        hints = None if cold else greedy_hints(students, teachers)
+    with _phase(phases, "build"):
+        index = build_index(students, teachers)
+        presolved = presolve(index, teachers, cfg) if cfg.solver_presolve else None
+        model, SA, TA, _ = build_model(students, teachers, hints=hints, presolved=presolved)
+    proto = model.Proto()
+
+    solver = new_solver(time_limit, cfg)
+    callback = _FirstSolution()
+    with _phase(phases, "solve"):
+        status = solver.Solve(model, callback)
+    solved = status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+
+    requests = sum(len(cs) for cs in index.student_courses.values())
+    assigned = sum(1 for var in SA.values() if solver.Value(var)) if solved else 0
+    if solved:
+        with _phase(phases, "export"):
+            teacher_pools = pool_teachers(presolved.index if presolved else index, teachers).teacher_pools if cfg.solver_pool_teachers else {}
+            teacher_assignments = assign_pool_teachers((key for key, var in TA.items() if solver.Value(var)), teacher_pools)
+            schedule = build_schedule(
+                students, teachers, [key for key, var in SA.items() if solver.Value(var)], teacher_assignments
+            )
+            table = schedule_table(schedule, students, teachers)
+            export_school_schedule(table, output_path=os.path.join(out_dir, "school_schedule.xlsx"))
+            export_student_schedules(table, students, output_path=os.path.join(out_dir, "student_schedules.xlsx"))
+
+    return {
+        "name": name,
+        "students": len(students),
+        "teachers": len(teachers),
+        "requests": requests,
+        "phases": phases,
+        "model": {"variables": len(proto.variables), "constraints": len(proto.constraints)},
+        "status": solver.StatusName(status),
+        "first_feasible_seconds": round(callback.first_seconds, 3) if callback.first_seconds is not None else None,
+        "objective": solver.ObjectiveValue() if solved else None,
+        "assigned": assigned,
+        "unassigned": requests - assigned,
+    }
+
+
+def run_suite(sizes: List[int], time_limit: float, *, seed: int = DEFAULT_SEED, cold: bool = False) -> Dict[str, Any]:
+    report: Dict[str, Any] = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "ortools": ortools.__version__,
+        "cpus": os.cpu_count(),
+        "time_limit": time_limit,
+        "seed": seed,
+        "cold": cold,
+        "instances": [],
+    }
+    for n in sizes:
+        print(f"Running {instance_name(n, seed)}...")
+        result = run_instance(n, time_limit, seed=seed, cold=cold)
+        phases = ", ".join(f"{k} {v:.2f}s" for k, v in result["phases"].items())
+        first = result["first_feasible_seconds"]
+        print(
+            f"  {result['model']['variables']} vars, {result['status']}, first feasible "
+            f"{'-' if first is None else f'{first:.2f}s'}, unassigned {result['unassigned']}/{result['requests']}; {phases}"
+        )
+        report["instances"].append(result)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the scheduler benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Student counts (default: %(default)s)")
+    parser.add_argument("--time", type=float, default=DEFAULT_TIME_SECONDS, help="CP-SAT time limit per instance (seconds)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Instance generator seed")
+    parser.add_argument("--cold", action="store_true", help="No greedy warm start")
+    parser.add_argument("--out", default=None, help="Report path (default: benchmarks/results/<timestamp>.json)")
+    args = parser.parse_args()
+
+    report = run_suite(args.sizes, args.time, seed=args.seed, cold=args.cold)
+    out = args.out or os.path.join(RESULTS_DIR, time.strftime("%Y%m%d-%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {out}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
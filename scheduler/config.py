@@ -3,8 +3,9 @@ Central, highly customizable configuration for the scheduler.
 Change to adapt to different schools.
 """
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 
 # -----------------------------------------------------------------------------
 # Time structure
@@ -14,6 +15,13 @@ DEFAULT_PERIODS: List[str] = [
     "S2P1", "S2P2", "S2P3", "S2P4",
 ]
 OFF_TIMETABLE_BLOCK: str = "OT"  # for courses that don't need a period (e.g. choir)
+# Names usable in teacher availability cells besides single periods (case-insensitive).
+DEFAULT_PERIOD_GROUPS: Dict[str, List[str]] = {
+    "S1": ["S1P1", "S1P2", "S1P3", "S1P4"],
+    "S2": ["S2P1", "S2P2", "S2P3", "S2P4"],
+    "AM": ["S1P1", "S1P2", "S2P1", "S2P2"],
+    "PM": ["S1P3", "S1P4", "S2P3", "S2P4"],
+}
 
 # -----------------------------------------------------------------------------
 # Class size (all customizable)
@@ -45,7 +53,16 @@ DEFAULT_OFF_TIMETABLE_COURSES: List[str] = [
 # -----------------------------------------------------------------------------
 # Solver
 # -----------------------------------------------------------------------------
-DEFAULT_SOLVER_TIME_SECONDS: float = 120.0
+# Fixed time limit; None = scale with model size (SOLVER_SECONDS_PER_1000_VARS, clamped to min/max).
+DEFAULT_SOLVER_TIME_SECONDS: Optional[float] = None
+SOLVER_SECONDS_PER_1000_VARS: float = 2.5
+SOLVER_MIN_TIME_SECONDS: float = 15.0
+SOLVER_MAX_TIME_SECONDS: float = 900.0
+# Early stopping (None / False = off): no improvement for this many seconds; relative gap to the
+# best bound below this fraction (0.01 = 1%); every modeled request assigned.
+SOLVER_PLATEAU_SECONDS: Optional[float] = None
+SOLVER_RELATIVE_GAP: Optional[float] = None
+SOLVER_STOP_WHEN_ALL_ASSIGNED: bool = False
 # Primary requests: soft goal (not hard). We maximize assignments; no strict "exactly 8" or "at least 6".
 # Desired: as many students as possible get all 8 requested courses; up to N students may get fewer (report only).
 DESIRED_MAX_STUDENTS_UNDER_8: int = 10  # reporting target, not a constraint
@@ -53,10 +70,44 @@ DESIRED_MAX_STUDENTS_UNDER_8: int = 10  # reporting target, not a constraint
 COURSES_PER_STUDENT_TARGET: Optional[int] = None
 # Symmetry breaking (pack sections into earlier periods) can hurt solution quality; set True to enable.
 SOLVER_SYMMETRY_BREAK_PER_COURSE: bool = False
+# "monolithic" (one boolean per student seat), "aggregated" (cohort count variables; much
+# smaller when many students share a request list, e.g. grade 8), "two_stage" or "greedy" (see solve.py).
+DEFAULT_SOLVER_STRATEGY: str = "monolithic"
+# Solve independent course groups (no shared student or teacher) as separate models in a process pool.
+SOLVER_DECOMPOSE_COMPONENTS: bool = True
+# "weighted": maximize assignments * 10000 - size deviation in one solve.
+# "lexicographic": pass 1 maximizes assignments only; pass 2 keeps that count and minimizes
+# size deviation, starting from the pass-1 solution.
+DEFAULT_SOLVER_OBJECTIVE: str = "weighted"
+# Lexicographic mode: share of the time limit pass 1 may use once it has a solution (it may run to
+# the full limit to find its first one, and stops earlier if optimal or on a plateau).
+SOLVER_LEX_FIRST_PASS_FRACTION: float = 0.5
+# Prune impossible sections / teacher periods and add section-count and demand bounds before building.
+SOLVER_PRESOLVE: bool = True
+# Model interchangeable teachers (same courses, load, room and availability) as one pool;
+# named teachers are assigned after solving. Removes symmetry without restricting solutions.
+SOLVER_POOL_TEACHERS: bool = True
+# Warm-start CP-SAT from the greedy constructive schedule (greedy.py) when no other hints are given.
+SOLVER_GREEDY_HINT: bool = True
+# Post-solve local search (repair.py) that seats unassigned requests by moving students between
+# sections; seconds to spend (0 / None = off).
+SOLVER_REPAIR_SECONDS: Optional[float] = 2.0
+# Large-neighbourhood search (--lns): worker processes, each with its own copy of the full model,
+# at most the CPU count.
+SOLVER_LNS_WORKERS: int = 4
 # Parallel search workers (0 = auto).
 SOLVER_NUM_WORKERS: int = 8
+# Anytime mode (--anytime): write improving schedules to <output_dir>/checkpoint at most this often.
+DEFAULT_CHECKPOINT_INTERVAL_SECONDS: float = 30.0
 # All Excel outputs go into this directory (created if missing).
 DEFAULT_OUTPUT_DIR: str = "output"
+# Output formats (export.OUTPUT_FORMATS): "excel" (the two workbooks), "parquet", "csv", "json"
+# (long-form seat table as schedule.<ext>).
+DEFAULT_OUTPUT_FORMATS: List[str] = ["excel"]
+# Result store (store.py): entries unused for this many days are deleted, then least recently
+# used ones until the store fits in RESULT_STORE_MAX_MB (None = no limit).
+RESULT_STORE_MAX_MB: Optional[float] = 256.0
+RESULT_STORE_MAX_AGE_DAYS: Optional[float] = 30.0
 
 # -----------------------------------------------------------------------------
 # Input column names (so different schools can use different Excel headers)
@@ -69,7 +120,12 @@ TEACHER_COLUMNS: Dict[str, str] = {
     "fine_arts_rotation": "Fine Arts Rotation",
     "classes": "Classes",
     "room_capacity": "Room Capcity",  # note typo in original
+    # Optional: periods / period groups the teacher is not in, e.g. "S2" or "PM, S1P1"
+    "unavailable": "Unavailable Periods",
 }
+# Optional sheet in the teacher workbook with the same name columns plus the unavailable column
+# (one or more rows per teacher); combined with the column above.
+TEACHER_AVAILABILITY_SHEET: str = "Unavailable"
 STUDENT_COLUMNS: Dict[str, str] = {
     "name": "Student Name",
     "number": "Student Number",
@@ -126,6 +182,7 @@ DEFAULT_ROTATIONS: List[RotationDef] = [
 class SchedulerConfig:
     """Single config object; override any field to customize."""
     periods: List[str] = field(default_factory=lambda: list(DEFAULT_PERIODS))
+    period_groups: Dict[str, List[str]] = field(default_factory=lambda: dict(DEFAULT_PERIOD_GROUPS))
     off_timetable_block: str = OFF_TIMETABLE_BLOCK
     min_class_size: int = DEFAULT_MIN_CLASS_SIZE
     ideal_class_size: int = DEFAULT_IDEAL_CLASS_SIZE
@@ -133,14 +190,34 @@ class SchedulerConfig:
     global_max_class_size: int = DEFAULT_GLOBAL_MAX_CLASS_SIZE
     max_teacher_sections: int = DEFAULT_MAX_TEACHER_SECTIONS
     off_timetable_courses: List[str] = field(default_factory=lambda: list(DEFAULT_OFF_TIMETABLE_COURSES))
-    solver_time_seconds: float = DEFAULT_SOLVER_TIME_SECONDS
+    solver_time_seconds: Optional[float] = DEFAULT_SOLVER_TIME_SECONDS
+    solver_seconds_per_1000_vars: float = SOLVER_SECONDS_PER_1000_VARS
+    solver_min_time_seconds: float = SOLVER_MIN_TIME_SECONDS
+    solver_max_time_seconds: float = SOLVER_MAX_TIME_SECONDS
+    solver_plateau_seconds: Optional[float] = SOLVER_PLATEAU_SECONDS
+    solver_relative_gap: Optional[float] = SOLVER_RELATIVE_GAP
+    solver_stop_when_all_assigned: bool = SOLVER_STOP_WHEN_ALL_ASSIGNED
     desired_max_students_under_8: int = DESIRED_MAX_STUDENTS_UNDER_8
     teacher_columns: Dict[str, str] = field(default_factory=lambda: dict(TEACHER_COLUMNS))
+    teacher_availability_sheet: str = TEACHER_AVAILABILITY_SHEET
     student_columns: Dict[str, str] = field(default_factory=lambda: dict(STUDENT_COLUMNS))
     rotations: List[RotationDef] = field(default_factory=lambda: list(DEFAULT_ROTATIONS))
     symmetry_break_per_course: bool = SOLVER_SYMMETRY_BREAK_PER_COURSE
     solver_num_workers: int = SOLVER_NUM_WORKERS
+    solver_strategy: str = DEFAULT_SOLVER_STRATEGY
+    solver_decompose: bool = SOLVER_DECOMPOSE_COMPONENTS
+    solver_presolve: bool = SOLVER_PRESOLVE
+    solver_pool_teachers: bool = SOLVER_POOL_TEACHERS
+    solver_greedy_hint: bool = SOLVER_GREEDY_HINT
+    solver_repair_seconds: Optional[float] = SOLVER_REPAIR_SECONDS
+    solver_lns_workers: int = SOLVER_LNS_WORKERS
+    solver_objective: str = DEFAULT_SOLVER_OBJECTIVE
+    solver_lex_first_pass_fraction: float = SOLVER_LEX_FIRST_PASS_FRACTION
+    checkpoint_interval_seconds: float = DEFAULT_CHECKPOINT_INTERVAL_SECONDS
     output_dir: str = DEFAULT_OUTPUT_DIR
+    output_formats: List[str] = field(default_factory=lambda: list(DEFAULT_OUTPUT_FORMATS))
+    result_store_max_mb: Optional[float] = RESULT_STORE_MAX_MB
+    result_store_max_age_days: Optional[float] = RESULT_STORE_MAX_AGE_DAYS
     courses_per_student_target: Optional[int] = COURSES_PER_STUDENT_TARGET
 
     def max_capacity_for_room(self, room_capacity: Optional[int]) -> int:
@@ -162,3 +239,15 @@ def get_config() -> SchedulerConfig:
 def set_config(cfg: SchedulerConfig) -> None:
     global _config
     _config = cfg
+
+
+@contextmanager
+def using_config(cfg: SchedulerConfig) -> Iterator[SchedulerConfig]:
+    """Make cfg the global config inside the block; the previous config is restored on exit."""
+    global _config
+    previous = _config
+    _config = cfg
+    try:
+        yield cfg
+    finally:
+        _config = previous
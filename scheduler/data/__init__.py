@@ -1,3 +1,6 @@
+from typing import Optional
+
+from scheduler.data.cache import load_cached
 from scheduler.data.load import load_teachers, load_students
 from scheduler.data.validate import validate_demand_supply, AlignmentResult
 
@@ -7,14 +10,23 @@ def load_and_validate(
     students_path: str,
     *,
     require_alignment: bool = True,
+    cache_dir: Optional[str] = None,
 ):
     """
     Load teachers and students, then validate demand vs supply.
     Returns (students, teachers, alignment_result).
+    cache_dir: reuse parsed workbooks from this directory while their content and the loader
+    config are unchanged (see cache.py).
     If require_alignment is True and alignment fails, raises ValueError.
     """
-    teachers = load_teachers(teachers_path)
-    students = load_students(students_path)
+    if cache_dir is not None:
+        teachers, students, hits = load_cached(teachers_path, students_path, cache_dir)
+        reused = [kind for kind, hit in hits.items() if hit]
+        if reused:
+            print(f"Reused parsed {' and '.join(reused)} from {cache_dir}.")
+    else:
+        teachers = load_teachers(teachers_path)
+        students = load_students(students_path)
     alignment = validate_demand_supply(students, teachers)
     if require_alignment and not alignment.ok:
         error_msg = "Data alignment failed. Fix input data before solving.\n"
@@ -28,6 +40,7 @@ __all__ = [
     "load_teachers",
     "load_students",
     "load_and_validate",
+    "load_cached",
     "validate_demand_supply",
     "AlignmentResult",
 ]
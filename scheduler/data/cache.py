@@ -0,0 +1,101 @@
+"""
+Parse cache: the normalized teachers / students dicts, pickled under a cache directory and
+keyed by a hash of the workbook's bytes plus the config fields the loader reads, so a changed
+file or column map is re-parsed automatically. Only the latest entry per kind and source path is
+kept: writing a new one deletes the entries it replaces.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Tuple
+
+from scheduler.config import get_config
+from scheduler.data.load import load_students, load_teachers
+
+# Bump when load.py changes what it produces, so old entries are not reused.
+CACHE_VERSION: int = 2
+CACHE_DIRNAME: str = ".cache"
+
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _config_fields(kind: str) -> Dict[str, Any]:
+    """The config fields load_teachers / load_students depend on."""
+    cfg = get_config()
+    if kind == "students":
+        return {"student_columns": cfg.student_columns}
+    return {
+        "teacher_columns": cfg.teacher_columns,
+        "teacher_availability_sheet": cfg.teacher_availability_sheet,
+        "max_teacher_sections": cfg.max_teacher_sections,
+        "rotations": [asdict(rot) for rot in cfg.rotations or []],
+        "periods": cfg.periods,
+        "period_groups": cfg.period_groups,
+    }
+
+
+def cache_key(kind: str, path: str) -> str:
+    payload = json.dumps(
+        {"version": CACHE_VERSION, "kind": kind, "file": file_digest(path), "config": _config_fields(kind)},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def _entry_prefix(kind: str, path: str) -> str:
+    """File name prefix shared by all entries for one source path."""
+    return f"{kind}_{hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:12]}_"
+
+
+def _evict_replaced(cache_dir: str, prefix: str, keep: str) -> None:
+    """Delete the entries with prefix other than keep (earlier versions of the same file)."""
+    for name in os.listdir(cache_dir):
+        if name.startswith(prefix) and name.endswith(".pickle") and name != keep:
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
+
+def _cached(kind: str, path: str, cache_dir: str, load: Callable[[str], Dict]) -> Tuple[Dict, bool]:
+    """(data, hit): load through the cache, writing a new entry on a miss."""
+    prefix = _entry_prefix(kind, path)
+    name = f"{prefix}{cache_key(kind, path)}.pickle"
+    entry = os.path.join(cache_dir, name)
+    try:
+        with open(entry, "rb") as f:
+            return pickle.load(f), True
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    data = load(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f"{entry}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, entry)
+    _evict_replaced(cache_dir, prefix, name)
+    return data, False
+
+
+def load_cached(
+    teachers_path: str,
+    students_path: str,
+    cache_dir: str,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[int, Dict[str, Any]], Dict[str, bool]]:
+    """
+    load_teachers / load_students through the cache in cache_dir.
+    Returns (teachers, students, hits) where hits says which of the two came from the cache.
+    """
+    teachers, teachers_hit = _cached("teachers", teachers_path, cache_dir, load_teachers)
+    students, students_hit = _cached("students", students_path, cache_dir, load_students)
+    return teachers, students, {"teachers": teachers_hit, "students": students_hit}
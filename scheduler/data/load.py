@@ -4,17 +4,45 @@ Data alignment: normalize course names so demand and supply use the same keys.
 """
 
 import re
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
+
+import openpyxl
 import pandas as pd
-from typing import Dict, Any, List, Optional, Set
 
 from scheduler.config import get_config
 
 
+_WHITESPACE = re.compile(r"\s+")
+# Comma, period or newline (some Excel cells use a period by mistake)
+_COURSE_SEPARATORS = re.compile(r"[,.\n]+")
+_PERIOD_SEPARATORS = re.compile(r"[,;\n]+")
+# Known tokens that are not course names (rotation column names, typos)
+_SKIP_TOKENS = frozenset({"fine_arts_rotation", "adst rotation", "fine arts rotation", ""})
+
+
 def _normalize_course_token(s: str) -> str:
-    s = s.strip()
-    # Collapse multiple spaces
-    s = re.sub(r"\s+", " ", s)
-    return s
+    # Strip and collapse multiple spaces
+    return _WHITESPACE.sub(" ", s.strip())
+
+
+def _is_blank(cell: Any) -> bool:
+    return cell is None or (isinstance(cell, float) and cell != cell)  # None or NaN
+
+
+def _text(cell: Any) -> str:
+    return "" if _is_blank(cell) else str(cell).strip()
+
+
+@lru_cache(maxsize=None)
+def _split_courses_text(s: str) -> Tuple[str, ...]:
+    # Many students share the same request text, so parsed cells are cached
+    out = []
+    for p in _COURSE_SEPARATORS.split(s):
+        t = _normalize_course_token(p)
+        if t and t.lower() not in _SKIP_TOKENS:
+            out.append(t)
+    return tuple(out)
 
 
 def split_courses_cell(cell: Any) -> List[str]:
@@ -22,38 +50,93 @@ def split_courses_cell(cell: Any) -> List[str]:
     Split a cell that may contain course names separated by comma, period, or newline.
     Drops empty and known non-course tokens (e.g. 'Fine_Arts_rotation').
     """
-    if cell is None or (isinstance(cell, float) and pd.isna(cell)):
-        return []
-    s = str(cell).strip()
-    if not s:
-        return []
-    # Split on comma, period, or newline (some Excel cells use period by mistake)
-    parts = re.split(r"[,.\n]+", s)
-    # Known tokens that are not course names (rotation column names, typos)
-    skip_tokens = {"fine_arts_rotation", "adst rotation", "fine arts rotation", ""}
-    out = []
-    for p in parts:
-        t = _normalize_course_token(p)
-        if not t or t.lower() in skip_tokens:
-            continue
-        out.append(t)
-    return out
+    return list(_split_courses_text(_text(cell)))
+
+
+@lru_cache(maxsize=None)
+def _split_simple_text(s: str, sep: str) -> Tuple[str, ...]:
+    return tuple(t for t in (_normalize_course_token(c) for c in s.split(sep)) if t)
 
 
 def _split_simple(cell: Any, sep: str = ",") -> List[str]:
     """Simple comma split for columns that don't mix periods (e.g. Preferences)."""
-    if cell is None or (isinstance(cell, float) and pd.isna(cell)):
-        return []
-    s = str(cell).strip()
-    if not s:
-        return []
-    return [_normalize_course_token(c) for c in s.split(sep) if _normalize_course_token(c)]
+    return list(_split_simple_text(_text(cell), sep))
 
 
 def _yes(val: Any) -> bool:
     return isinstance(val, str) and val.strip().lower().startswith("y")
 
 
+def _teacher_key(last: str, first: str) -> str:
+    return f"{last}_{first[0]}" if first else last
+
+
+def parse_periods_cell(cell: Any, periods: List[str], groups: Dict[str, List[str]]) -> Set[str]:
+    """
+    Periods named in a cell: period names or period group names (e.g. "S2", "PM"),
+    separated by comma, semicolon or newline; case-insensitive. Raises ValueError on unknown names.
+    """
+    if _is_blank(cell):
+        return set()
+    by_name = {p.upper(): [p] for p in periods}
+    by_name.update({g.upper(): ps for g, ps in groups.items()})
+    out: Set[str] = set()
+    for token in _PERIOD_SEPARATORS.split(str(cell)):
+        token = token.strip().upper()
+        if not token:
+            continue
+        if token not in by_name:
+            raise ValueError(f"Unknown period {token!r} in teacher availability; use one of {', '.join(by_name)}.")
+        out.update(p for p in by_name[token] if p in periods)
+    return out
+
+
+def read_rows(path: str, columns: Dict[str, str], *, sheet: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Rows of a sheet (default: the first) as {key: cell} for the keys of columns (key -> header).
+    Only those columns are read; keys whose header is not in the sheet are left out, and empty
+    cells are None. .xlsx/.xlsm files are streamed with openpyxl in read-only mode; other formats
+    go through pandas. Yields nothing if the named sheet does not exist.
+    """
+    if not path.lower().endswith((".xlsx", ".xlsm")):
+        with pd.ExcelFile(path) as book:
+            if sheet is not None and sheet not in book.sheet_names:
+                return
+            df = pd.read_excel(book, sheet_name=sheet or 0)
+        present = {key: header for key, header in columns.items() if header in df.columns}
+        for values in zip(*(df[header] for header in present.values())):
+            yield {key: None if _is_blank(v) else v for key, v in zip(present, values)}
+        return
+
+    book = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        if sheet is not None and sheet not in book.sheetnames:
+            return
+        rows = (book[sheet] if sheet is not None else book.worksheets[0]).iter_rows(values_only=True)
+        header = next(rows, None) or ()
+        position = {name: i for i, name in reversed(list(enumerate(header))) if name is not None}
+        wanted = [(key, position[header_name]) for key, header_name in columns.items() if header_name in position]
+        for values in rows:
+            yield {key: values[i] if i < len(values) else None for key, i in wanted}
+    finally:
+        book.close()
+
+
+def _load_unavailable_sheet(path: str, col: Dict[str, str], sheet: str, cfg: Any) -> Dict[str, Set[str]]:
+    """teacher key -> unavailable periods from the optional availability sheet ({} if the column is not mapped)."""
+    out: Dict[str, Set[str]] = {}
+    if not col.get("unavailable"):
+        return out
+    names = {"last_name": col["last_name"], "first_name": col["first_name"], "unavailable": col["unavailable"]}
+    for r in read_rows(path, names, sheet=sheet):
+        last, first = _text(r.get("last_name")), _text(r.get("first_name"))
+        if not last and not first:
+            continue
+        periods = parse_periods_cell(r.get("unavailable"), cfg.periods, cfg.period_groups)
+        out.setdefault(_teacher_key(last, first), set()).update(periods)
+    return out
+
+
 def load_teachers(
     path: str,
     *,
@@ -61,45 +144,49 @@ def load_teachers(
     columns: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Dict[str, Any]]:
     """
-    Load teacher mapping from Excel.
+    Load teacher mapping from Excel (first sheet, configured columns only).
     Uses split_courses_cell for Courses so that "CHORAL MUSIC 12. Fine_Arts_rotation" is parsed correctly.
+    Availability: periods listed in the optional unavailable column and/or availability sheet
+    are marked False in "availability"; the model creates no sections for them.
     """
     cfg = get_config()
     col = columns or cfg.teacher_columns
     default_sections = default_sections if default_sections is not None else cfg.max_teacher_sections
 
-    df = pd.read_excel(path)
     out: Dict[str, Dict[str, Any]] = {}
     periods = cfg.periods
+    unavailable = _load_unavailable_sheet(path, col, cfg.teacher_availability_sheet, cfg)
 
-    for _, r in df.iterrows():
-        last = str(r.get(col["last_name"], "")).strip()
-        first = str(r.get(col["first_name"], "")).strip()
+    for r in read_rows(path, col):
+        last, first = _text(r.get("last_name")), _text(r.get("first_name"))
         if not last and not first:
             continue
-        key = f"{last}_{first[0]}" if first else last
-        courses_raw = r.get(col["courses"], "")
-        can_teach = split_courses_cell(courses_raw)
-        classes_val = r.get(col["classes"], default_sections)
-        max_sections = int(classes_val) if classes_val is not None and not pd.isna(classes_val) else default_sections
-        rc = r.get(col["room_capacity"])
-        room_capacity = None if rc is None or pd.isna(rc) else int(rc)
+        key = _teacher_key(last, first)
+        away = unavailable.pop(key, set())
+        if col.get("unavailable"):
+            away |= parse_periods_cell(r.get("unavailable"), periods, cfg.period_groups)
+        can_teach = split_courses_cell(r.get("courses"))
+        classes_val = r.get("classes")
+        max_sections = int(classes_val) if not _is_blank(classes_val) else default_sections
+        rc = r.get("room_capacity")
+        room_capacity = None if _is_blank(rc) else int(rc)
 
         rotations = {
-            "ADST": _yes(r.get(col["adst_rotation"], "")),
-            "FineArts": _yes(r.get(col["fine_arts_rotation"], "")),
+            "ADST": _yes(r.get("adst_rotation")),
+            "FineArts": _yes(r.get("fine_arts_rotation")),
         }
-        cfg = get_config()
         extra = [rot.display_name for rot in (cfg.rotations or []) if rotations.get(rot.id, False)]
-        can_teach = list(can_teach) + [x for x in extra if x not in can_teach]
+        can_teach = can_teach + [x for x in extra if x not in can_teach]
         out[key] = {
             "name": f"{first} {last}".strip(),
             "can_teach": can_teach,
             "max_sections": max_sections,
             "room_capacity": room_capacity,
             "rotations": rotations,
-            "availability": {p: True for p in periods},
+            "availability": {p: p not in away for p in periods},
         }
+    if unavailable:
+        raise ValueError(f"Availability sheet lists unknown teachers: {', '.join(sorted(unavailable))}.")
     return out
 
 
@@ -108,30 +195,27 @@ def load_students(
     *,
     columns: Optional[Dict[str, str]] = None,
 ) -> Dict[int, Dict[str, Any]]:
-    """Load student course requests from Excel. Uses same course normalization as teachers."""
+    """
+    Load student course requests from Excel (first sheet, configured columns only).
+    Uses same course normalization as teachers. A missing Grade column defaults to grade 9.
+    """
     cfg = get_config()
     col = columns or cfg.student_columns
 
-    df = pd.read_excel(path)
     out: Dict[int, Dict[str, Any]] = {}
-
-    for _, r in df.iterrows():
-        num = r.get(col["number"])
-        if num is None or pd.isna(num):
+    for r in read_rows(path, col):
+        num = r.get("number")
+        if _is_blank(num):
             continue
         number = int(num)
-        name = str(r.get(col["name"], "")).strip()
-        grade = int(r.get(col["grade"], 9))
-        courses_raw = r.get(col["courses"], "")
-        requests = split_courses_cell(courses_raw)
-        prefs_raw = r.get(col["preferences"], "")
-        preferences = _split_simple(prefs_raw)
-
+        grade = r.get("grade", 9)
+        if _is_blank(grade):
+            raise ValueError(f"Student {number} has no grade.")
         out[number] = {
-            "name": name,
-            "grade": grade,
-            "requests": requests,
-            "preferences": preferences,
+            "name": _text(r.get("name")),
+            "grade": int(grade),
+            "requests": split_courses_cell(r.get("courses")),
+            "preferences": _split_simple(r.get("preferences")),
         }
     return out
 
@@ -106,11 +106,16 @@ def _qualified_teachers(teachers: Dict[str, Dict[str, Any]], course: str) -> Lis
 
 
 def _supply_for_course(teachers: Dict[str, Dict[str, Any]], course: str) -> int:
-    """Total section-slots that can be assigned to this course (sum of max_sections of qualified teachers)."""
+    """
+    Total section-slots that can be assigned to this course: sum over qualified teachers of
+    max_sections, capped by the number of periods the teacher is available.
+    """
     total = 0
     for tid, t in teachers.items():
         if course in (t.get("can_teach") or []):
-            total += t.get("max_sections", 7)
+            available = t.get("availability")
+            slots = t.get("max_sections", 7)
+            total += min(slots, sum(available.values())) if available else slots
     return total
 
 
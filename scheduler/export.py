@@ -1,95 +1,195 @@
 """
 Export schedule: school schedule (teacher/room/students) and student schedules.
+Every output is written from one long-form seat table (schedule_table): one row per student
+per section. The two workbooks are written row by row with openpyxl's write-only mode;
+the columnar outputs are Parquet, CSV and JSON.
 """
 
-from typing import Dict, Any, List, Optional
+import importlib.util
+import json
+import os
+from typing import Dict, Any, Iterable, List, Optional
+
 import pandas as pd
+from openpyxl import Workbook
 
 from scheduler.config import get_config
 
+# "excel": school_schedule.xlsx + student_schedules.xlsx; the others write schedule.<ext>.
+OUTPUT_FORMATS = ("excel", "parquet", "csv", "json")
+TABLE_COLUMNS = ["student_id", "student_name", "grade", "period", "course", "section_id", "teacher_id", "teacher_name"]
+
+
+def _write_rows(output_path: str, header: List[str], rows: Iterable[List[Any]]) -> None:
+    """One-sheet workbook streamed to disk (same layout pandas.to_excel(index=False) produced)."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(header)
+    for row in rows:
+        ws.append(row)
+    wb.save(output_path)
+
 
 def export_school_schedule(
-    schedule: Dict[str, Dict[str, Dict[str, Any]]],
-    teachers: Dict[str, Dict[str, Any]],
+    table: pd.DataFrame,
     output_path: str = "school_schedule.xlsx",
-    *,
-    periods: Optional[List[str]] = None,
 ) -> None:
     """
-    Write school schedule to Excel: Period, Course, Teacher, Room, Students.
-    Room is derived from teacher (using teacher name as room identifier).
+    Write school schedule to Excel from the seat table: Period, Course, Teacher, Room, Students,
+    Class Size, one row per section with students. Room is the teacher's name ("TBD" if none).
     """
-    cfg = get_config()
-    periods = periods or cfg.periods
+    sections: Dict[str, List[Any]] = {}
+    for sec, period, course, teacher, name in zip(
+        table["section_id"], table["period"], table["course"], table["teacher_name"], table["student_name"]
+    ):
+        if sec not in sections:
+            teacher = "TBD" if pd.isna(teacher) else teacher
+            sections[sec] = [period, course, teacher, teacher, []]
+        sections[sec][4].append(name)
+    rows = [[*row[:4], ", ".join(row[4]), len(row[4])] for row in sections.values()]
 
-    rows = []
-    for p in periods:
-        for course, data in (schedule.get(p) or {}).items():
-            teacher_names = data.get("teachers") or []
-            teacher_ids = data.get("teacher_ids") or []
-            students = data.get("students") or []
-            
-            # Use first teacher's name as room identifier (or "TBD" if no teacher)
-            room = teacher_names[0] if teacher_names else "TBD"
-            teacher = ", ".join(teacher_names) if teacher_names else "TBD"
-            
-            rows.append({
-                "Period": p,
-                "Course": course,
-                "Teacher": teacher,
-                "Room": room,
-                "Students": ", ".join(students),
-                "Class Size": len(students),
-            })
-    
     if rows:
-        pd.DataFrame(rows).to_excel(output_path, index=False)
+        _write_rows(output_path, ["Period", "Course", "Teacher", "Room", "Students", "Class Size"], rows)
         print(f"Wrote {output_path} ({len(rows)} sections)")
     else:
         print(f"No sections; {output_path} not written.")
 
 
 def export_student_schedules(
-    schedule: Dict[str, Dict[str, Dict[str, Any]]],
+    table: pd.DataFrame,
     students: Dict[int, Dict[str, Any]],
     output_path: str = "student_schedules.xlsx",
     *,
     periods: Optional[List[str]] = None,
 ) -> None:
     """
-    Write all student schedules to Excel: Student Name, Student Number, Grade, then one column per period with their course.
+    Write all student schedules to Excel from the seat table: Student Name, Student Number, Grade,
+    then one column per period with their course. Students without seats get empty periods.
     """
     cfg = get_config()
     periods = periods or cfg.periods
 
-    # Build student -> period -> course mapping
-    student_courses: Dict[int, Dict[str, str]] = {}
-    for sid in students:
-        student_courses[sid] = {p: "" for p in periods}
-
-    for period, courses in schedule.items():
-        for course, data in courses.items():
-            for student_name in (data.get("students") or []):
-                # Find student ID by name
-                sid = next((k for k, v in students.items() if v["name"] == student_name), None)
-                if sid is not None:
-                    student_courses[sid][period] = course
-
-    # Build rows
-    rows = []
-    for sid in sorted(students.keys()):
-        sdata = students[sid]
-        row = {
-            "Student Name": sdata["name"],
-            "Student Number": sid,
-            "Grade": sdata.get("grade", ""),
-        }
-        for p in periods:
-            row[p] = student_courses[sid].get(p, "")
-        rows.append(row)
+    student_courses: Dict[int, Dict[str, str]] = {sid: {} for sid in students}
+    for sid, period, course in zip(table["student_id"], table["period"], table["course"]):
+        student_courses[sid][period] = course
 
-    if rows:
-        pd.DataFrame(rows).to_excel(output_path, index=False)
-        print(f"Wrote {output_path} ({len(rows)} students)")
+    rows = (
+        [students[sid]["name"], sid, students[sid].get("grade", "")] + [student_courses[sid].get(p, "") for p in periods]
+        for sid in sorted(students)
+    )
+
+    if students:
+        _write_rows(output_path, ["Student Name", "Student Number", "Grade", *periods], rows)
+        print(f"Wrote {output_path} ({len(students)} students)")
     else:
         print(f"No students; {output_path} not written.")
+
+
+def check_output_formats(formats: Iterable[str]) -> None:
+    """Raise ValueError for unknown formats, or for Parquet without a Parquet engine installed."""
+    unknown = [f for f in formats if f not in OUTPUT_FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown output format(s) {', '.join(unknown)}; expected one of {', '.join(OUTPUT_FORMATS)}.")
+    if "parquet" in formats and not any(importlib.util.find_spec(m) for m in ("pyarrow", "fastparquet")):
+        raise ValueError("Parquet output needs pyarrow or fastparquet (pip install pyarrow).")
+
+
+def section_id(period: str, course: str) -> str:
+    """Stable id of a section: there is at most one section of a course per period."""
+    return f"{period}:{course}"
+
+
+def schedule_table(
+    schedule: Dict[str, Dict[str, Dict[str, Any]]],
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    *,
+    periods: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Long-form seat table with TABLE_COLUMNS, one row per (student, section), in period order.
+    Students are matched by "student_ids" if present, else by name (first match); the section's
+    teacher is its first teacher.
+    """
+    cfg = get_config()
+    periods = periods or cfg.periods
+    sid_by_name: Dict[str, int] = {}
+    for sid, s in students.items():
+        sid_by_name.setdefault(s["name"], sid)
+
+    columns: Dict[str, List[Any]] = {name: [] for name in TABLE_COLUMNS}
+    for p in periods:
+        for course, data in (schedule.get(p) or {}).items():
+            tids = data.get("teacher_ids") or []
+            tid = tids[0] if tids else None
+            teacher_names = data.get("teachers") or []
+            teacher_name = teachers[tid]["name"] if tid in teachers else (teacher_names[0] if teacher_names else None)
+            sids = data.get("student_ids") or [sid_by_name.get(name) for name in data.get("students") or []]
+            for sid in sids:
+                if sid not in students:
+                    continue
+                columns["student_id"].append(sid)
+                columns["student_name"].append(students[sid]["name"])
+                columns["grade"].append(students[sid].get("grade"))
+                columns["period"].append(p)
+                columns["course"].append(course)
+                columns["section_id"].append(section_id(p, course))
+                columns["teacher_id"].append(tid)
+                columns["teacher_name"].append(teacher_name)
+    return pd.DataFrame(columns, columns=TABLE_COLUMNS)
+
+
+def _table_document(table: pd.DataFrame, periods: List[str]) -> Dict[str, Any]:
+    """JSON form of the seat table: sections with their student ids, students with their sections."""
+    sections = [
+        {
+            "section_id": sec,
+            "period": rows["period"].iat[0],
+            "course": rows["course"].iat[0],
+            "teacher_id": rows["teacher_id"].iat[0],
+            "teacher_name": rows["teacher_name"].iat[0],
+            "student_ids": [int(sid) for sid in rows["student_id"]],
+        }
+        for sec, rows in table.groupby("section_id", sort=False)
+    ]
+    student_list = [
+        {
+            "student_id": int(sid),
+            "student_name": rows["student_name"].iat[0],
+            "grade": None if pd.isna(rows["grade"].iat[0]) else int(rows["grade"].iat[0]),
+            "sections": list(rows["section_id"]),
+        }
+        for sid, rows in table.groupby("student_id", sort=True)
+    ]
+    return {"periods": list(periods), "sections": sections, "students": student_list}
+
+
+def export_table(
+    table: pd.DataFrame,
+    output_dir: str,
+    formats: Iterable[str],
+    *,
+    periods: Optional[List[str]] = None,
+) -> List[str]:
+    """
+    Write the seat table as schedule.parquet / schedule.csv / schedule.json into output_dir for
+    each of formats ("excel" is ignored here). Returns the paths written.
+    """
+    periods = periods or get_config().periods
+    written = []
+    for fmt in formats:
+        if fmt == "excel":
+            continue
+        path = os.path.join(output_dir, f"schedule.{fmt}")
+        if fmt == "parquet":
+            table.to_parquet(path, index=False)
+        elif fmt == "csv":
+            table.to_csv(path, index=False)
+        elif fmt == "json":
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(_table_document(table, periods), f)
+        else:
+            raise ValueError(f"Unknown output format {fmt!r}; expected one of {', '.join(OUTPUT_FORMATS)}.")
+        print(f"Wrote {path} ({len(table)} seats)")
+        written.append(path)
+    return written
@@ -0,0 +1,165 @@
+"""
+Run instrumentation: wall/CPU time and memory per phase, model sizes and CP-SAT response stats,
+collected into one RunReport (written as run_report.json by Main.py).
+Library code records through the module-level phase / record_model / record_solve helpers,
+which do nothing unless a report was started with start_report.
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Any, Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from ortools.sat.python import cp_model
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far (None where unsupported)."""
+    if resource is None:
+        return None
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)  # KiB on Linux
+
+
+@dataclass
+class PhaseStats:
+    """One timed phase; depth > 0 for phases nested inside another."""
+    name: str
+    depth: int
+    seconds: float
+    cpu_seconds: float
+    peak_rss_mb: Optional[float]
+    python_peak_mb: Optional[float] = None  # tracemalloc peak during the phase (profile mode only)
+
+
+@dataclass
+class RunReport:
+    """Everything recorded during one run."""
+    trace_memory: bool = False
+    phases: List[PhaseStats] = field(default_factory=list)
+    models: List[Dict[str, Any]] = field(default_factory=list)
+    solves: List[Dict[str, Any]] = field(default_factory=list)
+    info: Dict[str, Any] = field(default_factory=dict)
+    _stack: List[float] = field(default_factory=list, repr=False)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        # Appended on entry so phases stay in start order (a phase before the ones nested in it)
+        stats = PhaseStats(name=name, depth=len(self._stack), seconds=0.0, cpu_seconds=0.0, peak_rss_mb=None)
+        self.phases.append(stats)
+        if self.trace_memory:
+            if self._stack:
+                self._stack[-1] = max(self._stack[-1], tracemalloc.get_traced_memory()[1] / 2**20)
+            tracemalloc.reset_peak()
+        self._stack.append(0.0)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            stats.seconds = round(time.perf_counter() - wall, 3)
+            stats.cpu_seconds = round(time.process_time() - cpu, 3)
+            stats.peak_rss_mb = _peak_rss_mb()
+            child_peak = self._stack.pop()
+            if self.trace_memory:
+                # reset_peak in nested phases hides their peaks from this one, so carry them up
+                peak = max(tracemalloc.get_traced_memory()[1] / 2**20, child_peak)
+                stats.python_peak_mb = round(peak, 1)
+                if self._stack:
+                    self._stack[-1] = max(self._stack[-1], peak)
+
+    def record_model(self, label: str, model: cp_model.CpModel) -> None:
+        proto = model.Proto()
+        self.models.append(
+            {
+                "label": label,
+                "variables": len(proto.variables),
+                "constraints": len(proto.constraints),
+                "hinted": len(proto.solution_hint.vars),
+            }
+        )
+
+    def record_solve(self, label: str, solver: cp_model.CpSolver, status: int) -> None:
+        solved = status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+        self.solves.append(
+            {
+                "label": label,
+                "status": solver.StatusName(status),
+                "objective": solver.ObjectiveValue() if solved else None,
+                "best_bound": solver.BestObjectiveBound() if solved else None,
+                "wall_seconds": round(solver.WallTime(), 3),
+                "user_seconds": round(solver.UserTime(), 3),
+                "conflicts": solver.NumConflicts(),
+                "branches": solver.NumBranches(),
+                "response_stats": solver.ResponseStats(),
+            }
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "info": self.info,
+            "phases": [asdict(p) for p in self.phases],
+            "models": self.models,
+            "solves": self.solves,
+            "peak_rss_mb": _peak_rss_mb(),
+        }
+
+    def write(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+
+    def summary(self) -> str:
+        """Phase table (nested phases indented) plus one line per model build and solve."""
+        lines = [f"{'Phase':<32}{'Wall s':>9}{'CPU s':>9}{'RSS MB':>9}{'Py MB':>8}"]
+        for p in self.phases:
+            rss = "-" if p.peak_rss_mb is None else f"{p.peak_rss_mb:.0f}"
+            py = "-" if p.python_peak_mb is None else f"{p.python_peak_mb:.0f}"
+            lines.append(f"{'  ' * p.depth + p.name:<32}{p.seconds:>9.2f}{p.cpu_seconds:>9.2f}{rss:>9}{py:>8}")
+        for m in self.models:
+            lines.append(f"Model {m['label']}: {m['variables']} variables, {m['constraints']} constraints, {m['hinted']} hinted.")
+        for s in self.solves:
+            lines.append(
+                f"Solve {s['label']}: {s['status']}, objective {s['objective']}, bound {s['best_bound']}, "
+                f"{s['wall_seconds']:.1f}s, {s['conflicts']} conflicts."
+            )
+        return "\n".join(lines)
+
+
+_REPORT: Optional[RunReport] = None
+
+
+def start_report(*, trace_memory: bool = False) -> RunReport:
+    """Start collecting; trace_memory also tracks Python allocation peaks (tracemalloc, slower)."""
+    global _REPORT
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _REPORT = RunReport(trace_memory=trace_memory)
+    return _REPORT
+
+
+def get_report() -> Optional[RunReport]:
+    return _REPORT
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    if _REPORT is None:
+        yield
+        return
+    with _REPORT.phase(name):
+        yield
+
+
+def record_model(label: str, model: cp_model.CpModel) -> None:
+    if _REPORT is not None:
+        _REPORT.record_model(label, model)
+
+
+def record_solve(label: str, solver: cp_model.CpSolver, status: int) -> None:
+    if _REPORT is not None:
+        _REPORT.record_solve(label, solver, status)
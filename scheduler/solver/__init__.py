@@ -1,4 +1,35 @@
-from scheduler.solver.model import build_model
-from scheduler.solver.solve import solve
+from scheduler.solver.model import build_model, build_cohort_model, build_index
+from scheduler.solver.schedule import build_schedule
+from scheduler.solver.hints import Hints, hints_from_schedule, load_hints
+from scheduler.solver.sectioning import Section, assign_students, sections_from_schedule, schedule_from_sections
+from scheduler.solver.solve import SolveResult, solve, solve_with_trace, STRATEGIES, OBJECTIVES
+from scheduler.solver.incremental import IncrementalResult, resolve_incremental
+from scheduler.solver.placement import Placement, PlacementIndex
+from scheduler.solver.artifact import SavedModel, load_model, save_model, solve_saved
 
-__all__ = ["build_model", "solve"]
+__all__ = [
+    "build_model",
+    "build_cohort_model",
+    "build_index",
+    "build_schedule",
+    "Hints",
+    "hints_from_schedule",
+    "load_hints",
+    "Section",
+    "assign_students",
+    "sections_from_schedule",
+    "schedule_from_sections",
+    "solve",
+    "solve_with_trace",
+    "SolveResult",
+    "STRATEGIES",
+    "OBJECTIVES",
+    "IncrementalResult",
+    "resolve_incremental",
+    "Placement",
+    "PlacementIndex",
+    "SavedModel",
+    "save_model",
+    "load_model",
+    "solve_saved",
+]
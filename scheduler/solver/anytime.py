@@ -0,0 +1,238 @@
+"""
+Anytime solving: checkpoint every improving solution to disk (rate-limited), record the
+objective/bound convergence trace, stop early on a plateau or once every request is assigned,
+and stop cleanly on Ctrl-C / SIGTERM so the best schedule found so far can still be exported.
+"""
+
+import json
+import os
+import signal
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Any, Iterable, Optional
+
+from ortools.sat.python import cp_model
+
+from scheduler.export import export_school_schedule, export_student_schedules, schedule_table
+
+Schedule = Dict[str, Dict[str, Dict[str, Any]]]
+
+# SolutionCallback.stop_reason after Ctrl-C / SIGTERM
+INTERRUPTED = "interrupted"
+
+
+@dataclass
+class TracePoint:
+    """
+    One step of a solve: an improving CP-SAT solution (source "cp_sat" / "cp_sat_pass_2") or a
+    non-CP-SAT step ("greedy", "repair"). seconds are since solve() started; component is set
+    when independent components were solved separately.
+    """
+    seconds: float
+    source: str
+    objective: Optional[float] = None
+    best_bound: Optional[float] = None
+    assigned: Optional[int] = None
+    open_sections: Optional[int] = None
+    component: Optional[int] = None
+
+
+class SolveTrace:
+    """TracePoints in arrival order; each is also appended to path (JSON lines) when set."""
+
+    def __init__(self, path: Optional[str] = None, start: Optional[float] = None, component: Optional[int] = None) -> None:
+        self.path = path
+        self.start = start if start is not None else time.time()
+        self.component = component
+        self.points: List[TracePoint] = []
+
+    def add(self, source: str, **values: Any) -> TracePoint:
+        point = TracePoint(seconds=round(time.time() - self.start, 3), source=source, component=self.component, **values)
+        self.points.append(point)
+        if self.path is not None:
+            # One short append per line, so parallel component processes can share the file
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(point)) + "\n")
+        return point
+
+    def merge(self, points: Iterable[TracePoint]) -> None:
+        """Add points recorded elsewhere (already written to path), keeping time order."""
+        self.points = sorted([*self.points, *points], key=lambda pt: pt.seconds)
+
+
+def read_trace(path: str) -> List[TracePoint]:
+    """TracePoints from a solve_trace.jsonl file."""
+    with open(path, encoding="utf-8") as f:
+        return [TracePoint(**json.loads(line)) for line in f if line.strip()]
+
+
+def write_checkpoint(
+    schedule: Schedule,
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    directory: str,
+    *,
+    objective: float,
+    elapsed: float,
+) -> None:
+    """Write schedule.json (atomically) plus the two Excel exports into directory."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, "schedule.json")
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"objective": objective, "elapsed_seconds": round(elapsed, 3), "schedule": schedule}, f)
+    os.replace(tmp, path)
+    table = schedule_table(schedule, students, teachers)
+    export_school_schedule(table, output_path=os.path.join(directory, "school_schedule.xlsx"))
+    export_student_schedules(table, students, output_path=os.path.join(directory, "student_schedules.xlsx"))
+
+
+class SolutionCallback(cp_model.CpSolverSolutionCallback):
+    """
+    Called by CP-SAT on every improving solution. Records time to first solution and, when
+    checkpoint_dir is set, writes the schedule at most once per interval seconds.
+    to_schedule turns a variable -> value function into the schedule dict.
+    Stopping: plateau_seconds without an objective improvement (checked by solve_interruptible),
+    or assigned(value) reaching all_assigned_target, or soft_limit_seconds passed once a solution
+exists (searches until the first solution, then stops). stop_reason records which one fired.
+    When assigned is given, best_assigned / best_assigned_seconds record the best assignment
+    count and when it was first reached.
+    trace: every solution is added as a TracePoint (source trace_source); open_sections(value)
+    counts open sections for it.
+    """
+
+    def __init__(
+        self,
+        to_schedule: Callable[[Callable[[Any], int]], Schedule],
+        students: Dict[int, Dict[str, Any]],
+        teachers: Dict[str, Dict[str, Any]],
+        *,
+        checkpoint_dir: Optional[str] = None,
+        interval: float = 30.0,
+        plateau_seconds: Optional[float] = None,
+        assigned: Optional[Callable[[Callable[[Any], int]], int]] = None,
+        all_assigned_target: Optional[int] = None,
+        trace: Optional[SolveTrace] = None,
+        trace_source: str = "cp_sat",
+        open_sections: Optional[Callable[[Callable[[Any], int]], int]] = None,
+        soft_limit_seconds: Optional[float] = None,
+    ) -> None:
+        super().__init__()
+        self.to_schedule = to_schedule
+        self.students = students
+        self.teachers = teachers
+        self.checkpoint_dir = checkpoint_dir
+        self.interval = interval
+        self.plateau_seconds = plateau_seconds
+        self.assigned = assigned
+        self.all_assigned_target = all_assigned_target
+        self.trace = trace
+        self.trace_source = trace_source
+        self.open_sections = open_sections
+        self.soft_limit_seconds = soft_limit_seconds
+        self.start = time.time()
+        self.first_solution_seconds: Optional[float] = None
+        self.solutions = 0
+        self.checkpoints = 0
+        self.stop_reason: Optional[str] = None
+        self.best_assigned: Optional[int] = None
+        self.best_assigned_seconds: Optional[float] = None
+        self._last_write: Optional[float] = None
+        self._best: Optional[float] = None
+        self._last_improvement: Optional[float] = None
+
+    def plateau_reached(self) -> bool:
+        if self.plateau_seconds is None or self._last_improvement is None:
+            return False
+        return time.time() - self.start - self._last_improvement >= self.plateau_seconds
+
+    def soft_limit_reached(self) -> bool:
+        if self.soft_limit_seconds is None or self.first_solution_seconds is None:
+            return False
+        return time.time() - self.start >= self.soft_limit_seconds
+
+    def on_solution_callback(self) -> None:
+        elapsed = time.time() - self.start
+        self.solutions += 1
+        if self.first_solution_seconds is None:
+            self.first_solution_seconds = elapsed
+        # CP-SAT only reports improving solutions, so any change is an improvement (either direction)
+        objective = self.ObjectiveValue()
+        if self._best is None or objective != self._best:
+            self._best, self._last_improvement = objective, elapsed
+        assigned = None
+        if self.assigned is not None:
+            assigned = self.assigned(self.Value)
+            if self.best_assigned is None or assigned > self.best_assigned:
+                self.best_assigned, self.best_assigned_seconds = assigned, elapsed
+            if self.all_assigned_target is not None and assigned >= self.all_assigned_target:
+                self.stop_reason = "all requests assigned"
+                self.StopSearch()
+        if self.stop_reason is None and self.soft_limit_reached():
+            self.stop_reason = f"soft limit of {self.soft_limit_seconds:.1f}s reached"
+            self.StopSearch()
+        if self.trace is not None:
+            self.trace.add(
+                self.trace_source,
+                objective=objective,
+                best_bound=self.BestObjectiveBound(),
+                assigned=assigned,
+                open_sections=self.open_sections(self.Value) if self.open_sections is not None else None,
+            )
+        if self.checkpoint_dir is None:
+            return
+        if self._last_write is not None and elapsed - self._last_write < self.interval:
+            return
+        schedule = self.to_schedule(self.Value)
+        write_checkpoint(
+            schedule, self.students, self.teachers, self.checkpoint_dir,
+            objective=self.ObjectiveValue(), elapsed=elapsed,
+        )
+        self.checkpoints += 1
+        self._last_write = time.time() - self.start
+        print(f"Checkpoint {self.checkpoints} at {elapsed:.1f}s (objective {self.ObjectiveValue():.0f}) -> {self.checkpoint_dir}")
+
+
+def solve_interruptible(
+    solver: cp_model.CpSolver,
+    model: cp_model.CpModel,
+    callback: Optional[SolutionCallback] = None,
+) -> int:
+    """
+    solver.Solve in a worker thread so SIGINT/SIGTERM reach Python; either signal stops the
+    search and Solve returns the best solution found so far (status FEASIBLE). The waiting
+    thread also stops the search once callback.plateau_reached() or callback.soft_limit_reached().
+    Signal handlers are only installed on the main thread (they can't be set elsewhere).
+    """
+    result: Dict[str, int] = {}
+
+    def run() -> None:
+        result["status"] = solver.Solve(model, callback)
+
+    def stop(signum: int, frame: Any) -> None:
+        print(f"\nReceived {signal.Signals(signum).name}; stopping search and keeping the best schedule so far...")
+        if callback is not None:
+            callback.stop_reason = INTERRUPTED
+        solver.StopSearch()
+
+    previous = {}
+    if threading.current_thread() is threading.main_thread():
+        # CP-SAT's own SIGINT hook would fire alongside ours; leave signal handling to Python.
+        solver.parameters.catch_sigint_signal = False
+        previous = {sig: signal.signal(sig, stop) for sig in (signal.SIGINT, signal.SIGTERM)}
+    try:
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        while worker.is_alive():
+            worker.join(0.2)
+            if callback is not None and callback.stop_reason is None and callback.plateau_reached():
+                callback.stop_reason = f"no improvement for {callback.plateau_seconds:g}s"
+                solver.StopSearch()
+            if callback is not None and callback.stop_reason is None and callback.soft_limit_reached():
+                callback.stop_reason = f"soft limit of {callback.soft_limit_seconds:.1f}s reached"
+                solver.StopSearch()
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+    return result["status"]
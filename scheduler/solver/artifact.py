@@ -0,0 +1,156 @@
+"""
+Model artifacts: a built CP-SAT model saved as model.pb (binary CpModelProto, hints included)
+plus index.json, which maps variable indices back to SA (sid, course, period), TA (tid, course,
+period) and size (course, period) keys and records names, teacher pools and the solver
+parameters of the run. Build once, then solve many times with other seeds or parameters, in
+other processes or on other machines, or reproduce a long solve from the artifact alone
+(command line: scheduler.solver.artifact_cli).
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
+
+from google.protobuf import text_format
+from ortools.sat import sat_parameters_pb2
+from ortools.sat.python import cp_model
+
+from scheduler.solver.pooling import assign_pool_teachers
+from scheduler.solver.schedule import build_schedule
+
+MODEL_FILE = "model.pb"
+INDEX_FILE = "index.json"
+ARTIFACT_VERSION = 1
+
+Schedule = Dict[str, Dict[str, Dict[str, Any]]]
+
+
+@dataclass
+class SavedModel:
+    """A loaded artifact; the variable maps have the same keys build_model returned."""
+    model: cp_model.CpModel
+    SA: Dict[Tuple, cp_model.IntVar]
+    TA: Dict[Tuple, cp_model.IntVar]
+    size_vars: Dict[Tuple, cp_model.IntVar]
+    teacher_pools: Dict[str, List[str]] = field(default_factory=dict)
+    student_names: Dict[int, str] = field(default_factory=dict)
+    teacher_names: Dict[str, str] = field(default_factory=dict)
+    periods: List[str] = field(default_factory=list)
+    parameters: str = ""  # CpSolver parameters of the saving run (text format)
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+
+def _encode(table: Dict[Tuple, Any], strings: Dict[str, int]) -> Dict[str, Any]:
+    """Columnar key table: variable indices plus one column per key position (strings interned)."""
+    keys = list(table)
+    columns = []
+    for j in range(len(keys[0]) if keys else 0):
+        values = [key[j] for key in keys]
+        if all(isinstance(v, str) for v in values):
+            columns.append({"strings": [strings.setdefault(v, len(strings)) for v in values]})
+        else:
+            columns.append({"values": values})
+    return {"vars": [table[key].Index() for key in keys], "columns": columns}
+
+
+def _decode(encoded: Dict[str, Any], strings: List[str], model: cp_model.CpModel) -> Dict[Tuple, cp_model.IntVar]:
+    columns = [[strings[i] for i in col["strings"]] if "strings" in col else col["values"] for col in encoded["columns"]]
+    return {
+        tuple(key): model.GetIntVarFromProtoIndex(index)
+        for index, key in zip(encoded["vars"], zip(*columns))
+    }
+
+
+def save_model(
+    path: str,
+    model: cp_model.CpModel,
+    SA: Dict[Tuple, Any],
+    TA: Dict[Tuple, Any],
+    size_vars: Dict[Tuple, Any],
+    *,
+    students: Optional[Dict[int, Dict[str, Any]]] = None,
+    teachers: Optional[Dict[str, Dict[str, Any]]] = None,
+    teacher_pools: Optional[Dict[str, List[str]]] = None,
+    periods: Optional[List[str]] = None,
+    parameters: Optional[sat_parameters_pb2.SatParameters] = None,
+    meta: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Write model.pb and index.json into the directory path (created if missing)."""
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, MODEL_FILE), "wb") as f:
+        f.write(model.Proto().SerializeToString())
+    strings: Dict[str, int] = {}
+    index = {
+        "version": ARTIFACT_VERSION,
+        "SA": _encode(SA, strings),
+        "TA": _encode(TA, strings),
+        "size_vars": _encode(size_vars, strings),
+        "teacher_pools": teacher_pools or {},
+        "students": [[sid, s["name"]] for sid, s in (students or {}).items()],
+        "teachers": [[tid, t["name"]] for tid, t in (teachers or {}).items()],
+        "periods": list(periods or []),
+        "parameters": text_format.MessageToString(parameters) if parameters is not None else "",
+        "meta": meta or {},
+    }
+    index["strings"] = sorted(strings, key=strings.get)
+    with open(os.path.join(path, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+
+
+def load_model(path: str) -> SavedModel:
+    """Read an artifact written by save_model. Raises ValueError for an unknown artifact version."""
+    with open(os.path.join(path, INDEX_FILE), encoding="utf-8") as f:
+        index = json.load(f)
+    if index.get("version") != ARTIFACT_VERSION:
+        raise ValueError(f"Unsupported model artifact version {index.get('version')!r} in {path}.")
+    model = cp_model.CpModel()
+    with open(os.path.join(path, MODEL_FILE), "rb") as f:
+        model.Proto().ParseFromString(f.read())
+    strings = index["strings"]
+    return SavedModel(
+        model=model,
+        SA=_decode(index["SA"], strings, model),
+        TA=_decode(index["TA"], strings, model),
+        size_vars=_decode(index["size_vars"], strings, model),
+        teacher_pools=index["teacher_pools"],
+        student_names={sid: name for sid, name in index["students"]},
+        teacher_names={tid: name for tid, name in index["teachers"]},
+        periods=index["periods"],
+        parameters=index["parameters"],
+        meta=index["meta"],
+    )
+
+
+def solve_saved(
+    saved: SavedModel,
+    *,
+    time_limit: Optional[float] = None,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> Tuple[cp_model.CpSolver, int, Optional[Schedule]]:
+    """
+    Solve a loaded artifact with the saving run's parameters, optionally overriding time limit,
+    random seed and worker count. Returns (solver, status, schedule or None).
+    """
+    solver = cp_model.CpSolver()
+    if saved.parameters:
+        text_format.Parse(saved.parameters, solver.parameters)
+    if time_limit is not None:
+        solver.parameters.max_time_in_seconds = time_limit
+    if seed is not None:
+        solver.parameters.random_seed = seed
+    if workers is not None:
+        solver.parameters.num_search_workers = workers
+    status = solver.Solve(saved.model)
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return solver, status, None
+    students = {sid: {"name": name} for sid, name in saved.student_names.items()}
+    teachers = {tid: {"name": name} for tid, name in saved.teacher_names.items()}
+    teacher_assignments = assign_pool_teachers(
+        (key for key, var in saved.TA.items() if solver.Value(var)), saved.teacher_pools
+    )
+    student_assignments = sorted(key for key, var in saved.SA.items() if solver.Value(var))
+    schedule = build_schedule(students, teachers, student_assignments, teacher_assignments, periods=saved.periods or None)
+    return solver, status, schedule
+
@@ -0,0 +1,37 @@
+"""
+Solve a saved model artifact (scheduler.solver.artifact) from the command line.
+
+    python -m scheduler.solver.artifact_cli DIR [--time 60] [--seed 1] [--workers 8] [--out schedule.json]
+"""
+
+import argparse
+import json
+import sys
+
+from scheduler.solver.artifact import load_model, solve_saved
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Solve a saved model artifact")
+    parser.add_argument("path", help="Artifact directory (from Main.py --save-model / save_model)")
+    parser.add_argument("--time", type=float, default=None, help="Time limit (default: the saving run's)")
+    parser.add_argument("--seed", type=int, default=None, help="CP-SAT random seed")
+    parser.add_argument("--workers", type=int, default=None, help="CP-SAT search workers")
+    parser.add_argument("--out", default=None, help="Write the schedule here as JSON")
+    args = parser.parse_args()
+
+    saved = load_model(args.path)
+    print(f"Loaded {len(saved.model.Proto().variables)} variables, {len(saved.model.Proto().constraints)} constraints.")
+    solver, status, schedule = solve_saved(saved, time_limit=args.time, seed=args.seed, workers=args.workers)
+    print(f"{solver.StatusName(status)} in {solver.WallTime():.1f}s, objective {solver.ObjectiveValue() if schedule else None}.")
+    if schedule is None:
+        return 1
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(schedule, f)
+        print(f"Wrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Request-pattern cohorts: students with identical request sets are modeled together.
+The cohort model assigns integer counts per (course, period); split_cohorts turns
+those counts back into named students.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Set, Tuple
+
+
+@dataclass
+class Cohort:
+    """Students sharing the same set of modeled courses."""
+    courses: List[str]
+    student_ids: List[int]
+
+
+def group_cohorts(student_courses: Dict[int, List[str]]) -> List[Cohort]:
+    """Group students by request set (order-insensitive). Students with no modeled course are dropped."""
+    by_key: Dict[Tuple[str, ...], List[int]] = {}
+    for sid, courses in student_courses.items():
+        if not courses:
+            continue
+        by_key.setdefault(tuple(sorted(courses)), []).append(sid)
+    return [Cohort(courses=list(key), student_ids=sids) for key, sids in by_key.items()]
+
+
+def _free_color(used: Dict[int, str], n_colors: int) -> int:
+    for col in range(n_colors):
+        if col not in used:
+            return col
+    raise ValueError("Cohort counts exceed cohort size; cannot split into students.")
+
+
+def _flip_path(
+    period: str,
+    a: int,
+    b: int,
+    course_color: Dict[str, Dict[int, str]],
+    period_color: Dict[str, Dict[int, str]],
+) -> None:
+    """Swap colours a/b along the alternating path that starts at period with an a-edge."""
+    edges: List[Tuple[str, str, int]] = []
+    node, on_period, col = period, True, a
+    while True:
+        if on_period:
+            course = period_color[node].get(col)
+            if course is None:
+                break
+            edges.append((course, node, col))
+            node, on_period = course, False
+        else:
+            p = course_color[node].get(col)
+            if p is None:
+                break
+            edges.append((node, p, col))
+            node, on_period = p, True
+        col = b if col == a else a
+    for c, p, col in edges:
+        del course_color[c][col]
+        del period_color[p][col]
+    for c, p, col in edges:
+        other = b if col == a else a
+        course_color[c][other] = p
+        period_color[p][other] = c
+
+
+def _split_counts(counts: Dict[Tuple[str, str], int], n_students: int) -> List[Dict[str, str]]:
+    """
+    Decompose a course x period count matrix whose row and column sums are <= n_students
+    into n_students clash-free schedules (Konig's bipartite edge colouring).
+    Returns one {course: period} dict per student.
+    """
+    course_color: Dict[str, Dict[int, str]] = {}
+    period_color: Dict[str, Dict[int, str]] = {}
+    for (c, p), m in sorted(counts.items()):
+        cc = course_color.setdefault(c, {})
+        pc = period_color.setdefault(p, {})
+        for _ in range(m):
+            a = _free_color(cc, n_students)
+            b = _free_color(pc, n_students)
+            if a in pc:
+                # Free colour a at the period end; the path can never reach this course.
+                _flip_path(p, a, b, course_color, period_color)
+            cc[a] = p
+            pc[a] = c
+
+    out: List[Dict[str, str]] = [{} for _ in range(n_students)]
+    for c, colors in course_color.items():
+        for col, p in colors.items():
+            out[col][c] = p
+    return out
+
+
+def split_cohorts(
+    cohorts: List[Cohort],
+    counts: Dict[Tuple[int, str, str], int],
+) -> Set[Tuple[int, str, str]]:
+    """
+    Turn cohort counts (k, course, period) -> n into per-student assignments (sid, course, period).
+    Students earlier in a cohort receive the fuller schedules.
+    """
+    per_cohort: Dict[int, Dict[Tuple[str, str], int]] = {}
+    for (k, c, p), n in counts.items():
+        if n > 0:
+            per_cohort.setdefault(k, {})[(c, p)] = n
+
+    assigned: Set[Tuple[int, str, str]] = set()
+    for k, cohort_counts in per_cohort.items():
+        sids = cohorts[k].student_ids
+        schedules = _split_counts(cohort_counts, len(sids))
+        schedules.sort(key=len, reverse=True)
+        for sid, sched in zip(sids, schedules):
+            for c, p in sched.items():
+                assigned.add((sid, c, p))
+    return assigned
@@ -0,0 +1,71 @@
+"""
+Split the scheduling problem into independent subproblems.
+Two courses interact if some student requests both or some teacher can teach both;
+connected components of that graph share no constraint and can be solved separately.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional
+
+from scheduler.solver.model import build_index
+
+
+@dataclass
+class Component:
+    """One independent subproblem: its courses and the students/teachers touching them."""
+    courses: List[str]
+    students: Dict[int, Dict[str, Any]]
+    teachers: Dict[str, Dict[str, Any]]
+
+    @property
+    def size(self) -> int:
+        """Rough model size: student requests plus teacher course options in this component."""
+        return sum(len(s.get("requests") or []) for s in self.students.values()) + sum(
+            len(t.get("can_teach") or []) for t in self.teachers.values()
+        )
+
+
+def split_components(
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    *,
+    off_timetable_courses: Optional[List[str]] = None,
+) -> List[Component]:
+    """
+    Connected components of the student/teacher/course interaction graph (union-find on courses).
+    Students and teachers with no modeled course are left out. Ordered largest first.
+    """
+    index = build_index(students, teachers, off_timetable_courses=off_timetable_courses)
+    parent: Dict[str, str] = {c: c for c in index.courses}
+
+    def find(c: str) -> str:
+        while parent[c] != c:
+            parent[c] = parent[parent[c]]
+            c = parent[c]
+        return c
+
+    def union(linked: List[str]) -> None:
+        if not linked:
+            return
+        root = find(linked[0])
+        for c in linked[1:]:
+            other = find(c)
+            if other != root:
+                parent[other] = root
+
+    for courses in index.student_courses.values():
+        union(courses)
+    for courses in index.teacher_courses.values():
+        union(courses)
+
+    by_root: Dict[str, Component] = {}
+    for c in index.courses:
+        by_root.setdefault(find(c), Component(courses=[], students={}, teachers={})).courses.append(c)
+    for sid, courses in index.student_courses.items():
+        if courses:
+            by_root[find(courses[0])].students[sid] = students[sid]
+    for tid, courses in index.teacher_courses.items():
+        if courses:
+            by_root[find(courses[0])].teachers[tid] = teachers[tid]
+
+    return sorted(by_root.values(), key=lambda comp: (-comp.size, comp.courses[0]))
@@ -0,0 +1,107 @@
+"""
+Greedy constructive schedule: open sections course by course (most constrained first), placing
+each in the period where it clashes least with sections already opened for courses that share
+students, then seat students with the sectioning matcher. Satisfies constraints 1-8 of
+build_model; used for quick drafts (--strategy greedy) and as a complete CP-SAT hint.
+"""
+
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+import numpy as np
+
+from scheduler.config import get_config
+from scheduler.solver.model import build_index
+from scheduler.solver.hints import Hints
+from scheduler.solver.sectioning import Section, assign_students, schedule_from_sections
+from scheduler.solver.util import course_overlap
+
+
+def greedy_sections(
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    *,
+    off_timetable_courses: Optional[List[str]] = None,
+) -> List[Section]:
+    """
+    Open about demand / ideal size sections per course (at least enough to seat every request at
+    max size, at most what periods, teacher loads and min size allow). Courses with the fewest
+    qualified teachers, then fewest usable periods, go first.
+    """
+    cfg = get_config()
+    periods = cfg.periods
+    index = build_index(students, teachers, off_timetable_courses=off_timetable_courses)
+    overlap = course_overlap(index)
+    pos = {c: i for i, c in enumerate(index.courses)}
+
+    load_left = {tid: t.get("max_sections", cfg.max_teacher_sections) for tid, t in teachers.items()}
+    busy: Set[Tuple[str, str]] = set()  # (tid, period)
+    # Share of each course's students expected in each period: (sections of c in p) / (sections of c)
+    planned: Dict[str, int] = {}
+    for c in index.courses:
+        min_cap, ideal, max_cap = index.caps[c]
+        demand = len(index.course_students[c])
+        wanted = max(-(-demand // max_cap), round(demand / ideal))
+        planned[c] = max(0, min(wanted, len(index.course_periods[c]), demand // min_cap if min_cap else wanted))
+    share = np.zeros((len(index.courses), len(periods)))
+    period_pos = {p: j for j, p in enumerate(periods)}
+
+    order = sorted(
+        index.courses,
+        key=lambda c: (len(index.course_teachers[c]), len(index.course_periods[c]), -len(index.course_students[c])),
+    )
+    sections: List[Section] = []
+    for c in order:
+        min_cap, _, max_cap = index.caps[c]
+        # Specialists first, so flexible teachers stay free for later courses
+        qualified = sorted(index.course_teachers[c], key=lambda tid: len(index.teacher_courses[tid]))
+        clash = overlap[pos[c]] @ share  # expected shared students per period
+        used: Set[str] = set()
+        for _ in range(planned[c]):
+            best = None
+            for p in index.course_periods[c]:
+                if p in used:
+                    continue
+                tid = next(
+                    (
+                        tid for tid in qualified
+                        if load_left[tid] > 0 and (tid, p) not in busy and p in index.teacher_periods[tid]
+                    ),
+                    None,
+                )
+                if tid is None:
+                    continue
+                score = (clash[period_pos[p]], share[:, period_pos[p]].sum(), period_pos[p])
+                if best is None or score < best[0]:
+                    best = (score, p, tid)
+            if best is None:
+                break
+            _, p, tid = best
+            used.add(p)
+            busy.add((tid, p))
+            load_left[tid] -= 1
+            share[pos[c], period_pos[p]] = 1.0 / planned[c]
+            sections.append(Section(course=c, period=p, teacher_id=tid, min_size=min_cap, max_size=max_cap))
+    return sections
+
+
+def greedy_hints(
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    *,
+    off_timetable_courses: Optional[List[str]] = None,
+) -> Hints:
+    """The greedy schedule as warm-start hints (by id, so namesakes stay distinct)."""
+    sections = greedy_sections(students, teachers, off_timetable_courses=off_timetable_courses)
+    assignments, kept = assign_students(sections, students, teachers, off_timetable_courses=off_timetable_courses)
+    return Hints(students=assignments, teachers={(sec.teacher_id, sec.course, sec.period) for sec in kept})
+
+
+def greedy_schedule(
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    *,
+    off_timetable_courses: Optional[List[str]] = None,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """greedy_sections, then seat students by per-student matching (sectioning.assign_students)."""
+    sections = greedy_sections(students, teachers, off_timetable_courses=off_timetable_courses)
+    return schedule_from_sections(sections, students, teachers, off_timetable_courses=off_timetable_courses)
@@ -0,0 +1,124 @@
+"""
+Warm-start hints: previous (sid, course, period) / (tid, course, period) assignments.
+Hints come from a schedule dict or from the Excel outputs of a prior run; the model
+builders map them onto SA/CX/TA/size variables with AddHint.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+import pandas as pd
+
+from scheduler.config import get_config
+
+
+@dataclass
+class Hints:
+    """Previous assignments to seed the solver. skipped counts entries that no longer map."""
+    students: Set[Tuple[int, str, str]] = field(default_factory=set)
+    teachers: Set[Tuple[str, str, str]] = field(default_factory=set)
+    skipped: int = 0
+
+    def __len__(self) -> int:
+        return len(self.students) + len(self.teachers)
+
+    def matched(self, student_courses: Dict[int, List[str]], teacher_courses: Dict[str, List[str]]) -> int:
+        """How many hinted assignments refer to a modeled (student|teacher, course) pair."""
+        return sum(1 for sid, c, _ in self.students if c in student_courses.get(sid, ())) + sum(
+            1 for tid, c, _ in self.teachers if c in teacher_courses.get(tid, ())
+        )
+
+
+def _teachers_by_name(teachers: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+    by_name: Dict[str, List[str]] = {}
+    for tid, t in teachers.items():
+        by_name.setdefault(t["name"], []).append(tid)
+    return by_name
+
+
+def _teacher_for(name: str, course: str, teachers: Dict[str, Dict[str, Any]], by_name: Dict[str, List[str]]) -> Optional[str]:
+    """Teacher id for a display name; among namesakes prefer one who can teach the course."""
+    tids = by_name.get(name) or []
+    for tid in tids:
+        if course in (teachers[tid].get("can_teach") or []):
+            return tid
+    return None
+
+
+def hints_from_schedule(
+    schedule: Dict[str, Dict[str, Dict[str, Any]]],
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+) -> Hints:
+    """Hints from a schedule dict; students are matched by "student_ids" if present, else by name (first match)."""
+    sid_by_name: Dict[str, int] = {}
+    for sid, s in students.items():
+        sid_by_name.setdefault(s["name"], sid)
+    by_name = _teachers_by_name(teachers)
+
+    hints = Hints()
+    for p, courses in schedule.items():
+        for c, info in courses.items():
+            tids = info.get("teacher_ids") or [_teacher_for(n, c, teachers, by_name) for n in info.get("teachers") or []]
+            for tid in tids:
+                if tid in teachers and c in (teachers[tid].get("can_teach") or []):
+                    hints.teachers.add((tid, c, p))
+                else:
+                    hints.skipped += 1
+            sids = info.get("student_ids") or [sid_by_name.get(name) for name in info.get("students") or []]
+            for sid in sids:
+                if sid in students and c in (students[sid].get("requests") or []):
+                    hints.students.add((sid, c, p))
+                else:
+                    hints.skipped += 1
+    return hints
+
+
+def load_hints(
+    directory: str,
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    *,
+    periods: Optional[List[str]] = None,
+) -> Hints:
+    """
+    Read school_schedule.xlsx (teachers per section) and student_schedules.xlsx (course per
+    student and period) from a previous run's output directory. Students are matched by
+    Student Number, teachers by name; rows for students, teachers or requests that no longer
+    exist are skipped.
+    """
+    periods = periods or get_config().periods
+    by_name = _teachers_by_name(teachers)
+    hints = Hints()
+
+    school = pd.read_excel(os.path.join(directory, "school_schedule.xlsx"))
+    for _, r in school.iterrows():
+        p, c = str(r.get("Period", "")).strip(), str(r.get("Course", "")).strip()
+        names = str(r.get("Teacher", "") or "")
+        for name in (n.strip() for n in names.split(",")):
+            if not name or name == "TBD":
+                continue
+            tid = _teacher_for(name, c, teachers, by_name)
+            if tid is None or p not in periods:
+                hints.skipped += 1
+                continue
+            hints.teachers.add((tid, c, p))
+
+    per_student = pd.read_excel(os.path.join(directory, "student_schedules.xlsx"))
+    for _, r in per_student.iterrows():
+        num = r.get("Student Number")
+        if num is None or pd.isna(num):
+            continue
+        sid = int(num)
+        requests = (students.get(sid) or {}).get("requests") or []
+        for p in periods:
+            c = r.get(p)
+            if c is None or pd.isna(c) or not str(c).strip():
+                continue
+            c = str(c).strip()
+            if c not in requests:
+                hints.skipped += 1
+                continue
+            hints.students.add((sid, c, p))
+    return hints
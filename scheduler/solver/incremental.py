@@ -0,0 +1,233 @@
+"""
+Incremental re-solve after small edits (add/drop a course, new student, teacher load change).
+Everything outside a neighbourhood of the change is kept from the previous schedule and enters
+the model only as constants (seats already taken, teachers' busy periods and load), so the
+model holds just the affected students, sections and teachers.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Iterable, Optional, Set, Tuple, Union
+
+from ortools.sat.python import cp_model
+
+from scheduler.config import get_config
+from scheduler.solver.hints import hints_from_schedule
+from scheduler.solver.model import build_index, schedule_objective
+from scheduler.solver.schedule import build_schedule
+from scheduler.solver.util import new_solver
+
+# Incremental edits should come back in seconds, not a full solve.
+DEFAULT_INCREMENTAL_TIME_SECONDS: float = 10.0
+
+
+@dataclass
+class IncrementalResult:
+    """Re-solved schedule plus the objective before (previous schedule on new data) and after."""
+    schedule: Optional[Dict[str, Dict[str, Dict[str, Any]]]]
+    objective_before: int
+    objective_after: Optional[int]
+    free_students: Set[int] = field(default_factory=set)
+    free_teachers: Set[str] = field(default_factory=set)
+    free_sections: Set[Tuple[str, str]] = field(default_factory=set)
+
+    @property
+    def delta(self) -> Optional[int]:
+        return None if self.objective_after is None else self.objective_after - self.objective_before
+
+    def summary(self) -> str:
+        if self.schedule is None:
+            return "Incremental re-solve found no feasible schedule."
+        return (
+            f"Incremental re-solve: {len(self.free_students)} students, {len(self.free_sections)} sections, "
+            f"{len(self.free_teachers)} teachers free; objective {self.objective_before} -> "
+            f"{self.objective_after} ({self.delta:+d})."
+        )
+
+
+def resolve_incremental(
+    prev_schedule: Dict[str, Dict[str, Dict[str, Any]]],
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    changed_ids: Iterable[Union[int, str]],
+    *,
+    off_timetable_courses: Optional[List[str]] = None,
+    time_limit_seconds: Optional[float] = None,
+) -> IncrementalResult:
+    """
+    Re-optimize only around changed students / teachers (ids, as keys of students / teachers;
+    ids that were removed from the data are fine too).
+
+    Neighbourhood: changed students (free to join any section with room); the previous sections
+    of changed students and teachers plus sections that are no longer valid (teacher gone, below
+    min size); the teachers of those sections and qualified teachers with spare load (free to open
+    or move sections; their kept sections stay open but may change teacher). Students already in
+    a free section may move to another period of that course or be dropped from it. All other
+    seats and sections are kept and only enter the model as constants.
+    """
+    cfg = get_config()
+    periods = cfg.periods
+    off = off_timetable_courses or cfg.off_timetable_courses
+    time_limit = time_limit_seconds if time_limit_seconds is not None else DEFAULT_INCREMENTAL_TIME_SECONDS
+    changed = set(changed_ids)
+
+    index = build_index(students, teachers, off_timetable_courses=off)
+    prev = hints_from_schedule(prev_schedule, students, teachers)
+    prev_teacher: Dict[Tuple[str, str], str] = {(c, p): tid for tid, c, p in prev.teachers}
+    prev_members: Dict[Tuple[str, str], Set[int]] = {}
+    for sid, c, p in prev.students:
+        prev_members.setdefault((c, p), set()).add(sid)
+
+    free_students = {sid for sid in changed if sid in students}
+    free_sections: Set[Tuple[str, str]] = set()
+    for p, courses in prev_schedule.items():
+        for c, info in courses.items():
+            key = (c, p)
+            if c not in index.caps:
+                continue
+            touched = (
+                any(sid in changed for sid in info.get("student_ids") or [])
+                or any(tid in changed for tid in info.get("teacher_ids") or [])
+                or key not in prev_teacher
+                or p not in index.teacher_periods.get(prev_teacher[key], ())
+                or len(prev_members.get(key, ())) < index.caps[c][0]
+            )
+            if touched:
+                free_sections.add(key)
+    for sid, c, p in prev.students:
+        if sid in free_students:
+            free_sections.add((c, p))
+    free_teachers = {tid for tid in changed if tid in teachers}
+    free_teachers.update(prev_teacher[key] for key in free_sections if key in prev_teacher)
+    # Qualified teachers with spare sections can take over or open sections of affected courses
+    load: Dict[str, int] = {}
+    for tid, _, _ in prev.teachers:
+        load[tid] = load.get(tid, 0) + 1
+    for c in {c for c, _ in free_sections}:
+        free_teachers.update(
+            tid for tid in index.course_teachers.get(c, [])
+            if load.get(tid, 0) < teachers[tid].get("max_sections", cfg.max_teacher_sections)
+        )
+    # Students sitting in a free section may move within that course
+    movable: Set[Tuple[int, str]] = {
+        (sid, c) for (c, p) in free_sections for sid in prev_members.get((c, p), ())
+    }
+
+    # Fixed part: every other seat and section stays as it was and enters the model as a constant.
+    # Kept sections of free teachers stay open with their students, but may change teacher.
+    kept = {key: tid for key, tid in prev_teacher.items() if key not in free_sections and key[0] in index.caps}
+    fixed_teacher = {key: tid for key, tid in kept.items() if tid not in free_teachers}
+    fixed_seats = [
+        (sid, c, p) for sid, c, p in prev.students
+        if (c, p) in kept and sid not in free_students and (sid, c) not in movable
+        and c in index.student_courses.get(sid, ())
+    ]
+    fixed_size: Dict[Tuple[str, str], int] = {}
+    busy: Dict[Union[int, str], Set[str]] = {}
+    for sid, c, p in fixed_seats:
+        fixed_size[(c, p)] = fixed_size.get((c, p), 0) + 1
+        busy.setdefault(sid, set()).add(p)
+    fixed_load: Dict[str, int] = {}
+    for (c, p), tid in fixed_teacher.items():
+        fixed_load[tid] = fixed_load.get(tid, 0) + 1
+        busy.setdefault(tid, set()).add(p)
+
+    # Free part: the seats of free students and movable requests, and the sections they can use
+    free_pairs = {(sid, c) for sid in free_students for c in index.student_courses.get(sid, ())} | movable
+    pinned = {key for key in kept if key not in fixed_teacher}
+    courses = {c for _, c in free_pairs} | {c for c, _ in free_sections | pinned}
+    model = cp_model.CpModel()
+    TA: Dict[Tuple[str, str, str], cp_model.IntVar] = {}
+    for tid in free_teachers:
+        for c in index.teacher_courses.get(tid, ()):
+            if c not in courses:
+                continue
+            for p in index.teacher_periods[tid]:
+                if p in index.course_periods[c] and p not in busy.get(tid, ()) and (c, p) not in fixed_teacher:
+                    TA[(tid, c, p)] = model.NewBoolVar(f"TA_{tid}_{c}_{p}")
+    section_teachers: Dict[Tuple[str, str], List[cp_model.IntVar]] = {}
+    for (tid, c, p), var in TA.items():
+        section_teachers.setdefault((c, p), []).append(var)
+    openable = set(fixed_teacher) | set(section_teachers)
+    SA: Dict[Tuple[int, str, str], cp_model.IntVar] = {}
+    for sid, c in free_pairs:
+        for p in index.course_periods[c]:
+            if (c, p) in openable and p not in busy.get(sid, ()):
+                SA[(sid, c, p)] = model.NewBoolVar(f"SA_{sid}_{c}_{p}")
+
+    # Same constraints as build_model, restricted to the free variables
+    for sid, c in free_pairs:
+        model.AddAtMostOne(SA[(sid, c, p)] for p in index.course_periods[c] if (sid, c, p) in SA)
+    seats_by_period: Dict[Tuple[int, str], List[cp_model.IntVar]] = {}
+    section_seats: Dict[Tuple[str, str], List[cp_model.IntVar]] = {}
+    for (sid, c, p), var in SA.items():
+        seats_by_period.setdefault((sid, p), []).append(var)
+        section_seats.setdefault((c, p), []).append(var)
+    for seats in seats_by_period.values():
+        model.AddAtMostOne(seats)
+    teacher_slots: Dict[Tuple[str, str], List[cp_model.IntVar]] = {}
+    teacher_vars: Dict[str, List[cp_model.IntVar]] = {}
+    for (tid, c, p), var in TA.items():
+        teacher_slots.setdefault((tid, p), []).append(var)
+        teacher_vars.setdefault(tid, []).append(var)
+    for slots in teacher_slots.values():
+        model.AddAtMostOne(slots)
+    for tid, tas in teacher_vars.items():
+        capacity = teachers[tid].get("max_sections", cfg.max_teacher_sections) - fixed_load.get(tid, 0)
+        model.Add(sum(tas) <= max(0, capacity))
+    deviation = []
+    for key in openable & {(c, p) for c in courses for p in index.course_periods[c]}:
+        c = key[0]
+        min_cap, ideal, max_cap = index.caps[c]
+        size = fixed_size.get(key, 0) + sum(section_seats.get(key, []))
+        if key in kept:
+            if key not in fixed_teacher:
+                model.Add(sum(section_teachers[key]) == 1)
+            model.Add(size >= min_cap)
+            model.Add(size <= max_cap)
+        else:
+            active = model.NewBoolVar(f"active_{c}_{key[1]}")
+            model.Add(sum(section_teachers[key]) == active)
+            model.Add(size >= min_cap).OnlyEnforceIf(active)
+            model.Add(size <= max_cap).OnlyEnforceIf(active)
+            model.Add(size == 0).OnlyEnforceIf(active.Not())
+        dev = model.NewIntVar(0, cfg.global_max_class_size, f"DEV_{c}_{key[1]}")
+        model.AddAbsEquality(dev, size - ideal)
+        deviation.append(dev)
+    target = getattr(cfg, "courses_per_student_target", None)
+    if target is not None:
+        model.Add(sum(SA.values()) == len(students) * target - len(fixed_seats))
+    # Weighted objective in either mode (sections outside the model contribute constants)
+    model.Maximize(sum(SA.values()) * 10000 - sum(deviation))
+    # Hint the previous schedule minus the sections it can no longer keep, so the hint is feasible
+    hinted_open = set(kept)
+    for key in free_sections:
+        tid = prev_teacher.get(key)
+        stay = [sid for sid in prev_members.get(key, ()) if sid not in free_students and (sid, *key) in SA]
+        if tid not in changed and (tid, *key) in TA and len(stay) >= index.caps[key[0]][0]:
+            hinted_open.add(key)
+    for (sid, c, p), var in SA.items():
+        model.AddHint(var, int((sid, c, p) in prev.students and (c, p) in hinted_open and sid not in free_students))
+    for (tid, c, p), var in TA.items():
+        model.AddHint(var, int((tid, c, p) in prev.teachers and (c, p) in hinted_open))
+
+    before = schedule_objective(prev.students, index, periods)
+    solver = new_solver(time_limit, cfg)
+    status = solver.Solve(model)
+
+    result = IncrementalResult(
+        schedule=None,
+        objective_before=before,
+        objective_after=None,
+        free_students=free_students,
+        free_teachers=free_teachers,
+        free_sections=free_sections,
+    )
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return result
+    student_assignments = sorted(fixed_seats + [key for key, var in SA.items() if solver.Value(var)])
+    teacher_assignments = [(tid, c, p) for (c, p), tid in fixed_teacher.items()]
+    teacher_assignments += [key for key, var in TA.items() if solver.Value(var)]
+    result.schedule = build_schedule(students, teachers, student_assignments, teacher_assignments, periods=periods)
+    # Recomputed rather than read from the solver so it is comparable in either objective mode
+    result.objective_after = schedule_objective(student_assignments, index, periods)
+    return result
@@ -0,0 +1,192 @@
+"""
+Large-neighbourhood search: keep an incumbent schedule, free one neighbourhood at a time (a few
+related courses with all seats of their students, the students of one grade, or everything in
+a pair of periods), re-solve that small problem for a few seconds and keep improvements. Worker processes
+each build the model once and try different neighbourhoods on the same incumbent every round.
+"""
+
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, List, Any, Optional, Tuple
+
+from ortools.sat.python import cp_model
+
+from scheduler.config import SchedulerConfig, get_config, set_config
+from scheduler.solver.hints import Hints, hints_from_schedule
+from scheduler.solver.model import build_index, build_model, schedule_objective
+from scheduler.solver.schedule import build_schedule
+from scheduler.solver.util import course_overlap, lock, new_solver
+
+# Per-neighbourhood re-solve time and number of related courses freed together.
+DEFAULT_LNS_ITERATION_SECONDS: float = 5.0
+DEFAULT_LNS_COURSES: int = 4
+
+Neighbourhood = Tuple[str, Tuple]  # ("courses", courses) | ("grade", (grade,)) | ("periods", periods)
+
+
+@dataclass
+class LnsResult:
+    """Improved schedule plus objective before/after (assigned * 10000 - size deviation)."""
+    schedule: Dict[str, Dict[str, Dict[str, Any]]]
+    objective_before: int
+    objective_after: int
+    rounds: int = 0
+    iterations: int = 0
+    accepted: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"LNS: {self.iterations} neighbourhoods in {self.rounds} rounds, {self.accepted} accepted; "
+            f"objective {self.objective_before} -> {self.objective_after} "
+            f"({self.objective_after - self.objective_before:+d})."
+        )
+
+
+# Per-process model, built once by _init_worker
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    off: List[str],
+    cfg: SchedulerConfig,
+) -> None:
+    # Acceptance uses the weighted objective, so the sub-model optimizes the same thing
+    set_config(replace(cfg, solver_objective="weighted"))
+    model, SA, TA, _ = build_model(students, teachers, off_timetable_courses=off, pool=False)
+    _WORKER.update(
+        model=model,
+        SA=SA,
+        TA=TA,
+        index=build_index(students, teachers, off_timetable_courses=off),
+        grades={sid: s.get("grade") for sid, s in students.items()},
+        student_courses={sid: set(s.get("requests") or []) for sid, s in students.items()},
+        cfg=get_config(),
+    )
+
+
+def _is_free(key: Tuple, kind: str, members: Tuple, student: bool) -> bool:
+    who, c, p = key
+    if kind == "courses":
+        # The freed courses' sections, plus every seat of their students so they can re-section around them
+        return c in members or (student and bool(_WORKER["student_courses"].get(who, set()) & set(members)))
+    if kind == "periods":
+        return p in members
+    return student and _WORKER["grades"].get(who) in members
+
+
+def _improve(
+    neighbourhood: Neighbourhood,
+    incumbent: Hints,
+    time_limit: float,
+) -> Tuple[Neighbourhood, Optional[int], List, List]:
+    """Lock everything outside the neighbourhood to the incumbent and re-solve."""
+    model, SA, TA = _WORKER["model"], _WORKER["SA"], _WORKER["TA"]
+    kind, members = neighbourhood
+    model.ClearHints()
+    for table, chosen, student in ((SA, incumbent.students, True), (TA, incumbent.teachers, False)):
+        for key, var in table.items():
+            value = int(key in chosen)
+            if _is_free(key, kind, members, student):
+                var.Proto().domain[:] = [0, 1]
+                model.AddHint(var, value)
+            else:
+                lock(var, value)
+
+    solver = new_solver(time_limit, _WORKER["cfg"])
+    status = solver.Solve(model)
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return neighbourhood, None, [], []
+    student_assignments = [key for key, var in SA.items() if solver.Value(var)]
+    teacher_assignments = [key for key, var in TA.items() if solver.Value(var)]
+    objective = schedule_objective(student_assignments, _WORKER["index"], _WORKER["cfg"].periods)
+    return neighbourhood, objective, student_assignments, teacher_assignments
+
+
+def _neighbourhoods(
+    count: int,
+    rng: random.Random,
+    index: Any,
+    overlap: Any,
+    grades: List[Any],
+    periods: List[str],
+    k: int,
+) -> List[Neighbourhood]:
+    """count neighbourhoods, cycling through the three kinds."""
+    out: List[Neighbourhood] = []
+    for i in range(count):
+        kind = ("courses", "grade", "periods")[(rng.randrange(3) + i) % 3]
+        if kind == "courses" and index.courses:
+            # Seed course plus the courses sharing most students with it
+            seed = rng.randrange(len(index.courses))
+            related = [seed] + sorted(
+                (j for j in range(len(index.courses)) if j != seed), key=lambda j: -overlap[seed, j]
+            )[: k - 1]
+            out.append(("courses", tuple(index.courses[j] for j in related)))
+        elif kind == "grade" and grades:
+            out.append(("grade", (rng.choice(grades),)))
+        else:
+            out.append(("periods", tuple(rng.sample(periods, min(2, len(periods))))))
+    return out
+
+
+def improve_lns(
+    schedule: Dict[str, Dict[str, Dict[str, Any]]],
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    *,
+    off_timetable_courses: Optional[List[str]] = None,
+    time_limit_seconds: Optional[float] = None,
+    iteration_seconds: Optional[float] = None,
+    workers: Optional[int] = None,
+    seed: int = 0,
+) -> LnsResult:
+    """
+    Improve a schedule by LNS until time_limit_seconds (default cfg.solver_time_seconds, else
+    the minimum solver time) runs out. Each round, workers processes each re-solve a different
+    neighbourhood of the current incumbent for iteration_seconds; the best improvement is
+    accepted. Every worker builds the full model, so workers defaults to cfg.solver_lns_workers,
+    at most the CPU count.
+    """
+    cfg = get_config()
+    off = off_timetable_courses or cfg.off_timetable_courses
+    limit = time_limit_seconds or cfg.solver_time_seconds or cfg.solver_min_time_seconds
+    step = iteration_seconds or DEFAULT_LNS_ITERATION_SECONDS
+    n_workers = workers or min(cfg.solver_lns_workers, os.cpu_count() or 1)
+    worker_cfg = replace(cfg, solver_num_workers=max(1, (cfg.solver_num_workers or os.cpu_count() or 1) // n_workers))
+
+    index = build_index(students, teachers, off_timetable_courses=off)
+    overlap = course_overlap(index)
+    grades = sorted({s.get("grade") for s in students.values()})
+    rng = random.Random(seed)
+
+    incumbent = hints_from_schedule(schedule, students, teachers)
+    best = schedule_objective(incumbent.students, index, cfg.periods)
+    result = LnsResult(schedule=schedule, objective_before=best, objective_after=best)
+    started = time.time()
+    with ProcessPoolExecutor(
+        max_workers=n_workers, initializer=_init_worker, initargs=(students, teachers, off, worker_cfg)
+    ) as pool:
+        while time.time() - started + step <= limit:
+            batch = _neighbourhoods(n_workers, rng, index, overlap, grades, cfg.periods, DEFAULT_LNS_COURSES)
+            futures = [pool.submit(_improve, nb, incumbent, step) for nb in batch]
+            outcomes = [f.result() for f in futures]
+            result.rounds += 1
+            result.iterations += len(outcomes)
+            top = max(outcomes, key=lambda o: o[1] if o[1] is not None else best - 1)
+            if top[1] is not None and top[1] > best:
+                best = top[1]
+                incumbent = Hints(students=set(top[2]), teachers=set(top[3]))
+                result.accepted += 1
+                print(f"LNS round {result.rounds}: {top[0][0]} {', '.join(map(str, top[0][1]))} -> objective {best}")
+
+    if result.accepted:
+        result.schedule = build_schedule(
+            students, teachers, sorted(incumbent.students), list(incumbent.teachers), periods=cfg.periods
+        )
+    result.objective_after = best
+    return result
@@ -3,13 +3,21 @@ Section-based CP-SAT model for timetable scheduling.
 - No 6-8 hard rule; maximize assigned course-periods.
 - One section = (course, period) with at most one teacher; size variable (0 = section closed).
 - Redundant constraints and symmetry breaking to improve propagation.
+- Optional cohort formulation: identical request sets share integer count variables.
 """
 
-from typing import Dict, List, Set, Tuple, Any, Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Iterable, Set, Tuple, Any, Optional
 
 from ortools.sat.python import cp_model
 
 from scheduler.config import get_config
+from scheduler.solver.cohort import Cohort, group_cohorts
+from scheduler.solver.hints import Hints
+from scheduler.solver.pooling import pool_teachers
+
+if TYPE_CHECKING:
+    from scheduler.solver.presolve import Presolve
 
 
 def _course_cap(
@@ -30,22 +38,36 @@ def _course_cap(
     return min_cap, ideal, max_cap
 
 
-def build_model(
+@dataclass
+class ModelIndex:
+    """
+    Lookup tables shared by every model builder, computed once per input.
+    Only courses that are requested, on the timetable, and have a qualified teacher are modeled.
+    teacher_periods lists the periods a teacher is available (teacher "availability"); a section
+    can only run in course_periods, the periods where some qualified teacher is available.
+    teacher_pools: pool id -> interchangeable member teachers; a pool id stands in for its
+    members in the teacher tables (see pooling.py). Empty unless pooled.
+    """
+    courses: List[str]
+    caps: Dict[str, Tuple[int, int, int]]
+    course_students: Dict[str, List[int]]
+    student_courses: Dict[int, List[str]]
+    course_teachers: Dict[str, List[str]]
+    teacher_courses: Dict[str, List[str]]
+    course_periods: Dict[str, List[str]]
+    teacher_periods: Dict[str, List[str]]
+    teacher_pools: Dict[str, List[str]] = field(default_factory=dict)
+
+
+def build_index(
     students: Dict[int, Dict[str, Any]],
     teachers: Dict[str, Dict[str, Any]],
     *,
     off_timetable_courses: Optional[List[str]] = None,
-) -> Tuple[cp_model.CpModel, Dict, Dict, Dict]:
-    """
-    Build CP-SAT model. Returns (model, SA, TA, size_vars).
-    SA[(sid, course, period)] = 1 if student sid takes course in period.
-    TA[(tid, course, period)] = 1 if teacher tid teaches course in period.
-    size_vars[(course, period)] = enrollment in that section (0 if section not run).
-    """
+) -> ModelIndex:
+    """Build course->students, course->teachers and student/teacher->courses indexes."""
     cfg = get_config()
     off = set(off_timetable_courses or cfg.off_timetable_courses)
-    periods = cfg.periods
-    n_students = len(students)
 
     # Courses that appear in demand and have at least one teacher (on-timetable only)
     demand_courses: Set[str] = set()
@@ -53,129 +75,407 @@ def build_model(
         for c in (s.get("requests") or []):
             if c not in off:
                 demand_courses.add(c)
-    qualified: Dict[str, List[str]] = {}
-    for tid, t in teachers.items():
-        for c in (t.get("can_teach") or []):
-            if c in off:
-                continue
-            qualified.setdefault(c, []).append(tid)
+    qualified: Set[str] = set()
+    for t in teachers.values():
+        qualified.update(c for c in (t.get("can_teach") or []) if c not in off)
     # Only model courses that are requested and have supply
-    courses = [c for c in demand_courses if c in qualified]
-
-    model = cp_model.CpModel()
+    courses = sorted(demand_courses & qualified)
+    course_set = set(courses)
 
-    # --- Decision variables ---
-    # Student assignment: sid takes course c in period p
-    SA: Dict[Tuple[int, str, str], cp_model.IntVar] = {}
+    # course -> students requesting it; student -> its modeled courses (deduplicated)
+    course_students: Dict[str, List[int]] = {c: [] for c in courses}
+    student_courses: Dict[int, List[str]] = {}
     for sid, sdata in students.items():
-        for c in (sdata.get("requests") or []):
-            if c not in courses:
-                continue
-            for p in periods:
-                SA[(sid, c, p)] = model.NewBoolVar(f"SA_{sid}_{c}_{p}")
+        modeled = list(dict.fromkeys(c for c in (sdata.get("requests") or []) if c in course_set))
+        student_courses[sid] = modeled
+        for c in modeled:
+            course_students[c].append(sid)
+    # course -> qualified teachers; teacher -> its modeled courses
+    course_teachers: Dict[str, List[str]] = {c: [] for c in courses}
+    teacher_courses: Dict[str, List[str]] = {}
+    for tid, t in teachers.items():
+        modeled = list(dict.fromkeys(c for c in (t.get("can_teach") or []) if c in course_set))
+        teacher_courses[tid] = modeled
+        for c in modeled:
+            course_teachers[c].append(tid)
+
+    teacher_periods = {
+        tid: [p for p in cfg.periods if (t.get("availability") or {}).get(p, True)] for tid, t in teachers.items()
+    }
+
+    caps = {c: _course_cap(c, {tid: teachers[tid] for tid in course_teachers[c]}, cfg) for c in courses}
+    return ModelIndex(
+        courses=courses,
+        caps=caps,
+        course_students=course_students,
+        student_courses=student_courses,
+        course_teachers=course_teachers,
+        teacher_courses=teacher_courses,
+        course_periods={
+            c: [p for p in cfg.periods if any(p in teacher_periods[tid] for tid in course_teachers[c])]
+            for c in courses
+        },
+        teacher_periods=teacher_periods,
+    )
+
+
+def _add_sections(
+    model: cp_model.CpModel,
+    index: ModelIndex,
+    teachers: Dict[str, Dict[str, Any]],
+    cfg: Any,
+) -> Tuple[Dict, Dict, Dict]:
+    """
+    Teacher-side variables and constraints shared by every formulation.
+    Returns (TA, size_vars, section_active); constraints 4-7.
+    For a pool of m interchangeable teachers, TA[(pool, c, p)] is one boolean and the pool may
+    teach m classes per period and m * max_sections in total.
+    """
+    periods = cfg.periods
 
     # Teacher assignment: tid teaches course c in period p
     TA: Dict[Tuple[str, str, str], cp_model.IntVar] = {}
-    for tid, t in teachers.items():
-        for c in (t.get("can_teach") or []):
-            if c not in courses:
-                continue
-            for p in periods:
-                TA[(tid, c, p)] = model.NewBoolVar(f"TA_{tid}_{c}_{p}")
+    for tid, modeled in index.teacher_courses.items():
+        for c in modeled:
+            for p in index.teacher_periods[tid]:
+                if p in index.course_periods[c]:
+                    TA[(tid, c, p)] = model.NewBoolVar(f"TA_{tid}_{c}_{p}")
 
     # Section size: enrollment in (course, period). 0 means section not run.
     size_vars: Dict[Tuple[str, str], cp_model.IntVar] = {}
     section_active: Dict[Tuple[str, str], cp_model.IntVar] = {}
-    for c in courses:
-        for p in periods:
-            _, _, max_cap = _course_cap(c, teachers, cfg)
+    for c in index.courses:
+        _, _, max_cap = index.caps[c]
+        for p in index.course_periods[c]:
             size_vars[(c, p)] = model.NewIntVar(0, max_cap, f"SZ_{c}_{p}")
             section_active[(c, p)] = model.NewBoolVar(f"active_{c}_{p}")
-
-    # --- Hard constraints ---
-
-    # 1. Student: at most one period per course
-    for sid, sdata in students.items():
-        for c in (sdata.get("requests") or []):
-            if c not in courses:
-                continue
-            model.Add(sum(SA.get((sid, c, p), 0) for p in periods) <= 1)
-
-    # 2. Student: at most one course per period (no clash)
-    for sid in students:
-        for p in periods:
-            model.Add(
-                sum(SA[(sid, c, p)] for c in (students[sid].get("requests") or []) if (sid, c, p) in SA) <= 1
-            )
-
-    # 3. Section size = number of students in (course, period)
-    for (c, p), sz_var in size_vars.items():
-        model.Add(
-            sz_var == sum(SA.get((sid, c, p), 0) for sid in students if (sid, c, p) in SA)
-        )
+    section_teachers: Dict[Tuple[str, str], List[cp_model.IntVar]] = {key: [] for key in size_vars}
+    for (tid, c, p), var in TA.items():
+        section_teachers[(c, p)].append(var)
 
     # 4. Each (course, period) has at most one teacher
-    for c in courses:
-        for p in periods:
-            model.Add(sum(TA.get((tid, c, p), 0) for tid in qualified.get(c, [])) <= 1)
+    for key, tas in section_teachers.items():
+        model.Add(sum(tas) <= 1)
 
     # 5. Link section_active to teacher_sum; enforce size bounds when active
-    for c in courses:
-        for p in periods:
+    for c in index.courses:
+        min_cap, _, max_cap = index.caps[c]
+        for p in index.course_periods[c]:
             sz = size_vars[(c, p)]
             act = section_active[(c, p)]
-            teacher_sum = sum(TA.get((tid, c, p), 0) for tid in qualified.get(c, []))
+            teacher_sum = sum(section_teachers[(c, p)])
             # section_active == 1 iff teacher_sum >= 1
             model.Add(teacher_sum >= 1).OnlyEnforceIf(act)
             model.Add(teacher_sum <= 0).OnlyEnforceIf(act.Not())
-            min_cap, _, max_cap = _course_cap(c, teachers, cfg)
             model.Add(sz >= min_cap).OnlyEnforceIf(act)
             model.Add(sz <= max_cap).OnlyEnforceIf(act)
             model.Add(sz == 0).OnlyEnforceIf(act.Not())
             model.Add(teacher_sum <= 1)
 
     # 6. Teacher load: total sections per teacher <= max_sections
-    for tid, t in teachers.items():
-        load = sum(
-            TA.get((tid, c, p), 0)
-            for c in (t.get("can_teach") or [])
-            for p in periods
-            if (tid, c, p) in TA
-        )
-        model.Add(load <= t.get("max_sections", cfg.max_teacher_sections))
+    for tid, modeled in index.teacher_courses.items():
+        members = index.teacher_pools.get(tid, [tid])
+        load = sum(TA[(tid, c, p)] for c in modeled for p in periods if (tid, c, p) in TA)
+        model.Add(load <= len(members) * teachers[members[0]].get("max_sections", cfg.max_teacher_sections))
 
     # 7. Teacher: at most one class per period
-    for tid in teachers:
+    for tid, modeled in index.teacher_courses.items():
+        members = index.teacher_pools.get(tid, [tid])
+        for p in index.teacher_periods[tid]:
+            slots = [TA[(tid, c, p)] for c in modeled if (tid, c, p) in TA]
+            if not slots:
+                continue
+            if len(members) == 1:
+                model.AddAtMostOne(slots)
+            else:
+                model.Add(sum(slots) <= len(members))
+
+    # --- Optional symmetry breaking: for each course, prefer "earlier" periods first ---
+    if cfg.symmetry_break_per_course:
+        for c in index.courses:
+            cps = index.course_periods[c]
+            for i in range(len(cps) - 1):
+                model.Add(size_vars[(c, cps[i])] >= size_vars[(c, cps[i + 1])])
+
+    return TA, size_vars, section_active
+
+
+def _add_presolve_bounds(
+    model: cp_model.CpModel,
+    presolved: "Presolve",
+    size_vars: Dict[Tuple[str, str], cp_model.IntVar],
+    section_active: Dict[Tuple[str, str], cp_model.IntVar],
+) -> None:
+    """Redundant constraints from presolve: section count <= max_sections, total size <= demand."""
+    for c in presolved.index.courses:
+        cps = presolved.index.course_periods[c]
+        if presolved.max_sections[c] < len(cps):
+            model.Add(sum(section_active[(c, p)] for p in cps) <= presolved.max_sections[c])
+        if presolved.demand[c] < len(cps) * presolved.index.caps[c][2]:
+            model.Add(sum(size_vars[(c, p)] for p in cps) <= presolved.demand[c])
+
+
+def add_deviation(
+    model: cp_model.CpModel,
+    size_vars: Dict[Tuple[str, str], cp_model.IntVar],
+    index: ModelIndex,
+    cfg: Any,
+) -> Dict[Tuple[str, str], cp_model.IntVar]:
+    """dev[(c, p)] = |size - ideal| for every section. Returns dev vars."""
+    dev_vars: Dict[Tuple[str, str], cp_model.IntVar] = {}
+    for (c, p), sz in size_vars.items():
+        _, ideal, _ = index.caps[c]
+        dev = model.NewIntVar(0, cfg.global_max_class_size, f"DEV_{c}_{p}")
+        model.AddAbsEquality(dev, sz - ideal)
+        dev_vars[(c, p)] = dev
+    return dev_vars
+
+
+def schedule_objective(
+    student_assignments: Iterable[Tuple[int, str, str]],
+    index: ModelIndex,
+    periods: List[str],
+) -> int:
+    """build_model's objective (assigned * 10000 - size deviation) for a set of student assignments."""
+    sizes: Dict[Tuple[str, str], int] = {}
+    assigned = 0
+    for sid, c, p in student_assignments:
+        if c in index.student_courses.get(sid, ()):
+            assigned += 1
+            sizes[(c, p)] = sizes.get((c, p), 0) + 1
+    dev = sum(
+        abs(sizes.get((c, p), 0) - index.caps[c][1])
+        for c in index.courses
+        for p in periods
+    )
+    return assigned * 10000 - dev
+
+
+def _set_objective(
+    model: cp_model.CpModel,
+    total_assigned: Any,
+    size_vars: Dict[Tuple[str, str], cp_model.IntVar],
+    index: ModelIndex,
+    cfg: Any,
+) -> Dict[Tuple[str, str], cp_model.IntVar]:
+    """
+    "weighted": maximize assignments * 10000 - size deviation. Returns dev vars.
+    "lexicographic": maximize assignments only (no dev vars); the solver then fixes that count
+    and minimizes deviation in a second pass (see solve.py).
+    """
+    if cfg.solver_objective == "lexicographic":
+        model.Maximize(total_assigned)
+        return {}
+    dev_vars = add_deviation(model, size_vars, index, cfg)
+    # Prioritize assignments; secondary minimize size deviation
+    model.Maximize(total_assigned * 10000 - sum(dev_vars.values()))
+    return dev_vars
+
+
+def _hint_sections(
+    model: cp_model.CpModel,
+    hints: Hints,
+    sizes: Dict[Tuple[str, str], int],
+    TA: Dict[Tuple[str, str, str], cp_model.IntVar],
+    size_vars: Dict[Tuple[str, str], cp_model.IntVar],
+    section_active: Dict[Tuple[str, str], cp_model.IntVar],
+    dev_vars: Dict[Tuple[str, str], cp_model.IntVar],
+    index: ModelIndex,
+) -> None:
+    """
+    Hint every teacher/section variable so that, together with the student hints, the hint
+    is complete (CP-SAT can then check it directly instead of repairing a partial one).
+    """
+    active: Set[Tuple[str, str]] = set()
+    for key, var in TA.items():
+        tid, c, p = key
+        on = any((member, c, p) in hints.teachers for member in index.teacher_pools.get(tid, [tid]))
+        model.AddHint(var, int(on))
+        if on:
+            active.add(key[1:])
+    for key, var in size_vars.items():
+        model.AddHint(var, sizes.get(key, 0))
+        model.AddHint(section_active[key], int(key in active))
+        if key in dev_vars:
+            model.AddHint(dev_vars[key], abs(sizes.get(key, 0) - index.caps[key[0]][1]))
+
+
+def build_model(
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    *,
+    off_timetable_courses: Optional[List[str]] = None,
+    hints: Optional[Hints] = None,
+    presolved: Optional["Presolve"] = None,
+    pool: Optional[bool] = None,
+) -> Tuple[cp_model.CpModel, Dict, Dict, Dict]:
+    """
+    Build CP-SAT model. Returns (model, SA, TA, size_vars).
+    SA[(sid, course, period)] = 1 if student sid takes course in period.
+    TA[(tid, course, period)] = 1 if teacher tid teaches course in period.
+    size_vars[(course, period)] = enrollment in that section (0 if section not run).
+    Variables exist only for periods the section / teacher can use (see ModelIndex).
+    hints: previous assignments; every variable gets a warm-start hint (AddHint).
+    presolved: result of presolve.presolve; its pruned index and redundant bounds are used.
+    pool: merge interchangeable teachers into pools (default cfg.solver_pool_teachers); TA is
+    then keyed by pool id for pooled teachers (pooling.assign_pool_teachers names them).
+    """
+    cfg = get_config()
+    periods = cfg.periods
+    if presolved is not None:
+        index = presolved.index
+    else:
+        index = build_index(students, teachers, off_timetable_courses=off_timetable_courses)
+    if pool is None:
+        pool = cfg.solver_pool_teachers
+    if pool:
+        index = pool_teachers(index, teachers)
+
+    model = cp_model.CpModel()
+
+    # --- Decision variables ---
+    # Student assignment: sid takes course c in period p
+    SA: Dict[Tuple[int, str, str], cp_model.IntVar] = {}
+    for sid, modeled in index.student_courses.items():
+        for c in modeled:
+            for p in index.course_periods[c]:
+                SA[(sid, c, p)] = model.NewBoolVar(f"SA_{sid}_{c}_{p}")
+
+    TA, size_vars, section_active = _add_sections(model, index, teachers, cfg)
+    if presolved is not None:
+        _add_presolve_bounds(model, presolved, size_vars, section_active)
+
+    # --- Hard constraints (4-7 are added by _add_sections) ---
+
+    # 1. Student: at most one period per course
+    for sid, modeled in index.student_courses.items():
+        for c in modeled:
+            model.AddAtMostOne(SA[(sid, c, p)] for p in index.course_periods[c])
+
+    # 2. Student: at most one course per period (no clash)
+    for sid, modeled in index.student_courses.items():
         for p in periods:
-            model.Add(
-                sum(TA.get((tid, c, p), 0) for c in (teachers[tid].get("can_teach") or []) if (tid, c, p) in TA)
-                <= 1
-            )
+            seats = [SA[(sid, c, p)] for c in modeled if (sid, c, p) in SA]
+            if seats:
+                model.AddAtMostOne(seats)
 
-    # 8. Student can only be in (course, period) if that section is open (size > 0)
+    # 3. Section size = number of students in (course, period)
+    for (c, p), sz_var in size_vars.items():
+        model.Add(sz_var == sum(SA[(sid, c, p)] for sid in index.course_students[c]))
+
+    # 8. Student can only be in (course, period) if that section is open (size > 0).
+    # Closed sections have size 0 (constraint 5), so this is SA => section_active.
     for (sid, c, p), var in SA.items():
-        model.Add(size_vars[(c, p)] >= 1).OnlyEnforceIf(var)
+        model.AddImplication(var, section_active[(c, p)])
 
     # 9. Hard: total assignments = n_students * courses_per_student (if set)
     target = getattr(cfg, "courses_per_student_target", None)
     if target is not None:
-        model.Add(sum(SA.values()) == n_students * target)
+        model.Add(sum(SA.values()) == len(students) * target)
 
-    # --- Optional symmetry breaking: for each course, prefer "earlier" periods first ---
-    if get_config().symmetry_break_per_course:
-        for c in courses:
-            for i in range(len(periods) - 1):
-                model.Add(size_vars[(c, periods[i])] >= size_vars[(c, periods[i + 1])])
-
-    # --- Objective: maximize assignments, then minimize deviation from ideal size ---
-    total_assigned = sum(SA.values())
-    dev_vars = []
-    for (c, p), sz in size_vars.items():
-        _, ideal, _ = _course_cap(c, teachers, cfg)
-        dev = model.NewIntVar(0, cfg.global_max_class_size, f"DEV_{c}_{p}")
-        model.AddAbsEquality(dev, sz - ideal)
-        dev_vars.append(dev)
-    # Prioritize assignments; secondary minimize size deviation
-    model.Maximize(total_assigned * 10000 - sum(dev_vars))
+    dev_vars = _set_objective(model, sum(SA.values()), size_vars, index, cfg)
+
+    if hints is not None:
+        sizes: Dict[Tuple[str, str], int] = {}
+        for key, var in SA.items():
+            on = key in hints.students
+            model.AddHint(var, int(on))
+            if on:
+                sizes[key[1:]] = sizes.get(key[1:], 0) + 1
+        _hint_sections(model, hints, sizes, TA, size_vars, section_active, dev_vars, index)
 
     return model, SA, TA, size_vars
+
+
+def build_cohort_model(
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    *,
+    off_timetable_courses: Optional[List[str]] = None,
+    hints: Optional[Hints] = None,
+    presolved: Optional["Presolve"] = None,
+    pool: Optional[bool] = None,
+) -> Tuple[cp_model.CpModel, Dict, Dict, Dict, List[Cohort]]:
+    """
+    Aggregated formulation: students with identical request sets form one cohort.
+    Returns (model, CX, TA, size_vars, cohorts).
+    CX[(k, course, period)] = how many students of cohorts[k] take course in period.
+    Teacher and section variables are the same as in build_model; use split_cohorts
+    to turn the CX values back into per-student assignments.
+    hints: previous assignments; CX is hinted with the count of hinted members.
+    presolved, pool: as in build_model.
+    """
+    cfg = get_config()
+    periods = cfg.periods
+    if presolved is not None:
+        index = presolved.index
+    else:
+        index = build_index(students, teachers, off_timetable_courses=off_timetable_courses)
+    if pool is None:
+        pool = cfg.solver_pool_teachers
+    if pool:
+        index = pool_teachers(index, teachers)
+    cohorts = group_cohorts(index.student_courses)
+
+    model = cp_model.CpModel()
+
+    # Cohort counts: how many members of cohort k take course c in period p
+    CX: Dict[Tuple[int, str, str], cp_model.IntVar] = {}
+    for k, cohort in enumerate(cohorts):
+        n = len(cohort.student_ids)
+        for c in cohort.courses:
+            ub = min(n, index.caps[c][2])
+            for p in index.course_periods[c]:
+                CX[(k, c, p)] = model.NewIntVar(0, ub, f"CX_{k}_{c}_{p}")
+
+    TA, size_vars, section_active = _add_sections(model, index, teachers, cfg)
+    if presolved is not None:
+        _add_presolve_bounds(model, presolved, size_vars, section_active)
+
+    # --- Hard constraints (4-7 are added by _add_sections) ---
+    # Row/column sums <= cohort size guarantee the counts split into clash-free
+    # individual schedules (bipartite edge colouring), so 1 and 2 stay exact.
+    for k, cohort in enumerate(cohorts):
+        n = len(cohort.student_ids)
+        # 1. Each member takes each course at most once
+        for c in cohort.courses:
+            model.Add(sum(CX[(k, c, p)] for p in index.course_periods[c]) <= n)
+        # 2. Each member takes at most one course per period
+        for p in periods:
+            seats = [CX[(k, c, p)] for c in cohort.courses if (k, c, p) in CX]
+            if seats:
+                model.Add(sum(seats) <= n)
+
+    # 3. Section size = number of students in (course, period)
+    course_cohorts: Dict[str, List[int]] = {c: [] for c in index.courses}
+    for k, cohort in enumerate(cohorts):
+        for c in cohort.courses:
+            course_cohorts[c].append(k)
+    for (c, p), sz_var in size_vars.items():
+        model.Add(sz_var == sum(CX[(k, c, p)] for k in course_cohorts[c]))
+
+    # 8. Students only in open sections
+    for (k, c, p), var in CX.items():
+        model.Add(var == 0).OnlyEnforceIf(section_active[(c, p)].Not())
+
+    # 9. Hard: total assignments = n_students * courses_per_student (if set)
+    target = getattr(cfg, "courses_per_student_target", None)
+    if target is not None:
+        model.Add(sum(CX.values()) == len(students) * target)
+
+    dev_vars = _set_objective(model, sum(CX.values()), size_vars, index, cfg)
+
+    if hints is not None:
+        cohort_of = {sid: k for k, cohort in enumerate(cohorts) for sid in cohort.student_ids}
+        counts: Dict[Tuple[int, str, str], int] = {}
+        for sid, c, p in hints.students:
+            key = (cohort_of.get(sid), c, p)
+            if key in CX:
+                counts[key] = counts.get(key, 0) + 1
+        sizes: Dict[Tuple[str, str], int] = {}
+        for key, var in CX.items():
+            model.AddHint(var, counts.get(key, 0))
+            sizes[key[1:]] = sizes.get(key[1:], 0) + counts.get(key, 0)
+        _hint_sections(model, hints, sizes, TA, size_vars, section_active, dev_vars, index)
+
+    return model, CX, TA, size_vars, cohorts
@@ -0,0 +1,162 @@
+"""
+Fast placement queries on a solved schedule (late enrollments, request changes at the front office).
+Keeps per-section remaining capacity and per-student period occupancy, and answers
+"best clash-free placement for this request list" with a small exact search.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
+
+from scheduler.config import get_config
+from scheduler.solver.hints import hints_from_schedule
+from scheduler.solver.model import build_index
+from scheduler.solver.sectioning import match_periods
+
+
+@dataclass
+class Placement:
+    """Answer to a placement query. blocked maps each unplaced course to the reason."""
+    periods: Dict[str, str] = field(default_factory=dict)  # course -> period
+    blocked: Dict[str, str] = field(default_factory=dict)  # course -> reason
+    off_timetable: List[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return not self.blocked
+
+    def summary(self) -> str:
+        block = get_config().off_timetable_block
+        lines = [f"  {p}: {c}" for c, p in sorted(self.periods.items(), key=lambda cp: cp[1])]
+        lines += [f"  {block}: {c}" for c in self.off_timetable]
+        lines += [f"  BLOCKED {c}: {reason}" for c, reason in self.blocked.items()]
+        return "\n".join(lines) if lines else "  (no requests)"
+
+
+class PlacementIndex:
+    """
+    Index over a solved schedule. Build once (O(seats)); each place() is a search over at most
+    len(periods) sections per requested course.
+    """
+
+    def __init__(
+        self,
+        schedule: Dict[str, Dict[str, Dict[str, Any]]],
+        students: Dict[int, Dict[str, Any]],
+        teachers: Dict[str, Dict[str, Any]],
+        *,
+        off_timetable_courses: Optional[List[str]] = None,
+    ) -> None:
+        cfg = get_config()
+        self.schedule = schedule
+        self.students = students
+        self.periods = list(cfg.periods)
+        self.off = set(off_timetable_courses or cfg.off_timetable_courses)
+        caps = build_index(students, teachers, off_timetable_courses=list(self.off)).caps
+
+        # (course, period) -> remaining seats; course -> periods with an open section
+        self.remaining: Dict[Tuple[str, str], int] = {}
+        self.course_periods: Dict[str, List[str]] = {}
+        for p, courses in schedule.items():
+            for c, info in courses.items():
+                if not info.get("teachers"):
+                    continue
+                max_cap = caps[c][2] if c in caps else cfg.global_max_class_size
+                self.remaining[(c, p)] = max_cap - len(info.get("students") or [])
+                self.course_periods.setdefault(c, []).append(p)
+        # sid -> period -> course
+        self.occupancy: Dict[int, Dict[str, str]] = {}
+        for sid, c, p in hints_from_schedule(schedule, students, teachers).students:
+            self.occupancy.setdefault(sid, {})[p] = c
+
+    def place(
+        self,
+        requests: List[str],
+        *,
+        student_id: Optional[int] = None,
+        keep: Optional[List[str]] = None,
+    ) -> Placement:
+        """
+        Best clash-free placement: as many requested courses as possible, then the roomiest sections.
+        student_id: an enrolled student whose current seats are released for this query.
+        keep: courses of that student to leave in their current period.
+        """
+        result = Placement()
+        current = dict(self.occupancy.get(student_id, {})) if student_id is not None else {}
+        released = {(c, p) for p, c in current.items()}
+        kept = {p: c for p, c in current.items() if keep and c in keep}
+
+        courses: List[str] = []
+        for c in dict.fromkeys(requests):
+            if c in self.off:
+                result.off_timetable.append(c)
+            elif c in kept.values():
+                result.periods[c] = next(p for p, kc in kept.items() if kc == c)
+            else:
+                courses.append(c)
+
+        def room(c: str, p: str) -> int:
+            return self.remaining.get((c, p), 0) + ((c, p) in released)
+
+        options: Dict[str, List[str]] = {}
+        for c in courses:
+            periods = [p for p in self.course_periods.get(c, []) if room(c, p) > 0 and p not in kept]
+            options[c] = sorted(periods, key=lambda p: -room(c, p))
+
+        # Max cardinality first (matching), then exact search for the roomiest placement of that size
+        target = len(match_periods(courses, options))
+        order = sorted(courses, key=lambda c: len(options[c]))
+        best: Dict[str, Any] = {"score": None, "periods": {}}
+
+        def search(i: int, used: Dict[str, str], placed: int, slack: int) -> None:
+            if placed + (len(order) - i) < target:
+                return
+            if i == len(order):
+                if best["score"] is None or slack > best["score"]:
+                    best["score"], best["periods"] = slack, {c: p for p, c in used.items()}
+                return
+            c = order[i]
+            for p in options[c]:
+                if p in used:
+                    continue
+                used[p] = c
+                search(i + 1, used, placed + 1, slack + room(c, p))
+                del used[p]
+            search(i + 1, used, placed, slack)
+
+        search(0, {}, 0, 0)
+        result.periods.update(best["periods"])
+
+        taken = {p: c for c, p in result.periods.items()}
+        for c in courses:
+            if c in result.periods:
+                continue
+            if not self.course_periods.get(c):
+                result.blocked[c] = "no open section"
+            elif not options[c]:
+                result.blocked[c] = "all sections full"
+            else:
+                clashes = [f"{p} ({taken[p]})" for p in options[c] if p in taken]
+                result.blocked[c] = "clashes with " + ", ".join(clashes)
+        return result
+
+    def book(self, student_id: int, placement: Placement) -> None:
+        """Commit a placement: update the schedule dict, remaining capacity and occupancy."""
+        name = self.students[student_id]["name"]
+        for p, c in list(self.occupancy.get(student_id, {}).items()):
+            info = self.schedule[p][c]
+            ids = info.get("student_ids")
+            if ids is not None and student_id in ids:
+                # Remove by position: names and ids are parallel and names need not be unique
+                del info["students"][ids.index(student_id)]
+                ids.remove(student_id)
+            elif name in info["students"]:
+                info["students"].remove(name)
+            self.remaining[(c, p)] += 1
+        self.occupancy[student_id] = {}
+        for c, p in placement.periods.items():
+            info = self.schedule[p][c]
+            info["students"].append(name)
+            if "student_ids" in info:
+                info["student_ids"].append(student_id)
+            self.remaining[(c, p)] -= 1
+            self.occupancy[student_id][p] = c
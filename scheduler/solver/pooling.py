@@ -0,0 +1,85 @@
+"""
+Interchangeable-teacher pooling: teachers with the same modeled courses, max_sections, room
+capacity and available periods are one pool in the model (one TA variable per pool, course and
+period instead of one per member), which removes the permutation symmetry between them.
+assign_pool_teachers turns pooled sections back into named teachers afterwards.
+"""
+
+from dataclasses import replace
+from typing import TYPE_CHECKING, Dict, List, Any, Iterable, Tuple
+
+from scheduler.config import get_config
+
+if TYPE_CHECKING:
+    from scheduler.solver.model import ModelIndex
+
+
+def pool_teachers(index: "ModelIndex", teachers: Dict[str, Dict[str, Any]]) -> "ModelIndex":
+    """
+    Index in which every group of 2+ interchangeable teachers is replaced by a pool id
+    ("pool:<first member>"); teacher_pools maps pool id -> member ids.
+    """
+    groups: Dict[Tuple, List[str]] = {}
+    for tid, modeled in index.teacher_courses.items():
+        if not modeled:
+            continue
+        t = teachers[tid]
+        key = (
+            tuple(sorted(modeled)),
+            t.get("max_sections"),
+            t.get("room_capacity"),
+            tuple(index.teacher_periods[tid]),
+        )
+        groups.setdefault(key, []).append(tid)
+
+    pool_of: Dict[str, str] = {}
+    teacher_pools: Dict[str, List[str]] = {}
+    for members in groups.values():
+        if len(members) > 1:
+            pool = f"pool:{members[0]}"
+            teacher_pools[pool] = members
+            pool_of.update((tid, pool) for tid in members)
+    if not teacher_pools:
+        return index
+
+    teacher_courses: Dict[str, List[str]] = {}
+    teacher_periods: Dict[str, List[str]] = {}
+    for tid, modeled in index.teacher_courses.items():
+        unit = pool_of.get(tid, tid)
+        teacher_courses.setdefault(unit, modeled)
+        teacher_periods.setdefault(unit, index.teacher_periods[tid])
+    course_teachers = {
+        c: list(dict.fromkeys(pool_of.get(tid, tid) for tid in tids)) for c, tids in index.course_teachers.items()
+    }
+    return replace(
+        index,
+        course_teachers=course_teachers,
+        teacher_courses=teacher_courses,
+        teacher_periods=teacher_periods,
+        teacher_pools=teacher_pools,
+    )
+
+
+def assign_pool_teachers(
+    teacher_assignments: Iterable[Tuple[str, str, str]],
+    teacher_pools: Dict[str, List[str]],
+) -> List[Tuple[str, str, str]]:
+    """
+    Replace pooled (pool, course, period) assignments with named (tid, course, period).
+    Round-robin over the pool's sections in period order: the model allows at most len(members)
+    sections per period and len(members) * max_sections in total, so members never clash and
+    each gets at most max_sections.
+    """
+    order = {p: i for i, p in enumerate(get_config().periods)}
+    named: List[Tuple[str, str, str]] = []
+    pooled: Dict[str, List[Tuple[str, str]]] = {}
+    for tid, c, p in teacher_assignments:
+        if tid in teacher_pools:
+            pooled.setdefault(tid, []).append((c, p))
+        else:
+            named.append((tid, c, p))
+    for pool, sections in pooled.items():
+        members = teacher_pools[pool]
+        sections.sort(key=lambda cp: (order.get(cp[1], len(order)), cp[0]))
+        named.extend((members[i % len(members)], c, p) for i, (c, p) in enumerate(sections))
+    return named
@@ -0,0 +1,147 @@
+"""
+Presolve: bounds derived from demand, class sizes and teacher loads before the CP-SAT build.
+Drops courses that can never run and teacher/period pairs that can never be used, tightens
+section size domains, and hands the model builders per-course section-count and demand bounds
+to post as redundant constraints.
+"""
+
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Any, Optional, Tuple
+
+from scheduler.config import get_config
+from scheduler.solver.model import ModelIndex
+
+# Per-section constraints in build_model: size link (3), one teacher (4), activity/size
+# links (5, six constraints) and the deviation AbsEquality.
+_SECTION_CONSTRAINTS = 9
+
+
+@dataclass
+class Presolve:
+    """
+    Pruned index plus per-course bounds. min_sections (sections needed to seat every request)
+    is reported only: assignments are soft, so it is not a valid constraint.
+    """
+    index: ModelIndex
+    demand: Dict[str, int] = field(default_factory=dict)
+    min_sections: Dict[str, int] = field(default_factory=dict)
+    max_sections: Dict[str, int] = field(default_factory=dict)
+    closed_courses: List[str] = field(default_factory=list)
+    removed_vars: int = 0
+    removed_constraints: int = 0
+    added_constraints: int = 0
+    tightened_domains: int = 0
+
+    def summary(self) -> str:
+        lines = [
+            f"Presolve: removed {self.removed_vars} variables and {self.removed_constraints} constraints, "
+            f"tightened {self.tightened_domains} size domains, added {self.added_constraints} redundant bounds."
+        ]
+        if self.closed_courses:
+            lines.append(f"  Cannot run (demand below minimum size or no usable teacher): {', '.join(self.closed_courses)}")
+        short = [c for c in self.index.courses if self.min_sections[c] > self.max_sections[c]]
+        if short:
+            lines.append(f"  Cannot seat every request (sections needed > possible): {', '.join(short)}")
+        return "\n".join(lines)
+
+
+def _model_size(index: ModelIndex, periods: List[str]) -> Tuple[int, int]:
+    """(variables, constraints) of build_model's formulation for an index."""
+    sections = sum(len(index.course_periods[c]) for c in index.courses)
+    seats = sum(len(index.course_periods[c]) for cs in index.student_courses.values() for c in cs)
+    teacher_slots = sum(
+        1
+        for tid, cs in index.teacher_courses.items()
+        for c in cs
+        for p in index.teacher_periods[tid]
+        if p in index.course_periods[c]
+    )
+    variables = seats + teacher_slots + 3 * sections  # SA, TA, size / active / dev
+    constraints = (
+        sum(len(cs) for cs in index.student_courses.values())  # 1
+        + sum(len(periods) for cs in index.student_courses.values() if cs)  # 2
+        + _SECTION_CONSTRAINTS * sections
+        + seats  # 8
+        + sum(1 + len(index.teacher_periods[tid]) for tid, cs in index.teacher_courses.items() if cs)  # 6, 7
+    )
+    return variables, constraints
+
+
+def presolve(
+    index: ModelIndex,
+    teachers: Dict[str, Dict[str, Any]],
+    cfg: Optional[Any] = None,
+) -> Presolve:
+    """
+    Prune an index from build_index (the input is not modified; it already leaves out periods
+    where teachers are unavailable).
+    Per course: demand = number of requests; max sections = min(usable periods,
+    demand // min size, sum over qualified teachers of min(max_sections, usable periods));
+    max size = min(max size, demand). Courses with max sections 0 are dropped, as are
+    teachers with no sections to give.
+    """
+    cfg = cfg or get_config()
+    periods = list(cfg.periods)
+
+    def load(tid: str) -> int:
+        return teachers[tid].get("max_sections", cfg.max_teacher_sections)
+
+    teacher_periods = {tid: list(ps) if load(tid) > 0 else [] for tid, ps in index.teacher_periods.items()}
+    course_teachers = {
+        c: [tid for tid in tids if teacher_periods.get(tid)] for c, tids in index.course_teachers.items()
+    }
+    course_periods = {
+        c: [p for p in index.course_periods[c] if any(p in teacher_periods[tid] for tid in course_teachers[c])]
+        for c in index.courses
+    }
+
+    result = Presolve(index=index)
+    caps: Dict[str, Tuple[int, int, int]] = {}
+    for c in index.courses:
+        min_cap, ideal, max_cap = index.caps[c]
+        demand = len(index.course_students[c])
+        usable = course_periods[c]
+        staffed = sum(
+            min(load(tid), sum(1 for p in usable if p in teacher_periods[tid])) for tid in course_teachers[c]
+        )
+        bound = min(len(usable), staffed, demand // min_cap if min_cap > 0 else len(usable))
+        if demand < min_cap:
+            bound = 0
+        if bound == 0:
+            result.closed_courses.append(c)
+            continue
+        if demand < max_cap:
+            result.tightened_domains += len(usable)
+        caps[c] = (min_cap, ideal, min(max_cap, demand))
+        result.demand[c] = demand
+        result.max_sections[c] = bound
+        result.min_sections[c] = -(-demand // caps[c][2])
+        result.added_constraints += int(bound < len(usable)) + int(demand < len(usable) * caps[c][2])
+
+    courses = [c for c in index.courses if c in caps]
+    kept = set(courses)
+    result.index = ModelIndex(
+        courses=courses,
+        caps=caps,
+        course_students={c: index.course_students[c] for c in courses},
+        student_courses={sid: [c for c in cs if c in kept] for sid, cs in index.student_courses.items()},
+        course_teachers={c: course_teachers[c] for c in courses},
+        teacher_courses={
+            tid: [c for c in cs if c in kept] if teacher_periods[tid] else []
+            for tid, cs in index.teacher_courses.items()
+        },
+        course_periods={c: course_periods[c] for c in courses},
+        teacher_periods=teacher_periods,
+    )
+
+    # Measured against every teacher available in every period, so availability pruning counts too
+    everywhere = replace(
+        index,
+        course_periods={c: periods for c in index.courses},
+        teacher_periods={tid: periods for tid in index.teacher_periods},
+    )
+    vars_before, cons_before = _model_size(everywhere, periods)
+    vars_after, cons_after = _model_size(result.index, periods)
+    result.removed_vars = vars_before - vars_after
+    result.removed_constraints = cons_before - cons_after
+    return result
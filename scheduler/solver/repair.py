@@ -0,0 +1,196 @@
+"""
+Post-solve repair: local search that seats unassigned requests on a finished schedule without
+opening, closing or re-timing sections. For each missing (student, course) it tries, in order:
+  direct - an open section of the course in one of the student's free periods, with room;
+  seat   - that section is full: move a classmate to another section of the course that fits
+           them, then take the freed seat;
+  chain  - a section with room clashes with another of the student's courses: move that course
+           to another section (1 step), or into a period freed by moving a third course (2 steps).
+Section sizes are NumPy capacity arrays and each student's busy periods a bitmask, so candidate
+checks are vectorized over a course's sections. Sizes stay within [min, max] and no student is
+ever in two classes in one period.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+import numpy as np
+
+from scheduler.config import get_config
+from scheduler.solver.hints import hints_from_schedule
+from scheduler.solver.model import build_index
+from scheduler.solver.schedule import build_schedule
+
+
+@dataclass
+class RepairResult:
+    """Repaired schedule plus the number of unassigned modeled requests before and after."""
+    schedule: Dict[str, Dict[str, Dict[str, Any]]]
+    unassigned_before: int
+    unassigned_after: int
+    moves: int = 0
+    seconds: float = 0.0
+
+    @property
+    def recovered(self) -> int:
+        return self.unassigned_before - self.unassigned_after
+
+    def summary(self) -> str:
+        return (
+            f"Repair: recovered {self.recovered} of {self.unassigned_before} unassigned requests "
+            f"({self.moves} student moves, {self.seconds:.2f}s)."
+        )
+
+
+def repair_schedule(
+    schedule: Dict[str, Dict[str, Dict[str, Any]]],
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    *,
+    off_timetable_courses: Optional[List[str]] = None,
+    time_limit_seconds: Optional[float] = None,
+) -> RepairResult:
+    """
+    Seat as many unassigned requests as possible within time_limit_seconds (default
+    cfg.solver_repair_seconds). Sections and teachers are unchanged; students only move between
+    sections of courses they already take. Returns the input schedule if nothing was recovered.
+    """
+    cfg = get_config()
+    periods = list(cfg.periods)
+    if len(periods) > 62:
+        raise ValueError(f"Repair supports at most 62 periods, got {len(periods)}.")
+    limit = time_limit_seconds if time_limit_seconds is not None else (cfg.solver_repair_seconds or 0.0)
+    started = time.time()
+    index = build_index(students, teachers, off_timetable_courses=off_timetable_courses)
+    hints = hints_from_schedule(schedule, students, teachers)
+    period_bit = {p: 1 << j for j, p in enumerate(periods)}
+
+    # Sections: (course, period) of the schedule's modeled courses, as parallel arrays
+    keys = sorted({(c, p) for _, c, p in hints.teachers if c in index.caps and p in period_bit})
+    sec_of = {key: i for i, key in enumerate(keys)}
+    min_size = np.array([index.caps[c][0] for c, _ in keys], dtype=np.int32)
+    max_size = np.array([index.caps[c][2] for c, _ in keys], dtype=np.int32)
+    sec_bit = np.array([period_bit[p] for _, p in keys], dtype=np.int64)
+    size = np.zeros(len(keys), dtype=np.int32)
+    members: List[Set[int]] = [set() for _ in keys]
+    course_secs: Dict[str, np.ndarray] = {}
+    for i, (c, _) in enumerate(keys):
+        course_secs.setdefault(c, []).append(i)
+    course_secs = {c: np.array(ids) for c, ids in course_secs.items()}
+
+    row = {sid: r for r, sid in enumerate(index.student_courses)}
+    busy = np.zeros(len(row), dtype=np.int64)
+    placed: Dict[int, Dict[str, int]] = {sid: {} for sid in row}
+    untouched = []  # assignments outside the modeled sections are kept as they are
+    for sid, c, p in hints.students:
+        sec = sec_of.get((c, p))
+        if sec is None or sid not in row or c in placed[sid] or busy[row[sid]] & sec_bit[sec]:
+            untouched.append((sid, c, p))
+            if sid in row and p in period_bit:
+                busy[row[sid]] |= period_bit[p]
+            continue
+        placed[sid][c] = sec
+        members[sec].add(sid)
+        size[sec] += 1
+        busy[row[sid]] |= sec_bit[sec]
+
+    def move(sid: int, c: str, to: int) -> None:
+        frm = placed[sid].get(c)
+        if frm is not None:
+            size[frm] -= 1
+            members[frm].discard(sid)
+            busy[row[sid]] &= ~sec_bit[frm]
+        size[to] += 1
+        members[to].add(sid)
+        busy[row[sid]] |= sec_bit[to]
+        placed[sid][c] = to
+
+    def fits(sid: int, secs: np.ndarray) -> np.ndarray:
+        """secs with room whose period is free for sid, emptiest first."""
+        ok = secs[(size[secs] < max_size[secs]) & ((sec_bit[secs] & busy[row[sid]]) == 0)]
+        return ok[np.argsort(size[ok], kind="stable")]
+
+    def holder(sid: int, bit: int) -> Optional[Tuple[str, int]]:
+        """The student's movable (course, section) in the period with this bit, if any."""
+        return next(((d, sec) for d, sec in placed[sid].items() if sec_bit[sec] == bit), None)
+
+    def direct(sid: int, c: str) -> int:
+        ok = fits(sid, course_secs[c])
+        if not ok.size:
+            return 0
+        move(sid, c, ok[0])
+        return 1
+
+    def seat(sid: int, c: str) -> int:
+        secs = course_secs[c]
+        full = secs[(size[secs] >= max_size[secs]) & ((sec_bit[secs] & busy[row[sid]]) == 0)]
+        for sec in full:
+            others = secs[(secs != sec) & (size[secs] < max_size[secs])]
+            if not others.size:
+                return 0
+            classmates = np.array(sorted(members[sec]))
+            # free[i, j]: classmate i is free in others[j]'s period
+            free = (busy[[row[x] for x in classmates]][:, None] & sec_bit[others][None, :]) == 0
+            hit = np.argwhere(free)
+            if hit.size:
+                i, j = hit[0]
+                move(int(classmates[i]), c, others[j])
+                move(sid, c, sec)
+                return 2
+        return 0
+
+    def chain(sid: int, c: str) -> int:
+        secs = course_secs[c]
+        blocked = secs[(size[secs] < max_size[secs]) & ((sec_bit[secs] & busy[row[sid]]) != 0)]
+        for sec in blocked:
+            held = holder(sid, int(sec_bit[sec]))
+            if held is None or size[held[1]] <= min_size[held[1]]:
+                continue
+            d, ds = held
+            d_secs = course_secs[d]
+            ok = fits(sid, d_secs)
+            if ok.size:
+                move(sid, d, ok[0])
+                move(sid, c, sec)
+                return 2
+            # 2 steps: d goes to a section whose period is held by e, e goes to a free period
+            d_blocked = d_secs[(d_secs != ds) & (size[d_secs] < max_size[d_secs])]
+            for q in d_blocked:
+                held = holder(sid, int(sec_bit[q]))
+                if held is None or size[held[1]] <= min_size[held[1]]:
+                    continue
+                e = held[0]
+                ok = fits(sid, course_secs[e])
+                if ok.size:
+                    move(sid, e, ok[0])
+                    move(sid, d, q)
+                    move(sid, c, sec)
+                    return 3
+        return 0
+
+    def missing() -> List[Tuple[int, str]]:
+        return [(sid, c) for sid, cs in index.student_courses.items() for c in cs if c not in placed[sid]]
+
+    before = len(missing())
+    moves = 0
+    progress = True
+    while progress and time.time() - started < limit:
+        progress = False
+        # Courses with the fewest sections first: they have the fewest ways in
+        todo = sorted(
+            ((sid, c) for sid, c in missing() if c in course_secs), key=lambda sc: len(course_secs[sc[1]])
+        )
+        for sid, c in todo:
+            if time.time() - started >= limit:
+                break
+            made = direct(sid, c) or seat(sid, c) or chain(sid, c)
+            moves += made
+            progress = progress or made > 0
+
+    result = RepairResult(schedule=schedule, unassigned_before=before, unassigned_after=len(missing()), moves=moves)
+    if result.recovered:
+        assignments = untouched + [(sid, keys[sec][0], keys[sec][1]) for sid, cs in placed.items() for sec in cs.values()]
+        result.schedule = build_schedule(students, teachers, sorted(assignments), sorted(hints.teachers), periods=periods)
+    result.seconds = time.time() - started
+    return result
@@ -0,0 +1,40 @@
+"""
+Schedule dict helpers: period -> course -> {"students", "student_ids", "teachers", "teacher_ids"}.
+"""
+
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+from scheduler.config import get_config
+
+
+def _section() -> Dict[str, List[Any]]:
+    return {"students": [], "student_ids": [], "teachers": [], "teacher_ids": []}
+
+
+def build_schedule(
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    student_assignments: Iterable[Tuple[int, str, str]],
+    teacher_assignments: Iterable[Tuple[str, str, str]],
+    *,
+    periods: Optional[List[str]] = None,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Turn (sid, course, period) and (tid, course, period) assignments into the schedule dict.
+    Schedule: period -> course -> {"students": [names], "student_ids": [sids], "teachers": [names],
+    "teacher_ids": [tids]}; the id lists run parallel to the name lists (names need not be unique).
+    """
+    periods = periods or get_config().periods
+    schedule: Dict[str, Dict[str, Dict[str, Any]]] = {p: {} for p in periods}
+
+    for sid, c, p in student_assignments:
+        info = schedule[p].setdefault(c, _section())
+        info["students"].append(students[sid]["name"])
+        info["student_ids"].append(sid)
+
+    for tid, c, p in teacher_assignments:
+        info = schedule[p].setdefault(c, _section())
+        info["teachers"].append(teachers[tid]["name"])
+        info["teacher_ids"].append(tid)
+
+    return schedule
@@ -0,0 +1,157 @@
+"""
+Student sectioning: assign students to a fixed set of sections (course, period, teacher).
+Used as stage 2 of the two-stage strategy, and on its own to re-place students after
+request changes without re-timetabling sections.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+from scheduler.config import get_config
+from scheduler.solver.model import build_index
+from scheduler.solver.schedule import build_schedule
+
+
+@dataclass
+class Section:
+    """One open class: course taught by teacher_id in period, with size bounds."""
+    course: str
+    period: str
+    teacher_id: str
+    min_size: int
+    max_size: int
+
+
+def sections_from_schedule(
+    schedule: Dict[str, Dict[str, Dict[str, Any]]],
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    *,
+    off_timetable_courses: Optional[List[str]] = None,
+) -> List[Section]:
+    """Sections of an existing schedule (skips courses that are no longer modeled)."""
+    index = build_index(students, teachers, off_timetable_courses=off_timetable_courses)
+    out: List[Section] = []
+    for p, courses in schedule.items():
+        for c, info in courses.items():
+            tids = [tid for tid in (info.get("teacher_ids") or []) if tid in teachers]
+            if c not in index.caps or not tids:
+                continue
+            min_cap, _, max_cap = index.caps[c]
+            out.append(Section(course=c, period=p, teacher_id=tids[0], min_size=min_cap, max_size=max_cap))
+    return out
+
+
+def match_periods(
+    courses: List[str],
+    options: Dict[str, List[str]],
+) -> Dict[str, str]:
+    """
+    Maximum matching of requested courses to distinct periods (Kuhn's augmenting paths).
+    options[c] lists candidate periods for course c, best first. Returns course -> period.
+    """
+    period_owner: Dict[str, str] = {}
+
+    def augment(c: str, seen: Set[str]) -> bool:
+        for p in options.get(c, []):
+            if p in seen:
+                continue
+            seen.add(p)
+            if p not in period_owner or augment(period_owner[p], seen):
+                period_owner[p] = c
+                return True
+        return False
+
+    # Scarcest courses first so they get first pick of periods
+    for c in sorted(courses, key=lambda c: len(options.get(c, []))):
+        augment(c, set())
+    return {c: p for p, c in period_owner.items()}
+
+
+def assign_students(
+    sections: List[Section],
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    *,
+    off_timetable_courses: Optional[List[str]] = None,
+) -> Tuple[Set[Tuple[int, str, str]], List[Section]]:
+    """
+    Assign each student to clash-free sections of their requested courses, respecting
+    max_size. Sections that end below min_size are closed and their students re-placed.
+    Returns (student assignments (sid, course, period), sections kept open).
+    """
+    index = build_index(students, teachers, off_timetable_courses=off_timetable_courses)
+    open_sections: Dict[Tuple[str, str], Section] = {}
+    for sec in sections:
+        if sec.course in index.caps:
+            open_sections.setdefault((sec.course, sec.period), sec)
+
+    enrolled: Dict[Tuple[str, str], Set[int]] = {key: set() for key in open_sections}
+    placed: Dict[int, Dict[str, str]] = {sid: {} for sid in index.student_courses}
+    periods_by_course: Dict[str, List[str]] = {}
+    for c, p in open_sections:
+        periods_by_course.setdefault(c, []).append(p)
+
+    def place(sid: int) -> None:
+        # Release own seats, then re-match against current free capacity (never loses a seat).
+        for c, p in placed[sid].items():
+            enrolled[(c, p)].discard(sid)
+        options: Dict[str, List[str]] = {}
+        for c in index.student_courses[sid]:
+            free = [
+                p for p in periods_by_course.get(c, [])
+                if len(enrolled[(c, p)]) < open_sections[(c, p)].max_size
+            ]
+            # Emptiest section first keeps sizes balanced
+            options[c] = sorted(free, key=lambda p: len(enrolled[(c, p)]))
+        placed[sid] = match_periods(index.student_courses[sid], options)
+        for c, p in placed[sid].items():
+            enrolled[(c, p)].add(sid)
+
+    def scarcity(sid: int) -> Tuple[int, int]:
+        courses = index.student_courses[sid]
+        fewest = min((len(periods_by_course.get(c, [])) for c in courses), default=0)
+        return fewest, -len(courses)
+
+    order = sorted(index.student_courses, key=scarcity)
+    for sid in order:
+        place(sid)
+    # Second pass: students missing requests may now fit via their own augmenting paths
+    for sid in order:
+        if len(placed[sid]) < len(index.student_courses[sid]):
+            place(sid)
+
+    # Close undersized sections one at a time (smallest first) and re-place their students
+    while True:
+        under = [
+            key for key, sids in enrolled.items()
+            if len(sids) < open_sections[key].min_size
+        ]
+        if not under:
+            break
+        key = min(under, key=lambda k: len(enrolled[k]))
+        displaced = sorted(enrolled.pop(key), key=scarcity)
+        del open_sections[key]
+        periods_by_course[key[0]].remove(key[1])
+        for sid in displaced:
+            del placed[sid][key[0]]
+        for sid in displaced:
+            place(sid)
+
+    assignments = {(sid, c, p) for sid, sched in placed.items() for c, p in sched.items()}
+    return assignments, list(open_sections.values())
+
+
+def schedule_from_sections(
+    sections: List[Section],
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    *,
+    off_timetable_courses: Optional[List[str]] = None,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Run stage 2 on fixed sections and return the schedule dict."""
+    assignments, kept = assign_students(
+        sections, students, teachers, off_timetable_courses=off_timetable_courses
+    )
+    teacher_assignments = [(sec.teacher_id, sec.course, sec.period) for sec in kept]
+    return build_schedule(students, teachers, sorted(assignments), teacher_assignments, periods=get_config().periods)
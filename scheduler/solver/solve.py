@@ -2,53 +2,556 @@
 Run the CP-SAT solver and return a schedule structure.
 """
 
-from typing import Dict, List, Any, Optional
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, List, Any, Optional, Tuple
 
 from ortools.sat.python import cp_model
 
-from scheduler.config import get_config
-from scheduler.solver.model import build_model
+from scheduler.config import SchedulerConfig, get_config, set_config, using_config
+from scheduler.profiling import phase, record_model, record_solve
+from scheduler.solver.model import ModelIndex, add_deviation, build_model, build_cohort_model, build_index, schedule_objective
+from scheduler.solver.anytime import INTERRUPTED, SolutionCallback, SolveTrace, TracePoint, solve_interruptible
+from scheduler.solver.artifact import save_model
+from scheduler.solver.cohort import Cohort, split_cohorts
+from scheduler.solver.decompose import Component, split_components
+from scheduler.solver.greedy import greedy_hints, greedy_schedule
+from scheduler.solver.hints import Hints, hints_from_schedule
+from scheduler.solver.pooling import assign_pool_teachers, pool_teachers
+from scheduler.solver.presolve import Presolve, presolve
+from scheduler.solver.repair import repair_schedule
+from scheduler.solver.schedule import build_schedule
+from scheduler.solver.sectioning import sections_from_schedule, schedule_from_sections
+from scheduler.solver.store import StoredResult, evict, load_result, result_key, store_result
+from scheduler.solver.util import new_solver
 
+# "monolithic": one boolean per (student, course, period).
+# "aggregated": identical request sets share integer count variables (see cohort.py).
+# "two_stage": timetable sections on the cohort model, then section students by matching
+#              (stage 2 can be rerun alone via sectioning.schedule_from_sections).
+# "greedy": constructive heuristic only, no CP-SAT (quick drafts; see greedy.py).
+STRATEGIES = ("monolithic", "aggregated", "two_stage", "greedy")
+# See DEFAULT_SOLVER_OBJECTIVE in config.py.
+OBJECTIVES = ("weighted", "lexicographic")
 
-def solve(
+Schedule = Dict[str, Dict[str, Dict[str, Any]]]
+
+
+@dataclass
+class SolveResult:
+    """Schedule (None if no feasible one was found) plus the convergence trace of the solve."""
+    schedule: Optional[Schedule]
+    trace: List[TracePoint] = field(default_factory=list)
+    status: Optional[str] = None  # CP-SAT status name, INTERRUPTED, or None (greedy strategy)
+    reused: bool = False  # returned from the result store without solving
+
+
+def time_budget(num_vars: int, cfg: SchedulerConfig) -> float:
+    """Default time limit for a model with num_vars decision variables (SA/CX + TA)."""
+    seconds = cfg.solver_seconds_per_1000_vars * num_vars / 1000
+    return min(cfg.solver_max_time_seconds, max(cfg.solver_min_time_seconds, seconds))
+
+
+@dataclass
+class _RunSpec:
+    """Per-run settings threaded through single and per-component solves (picklable)."""
+    off: List[str]
+    time_limit: Optional[float]  # None = time_budget() of the built model
+    strategy: str
+    cfg: SchedulerConfig
+    hints: Optional[Hints] = None
+    checkpoint_dir: Optional[str] = None
+    trace: Optional[SolveTrace] = None
+    save_model_dir: Optional[str] = None
+
+
+@dataclass
+class _BuiltModel:
+    """A built formulation and what is needed to read a schedule back out of it."""
+    strategy: str
+    model: cp_model.CpModel
+    student_vars: Dict  # SA (monolithic) or CX (cohort formulations)
+    TA: Dict
+    size_vars: Dict
+    cohorts: Optional[List[Cohort]] = None
+    teacher_pools: Dict[str, List[str]] = field(default_factory=dict)  # TA keys that are pools
+
+
+def _build(
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    spec: _RunSpec,
+    presolved: Optional[Presolve] = None,
+) -> _BuiltModel:
+    if spec.strategy in ("aggregated", "two_stage"):
+        model, CX, TA, size_vars, cohorts = build_cohort_model(
+            students, teachers, off_timetable_courses=spec.off, hints=spec.hints, presolved=presolved
+        )
+        return _BuiltModel(spec.strategy, model, CX, TA, size_vars, cohorts)
+    model, SA, TA, size_vars = build_model(
+        students, teachers, off_timetable_courses=spec.off, hints=spec.hints, presolved=presolved
+    )
+    return _BuiltModel(spec.strategy, model, SA, TA, size_vars)
+
+
+def _extract(
+    built: _BuiltModel,
+    value: Callable[[Any], int],
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    spec: _RunSpec,
+) -> Schedule:
+    """Schedule from variable values (solver.Value after solving, or callback.Value during search)."""
+    periods = spec.cfg.periods
+    teacher_assignments = assign_pool_teachers(
+        (key for key, var in built.TA.items() if value(var)), built.teacher_pools
+    )
+    if built.strategy == "two_stage":
+        # Stage 1 fixed course/teacher/period per section; stage 2 places individual students.
+        timetable = build_schedule(students, teachers, [], teacher_assignments, periods=periods)
+        sections = sections_from_schedule(timetable, students, teachers, off_timetable_courses=spec.off)
+        return schedule_from_sections(sections, students, teachers, off_timetable_courses=spec.off)
+    if built.strategy == "aggregated":
+        counts = {key: value(var) for key, var in built.student_vars.items()}
+        student_assignments = split_cohorts(built.cohorts, counts)
+    else:
+        student_assignments = [key for key, var in built.student_vars.items() if value(var)]
+    return build_schedule(students, teachers, sorted(student_assignments), teacher_assignments, periods=periods)
+
+
+def _new_callback(
+    built: _BuiltModel,
+    index: ModelIndex,
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    spec: _RunSpec,
+    trace_source: str = "cp_sat",
+    stop_when_all_assigned: bool = True,
+    soft_limit_seconds: Optional[float] = None,
+) -> SolutionCallback:
+    """
+    stop_when_all_assigned=False for lexicographic pass 2, which is floored at pass 1's count anyway.
+    soft_limit_seconds: stop there if a solution exists (lexicographic pass 1's share of the time).
+    """
+    cfg = spec.cfg
+    return SolutionCallback(
+        lambda value: _extract(built, value, students, teachers, spec),
+        students,
+        teachers,
+        checkpoint_dir=spec.checkpoint_dir,
+        interval=cfg.checkpoint_interval_seconds,
+        plateau_seconds=cfg.solver_plateau_seconds,
+        # SA values are 0/1 and CX values are seat counts, so the sum is the number of assigned seats
+        assigned=lambda value: sum(value(var) for var in built.student_vars.values()),
+        all_assigned_target=(
+            sum(len(cs) for cs in index.student_courses.values())
+            if cfg.solver_stop_when_all_assigned and stop_when_all_assigned
+            else None
+        ),
+        trace=spec.trace,
+        trace_source=trace_source,
+        soft_limit_seconds=soft_limit_seconds,
+        open_sections=lambda value: sum(1 for var in built.size_vars.values() if value(var) > 0),
+    )
+
+
+def _minimize_deviation(
+    built: _BuiltModel,
+    solver: cp_model.CpSolver,
+    index: ModelIndex,
+    cfg: SchedulerConfig,
+) -> None:
+    """
+    Turn a solved pass-1 (assignments only) model into pass 2: keep at least the assignment
+    count found, hint the whole pass-1 solution, and minimize size deviation.
+    """
+    model = built.model
+    model.Add(sum(built.student_vars.values()) >= int(solver.ObjectiveValue()))
+    solution = list(solver.ResponseProto().solution)
+    model.ClearHints()
+    model.Proto().solution_hint.vars.extend(range(len(solution)))
+    model.Proto().solution_hint.values.extend(solution)
+    dev_vars = add_deviation(model, built.size_vars, index, cfg)
+    for (c, p), dev in dev_vars.items():
+        model.AddHint(dev, abs(solution[built.size_vars[(c, p)].Index()] - index.caps[c][1]))
+    model.Minimize(sum(dev_vars.values()))
+
+
+def _solve_single(
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    spec: _RunSpec,
+) -> Tuple[Optional[Schedule], List[TracePoint], str]:
+    """
+    Build and solve one model; returns the schedule, its trace points and the CP-SAT status name
+    (OPTIMAL only if every pass proved optimality; INTERRUPTED if stopped by a signal). Runs in
+    a worker process when solving components in parallel. Lexicographic pass 1 may use the whole
+    limit to find a first solution; if it finds none, the greedy schedule is returned instead.
+    """
+    cfg = spec.cfg
+    index = build_index(students, teachers, off_timetable_courses=spec.off)
+    presolved = None
+    if cfg.solver_presolve:
+        with phase("presolve"):
+            presolved = presolve(index, teachers, cfg)
+        index = presolved.index
+        print(presolved.summary())
+    if spec.hints is None and cfg.solver_greedy_hint:
+        started = time.time()
+        with phase("greedy_hint"):
+            spec = replace(spec, hints=greedy_hints(students, teachers, off_timetable_courses=spec.off))
+        print(f"Greedy hint: {len(spec.hints.students)} seats in {time.time() - started:.2f}s.")
+    if spec.hints is not None:
+        applied = spec.hints.matched(index.student_courses, index.teacher_courses)
+        print(f"Warm start: applied {applied} of {len(spec.hints)} hinted assignments.")
+    with phase("build_model"):
+        built = _build(students, teachers, spec, presolved)
+    record_model(spec.strategy, built.model)
+    if cfg.solver_pool_teachers:
+        # Same pooling the builders applied; needed to name pooled teachers when extracting
+        index = pool_teachers(index, teachers)
+        built.teacher_pools = index.teacher_pools
+        if index.teacher_pools:
+            pooled = sum(len(members) for members in index.teacher_pools.values())
+            print(f"Pooled {pooled} interchangeable teachers into {len(index.teacher_pools)} pools.")
+    time_limit = spec.time_limit
+    if time_limit is None:
+        num_vars = len(built.student_vars) + len(built.TA)
+        time_limit = time_budget(num_vars, cfg)
+        print(f"Time budget: {time_limit:.0f}s for {num_vars} variables.")
+    lexicographic = cfg.solver_objective == "lexicographic"
+    solver = new_solver(time_limit, cfg)
+    # Lexicographic pass 1 stops at its share of the time, but only once it has a solution
+    callback = _new_callback(
+        built, index, students, teachers, spec,
+        soft_limit_seconds=time_limit * cfg.solver_lex_first_pass_fraction if lexicographic else None,
+    )
+    if spec.save_model_dir is not None:
+        save_model(
+            spec.save_model_dir, built.model, built.student_vars, built.TA, built.size_vars,
+            students=students, teachers=teachers, teacher_pools=built.teacher_pools, periods=cfg.periods,
+            parameters=solver.parameters, meta={"strategy": spec.strategy, "objective": cfg.solver_objective},
+        )
+        print(f"Saved model to {spec.save_model_dir}.")
+
+    with phase("cp_sat"):
+        status = solve_interruptible(solver, built.model, callback)
+    record_solve("pass 1" if lexicographic else spec.strategy, solver, status)
+    if callback.first_solution_seconds is not None:
+        mode = "warm start" if spec.hints is not None else "cold start"
+        print(f"First solution after {callback.first_solution_seconds:.2f}s ({mode}).")
+    if callback.best_assigned is not None:
+        print(
+            f"Best assignment count {callback.best_assigned} reached after "
+            f"{callback.best_assigned_seconds:.2f}s ({cfg.solver_objective} objective)."
+        )
+    if callback.stop_reason is not None:
+        print(f"Stopped early after {solver.WallTime():.1f}s: {callback.stop_reason}.")
+
+    points = spec.trace.points if spec.trace is not None else []
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        if not lexicographic or callback.stop_reason == INTERRUPTED or cfg.courses_per_student_target is not None:
+            return None, points, solver.StatusName(status)
+        # Pass 2 needs a pass-1 solution; the greedy schedule is feasible and beats returning nothing
+        print(
+            f"Pass 1 found no solution in {solver.WallTime():.1f}s ({solver.StatusName(status)}); "
+            "using the greedy schedule."
+        )
+        with phase("greedy"):
+            schedule = greedy_schedule(students, teachers, off_timetable_courses=spec.off)
+        if spec.trace is not None:
+            spec.trace.add("greedy", **_counts(schedule))
+        return schedule, points, "FEASIBLE"
+    # Lexicographic: optimal only once pass 2 has also been proved optimal
+    optimal = status == cp_model.OPTIMAL and not lexicographic
+    interrupted = callback.stop_reason == INTERRUPTED
+    if lexicographic and callback.stop_reason != INTERRUPTED:
+        # Pass 2 gets what pass 1 left, but at least its own share even if pass 1 overran
+        pass_2_limit = max(time_limit - solver.WallTime(), time_limit * (1 - cfg.solver_lex_first_pass_fraction))
+        _minimize_deviation(built, solver, index, cfg)
+        deviation_solver = new_solver(pass_2_limit, cfg)
+        callback = _new_callback(
+            built, index, students, teachers, spec, trace_source="cp_sat_pass_2", stop_when_all_assigned=False
+        )
+        with phase("cp_sat_pass_2"):
+            deviation_status = solve_interruptible(deviation_solver, built.model, callback)
+        record_solve("pass 2", deviation_solver, deviation_status)
+        interrupted = callback.stop_reason == INTERRUPTED
+        # Pass 1's solution stays valid if pass 2 finds nothing in time
+        if deviation_status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            optimal = status == cp_model.OPTIMAL and deviation_status == cp_model.OPTIMAL
+            solver = deviation_solver
+            print(f"Size deviation {solver.ObjectiveValue():.0f} after {solver.WallTime():.1f}s (pass 2).")
+        else:
+            print(
+                f"Pass 2 found no solution in {deviation_solver.WallTime():.1f}s "
+                f"({deviation_solver.StatusName(deviation_status)}); keeping the pass-1 schedule, "
+                "class-size deviation was not minimized."
+            )
+    with phase("extract"):
+        schedule = _extract(built, solver.Value, students, teachers, spec)
+    return schedule, points, "INTERRUPTED" if interrupted else "OPTIMAL" if optimal else "FEASIBLE"
+
+
+def _solve_components(
+    components: List[Component],
+    spec: _RunSpec,
+) -> Tuple[Optional[Schedule], List[TracePoint], str]:
+    """
+    Solve independent components in a process pool and merge their schedules, traces and statuses.
+    Each component's time budget is proportional to its size (the largest gets the full
+    limit when every component has its own process); search workers are split across processes.
+    Without a fixed limit each component gets the time_budget() of its own model.
+    """
+    cfg = spec.cfg
+    n_procs = min(len(components), os.cpu_count() or 1)
+    sub_cfg = replace(cfg, solver_num_workers=max(1, (cfg.solver_num_workers or os.cpu_count() or 1) // n_procs))
+    total = sum(comp.size for comp in components) or 1
+    specs = [
+        replace(
+            spec,
+            cfg=sub_cfg,
+            time_limit=(
+                None if spec.time_limit is None
+                else min(spec.time_limit, max(1.0, spec.time_limit * n_procs * comp.size / total))
+            ),
+            checkpoint_dir=os.path.join(spec.checkpoint_dir, f"component_{i + 1}") if spec.checkpoint_dir else None,
+            trace=SolveTrace(spec.trace.path, spec.trace.start, component=i + 1) if spec.trace is not None else None,
+            save_model_dir=os.path.join(spec.save_model_dir, f"component_{i + 1}") if spec.save_model_dir else None,
+        )
+        for i, comp in enumerate(components)
+    ]
+
+    # Workers read the config through get_config(); set it once per worker process
+    with ProcessPoolExecutor(max_workers=n_procs, initializer=set_config, initargs=(sub_cfg,)) as pool:
+        futures = [
+            pool.submit(_solve_single, comp.students, comp.teachers, sub_spec)
+            for comp, sub_spec in zip(components, specs)
+        ]
+        parts = []
+        for f in futures:
+            # Ctrl-C reaches the workers too; they stop searching and return their best schedule.
+            while True:
+                try:
+                    parts.append(f.result())
+                    break
+                except KeyboardInterrupt:
+                    print("\nInterrupted; waiting for components to return their best schedules...")
+
+    points = [pt for _, part_points, _ in parts for pt in part_points]
+    failed = next((status for part, _, status in parts if part is None), None)
+    if failed is not None:
+        return None, points, failed
+    schedule: Schedule = {p: {} for p in cfg.periods}
+    for part, _, _ in parts:
+        for p, courses in part.items():
+            schedule[p].update(courses)
+    statuses = {status for _, _, status in parts}
+    return schedule, points, "INTERRUPTED" if "INTERRUPTED" in statuses else "OPTIMAL" if statuses == {"OPTIMAL"} else "FEASIBLE"
+
+
+def solve_with_trace(
     students: Dict[int, Dict[str, Any]],
     teachers: Dict[str, Dict[str, Any]],
     *,
     off_timetable_courses: Optional[List[str]] = None,
     time_limit_seconds: Optional[float] = None,
-) -> Optional[Dict[str, Dict[str, Dict[str, Any]]]]:
+    strategy: Optional[str] = None,
+    hints: Optional[Hints] = None,
+    checkpoint_dir: Optional[str] = None,
+    plateau_seconds: Optional[float] = None,
+    relative_gap: Optional[float] = None,
+    stop_when_all_assigned: Optional[bool] = None,
+    objective: Optional[str] = None,
+    greedy_hint: Optional[bool] = None,
+    repair_seconds: Optional[float] = None,
+    trace_path: Optional[str] = None,
+    save_model_dir: Optional[str] = None,
+    result_store_dir: Optional[str] = None,
+    resolve: bool = False,
+) -> SolveResult:
     """
-    Build model, solve, and return schedule.
+    Build model, solve, and return the schedule with its convergence trace.
     Schedule: period -> course -> {"students": [names], "teachers": [names]}.
-    Returns None if status is not OPTIMAL or FEASIBLE.
+    strategy: one of STRATEGIES (default: cfg.solver_strategy).
+    hints: previous assignments to warm-start from (see hints.load_hints).
+    checkpoint_dir: anytime mode; improving schedules are written there (JSON + Excel) at most
+    every cfg.checkpoint_interval_seconds.
+    time_limit_seconds: default cfg.solver_time_seconds, or (None) a budget scaled to model size.
+    objective: "weighted" or "lexicographic" (default: cfg.solver_objective).
+    greedy_hint: warm-start from the greedy schedule when no hints are given (default: cfg.solver_greedy_hint).
+    repair_seconds: post-solve repair time, 0 to skip (default: cfg.solver_repair_seconds).
+    plateau_seconds / relative_gap / stop_when_all_assigned: early stopping; override the
+    cfg.solver_plateau_seconds / solver_relative_gap / solver_stop_when_all_assigned defaults.
+    Independent course groups (no shared student or teacher) are solved as separate
+    models in parallel when cfg.solver_decompose is set.
+    save_model_dir: save the built model there before solving (artifact.save_model; one
+    component_<i> subdirectory per independent component). Monolithic strategy only; with the
+    lexicographic objective the pass-1 model is saved.
+    result_store_dir: reuse a result stored there (store.py) for the same inputs, config, strategy
+    and hints if it was proved optimal or found with at least this time limit; otherwise solve
+    and store the result. resolve: always solve; the better of the new and the stored result is
+    kept in the store and returned. Not used when saving the model.
+    trace_path: also write the trace there as JSON lines while solving (the file is replaced).
+    A reused stored result leaves the file as it is; its "stored" point is only in the result.
+    The trace has one TracePoint per improving CP-SAT solution (time, objective, best bound,
+    assigned requests, open sections), plus the greedy and repair steps when they run.
+    Ctrl-C / SIGTERM stop the search; the best schedule found so far is returned.
+    The schedule is None if status is not OPTIMAL or FEASIBLE.
     """
     cfg = get_config()
-    off = off_timetable_courses or cfg.off_timetable_courses
-    time_limit = time_limit_seconds if time_limit_seconds is not None else cfg.solver_time_seconds
-    
-    model, SA, TA, size_vars = build_model(students, teachers, off_timetable_courses=off)
-    solver = cp_model.CpSolver()
-    solver.parameters.max_time_in_seconds = time_limit
-    if getattr(cfg, "solver_num_workers", 0) > 0:
-        solver.parameters.num_search_workers = cfg.solver_num_workers
+    overrides = {
+        "solver_plateau_seconds": plateau_seconds,
+        "solver_relative_gap": relative_gap,
+        "solver_stop_when_all_assigned": stop_when_all_assigned,
+        "solver_objective": objective,
+        "solver_greedy_hint": greedy_hint,
+        "solver_repair_seconds": repair_seconds,
+    }
+    cfg = replace(cfg, **{k: v for k, v in overrides.items() if v is not None})
+    strategy = strategy or cfg.solver_strategy
+    if cfg.solver_objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective {cfg.solver_objective!r}; expected one of {', '.join(OBJECTIVES)}.")
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown solver strategy {strategy!r}; expected one of {', '.join(STRATEGIES)}.")
+    if save_model_dir is not None and strategy != "monolithic":
+        raise ValueError(f"Saving the model needs the monolithic strategy, not {strategy!r}.")
+    spec = _RunSpec(
+        off=off_timetable_courses or cfg.off_timetable_courses,
+        time_limit=time_limit_seconds if time_limit_seconds is not None else cfg.solver_time_seconds,
+        strategy=strategy,
+        cfg=cfg,
+        hints=hints,
+        checkpoint_dir=checkpoint_dir,
+        trace=SolveTrace(),
+        save_model_dir=save_model_dir,
+    )
+    # This call's overrides apply only while it runs
+    with using_config(cfg):
+        if result_store_dir is None or save_model_dir is not None:
+            return _solve(students, teachers, _with_trace_file(spec, trace_path))
 
-    status = solver.Solve(model)
+        key = result_key(students, teachers, cfg, strategy=strategy, off_timetable_courses=spec.off, hints=hints)
+        stored = None if resolve else load_result(result_store_dir, key)
+        if stored is not None and stored.answers(spec.time_limit):
+            print(f"Reusing stored result ({stored.summary()}).")
+            spec.trace.add("stored", **_counts(stored.schedule))
+            return SolveResult(stored.schedule, spec.trace.points, stored.status, reused=True)
+        spec = _with_trace_file(spec, trace_path)
+        result = _solve(students, teachers, spec)
+        if result.schedule is not None and result.status != "INTERRUPTED":
+            kept = _store(result, students, teachers, spec, result_store_dir, key)
+            if kept.schedule is not result.schedule:
+                # The store kept an earlier, better schedule; return what was persisted
+                return SolveResult(kept.schedule, result.trace, kept.status, reused=True)
+        return result
 
-    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
-        return None
 
-    periods = cfg.periods
-    schedule: Dict[str, Dict[str, Dict[str, Any]]] = {p: {} for p in periods}
+def _with_trace_file(spec: _RunSpec, trace_path: Optional[str]) -> _RunSpec:
+    """spec with a fresh trace that is also written to trace_path (emptied first), once a solve runs."""
+    if trace_path is None:
+        return spec
+    open(trace_path, "w").close()
+    return replace(spec, trace=SolveTrace(trace_path, spec.trace.start))
 
-    for (sid, c, p), var in SA.items():
-        if solver.Value(var):
-            info = schedule[p].setdefault(c, {"students": [], "teachers": [], "teacher_ids": []})
-            info["students"].append(students[sid]["name"])
 
-    for (tid, c, p), var in TA.items():
-        if solver.Value(var):
-            info = schedule[p].setdefault(c, {"students": [], "teachers": [], "teacher_ids": []})
-            info["teachers"].append(teachers[tid]["name"])
-            info["teacher_ids"].append(tid)
+def _solve(
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    spec: _RunSpec,
+) -> SolveResult:
+    """The solve itself: greedy, per component, or one model; then repair."""
+    cfg = spec.cfg
+    if spec.strategy == "greedy":
+        started = time.time()
+        with phase("greedy"):
+            schedule = greedy_schedule(students, teachers, off_timetable_courses=spec.off)
+        print(f"Greedy schedule built in {time.time() - started:.2f}s.")
+        spec.trace.add("greedy", **_counts(schedule))
+        return _repair(schedule, None, students, teachers, spec)
+
+    # A global assignment target couples every student, so components are not independent then.
+    if cfg.solver_decompose and cfg.courses_per_student_target is None:
+        components = split_components(students, teachers, off_timetable_courses=spec.off)
+        if len(components) > 1:
+            print(f"Solving {len(components)} independent components in parallel.")
+            schedule, points, status = _solve_components(components, spec)
+            spec.trace.merge(points)
+            return _repair(schedule, status, students, teachers, spec)
+
+    schedule, _, status = _solve_single(students, teachers, spec)
+    return _repair(schedule, status, students, teachers, spec)
+
+
+def solve(students: Dict[int, Dict[str, Any]], teachers: Dict[str, Dict[str, Any]], **kwargs: Any) -> Optional[Schedule]:
+    """solve_with_trace(...).schedule: the schedule, or None if no feasible one was found."""
+    return solve_with_trace(students, teachers, **kwargs).schedule
+
+
+def _counts(schedule: Schedule) -> Dict[str, int]:
+    """Assigned seats and open sections of a schedule, as TracePoint fields."""
+    sections = [info for courses in schedule.values() for info in courses.values()]
+    return {"assigned": sum(len(info["students"]) for info in sections), "open_sections": len(sections)}
 
-    return schedule
+
+def _repair(
+    schedule: Optional[Schedule],
+    status: Optional[str],
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    spec: _RunSpec,
+) -> SolveResult:
+    """Post-solve repair pass (repair.py), unless disabled or a fixed assignment total is required."""
+    cfg = spec.cfg
+    if schedule is None or not cfg.solver_repair_seconds or cfg.courses_per_student_target is not None:
+        return SolveResult(schedule, spec.trace.points, status)
+    with phase("repair"):
+        result = repair_schedule(
+            schedule, students, teachers, off_timetable_courses=spec.off, time_limit_seconds=cfg.solver_repair_seconds
+        )
+    print(result.summary())
+    spec.trace.add("repair", **_counts(result.schedule))
+    return SolveResult(result.schedule, spec.trace.points, status)
+
+
+def _store(
+    result: SolveResult,
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    spec: _RunSpec,
+    store_dir: str,
+    key: str,
+) -> StoredResult:
+    """Save a finished result in the result store, then evict old entries. Returns the kept entry."""
+    cfg = spec.cfg
+    index = build_index(students, teachers, off_timetable_courses=spec.off)
+    objective = schedule_objective(hints_from_schedule(result.schedule, students, teachers).students, index, cfg.periods)
+    parameters = {
+        "strategy": spec.strategy,
+        "objective": cfg.solver_objective,
+        "num_workers": cfg.solver_num_workers,
+        "plateau_seconds": cfg.solver_plateau_seconds,
+        "relative_gap": cfg.solver_relative_gap,
+        "stop_when_all_assigned": cfg.solver_stop_when_all_assigned,
+        "greedy_hint": cfg.solver_greedy_hint,
+        "repair_seconds": cfg.solver_repair_seconds,
+    }
+    with phase("result_store"):
+        kept = store_result(
+            store_dir,
+            key,
+            StoredResult(
+                schedule=result.schedule,
+                status=result.status,
+                objective=objective,
+                time_limit=spec.time_limit,
+                parameters=parameters,
+                created=time.time(),
+            ),
+        )
+        evict(store_dir, max_mb=cfg.result_store_max_mb, max_age_days=cfg.result_store_max_age_days)
+    if kept.objective > objective:
+        print(f"Kept and returning the better stored result (objective {kept.objective} vs {objective}).")
+    return kept
@@ -0,0 +1,176 @@
+"""
+Result store: finished schedules (with CP-SAT status, objective and run parameters) saved under
+a fingerprint of the normalized students / teachers, the config fields that affect solving, the
+strategy, the hints and the OR-Tools version. solve_with_trace returns a stored result instead
+of solving again while it answers the request: proved optimal, or found with at least the
+requested time limit. Entries are gzipped JSON, evicted by age and by total size.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Any, Optional
+
+from ortools import __version__ as ORTOOLS_VERSION
+
+from scheduler.config import SchedulerConfig
+from scheduler.solver.hints import Hints
+
+# Bump when the solver changes what it produces for the same inputs, so old entries are not reused.
+STORE_VERSION: int = 2
+
+# Config fields that do not change the schedule (solver_time_seconds is compared, not keyed)
+_UNKEYED_FIELDS = (
+    "solver_time_seconds",
+    "solver_lns_workers",
+    "checkpoint_interval_seconds",
+    "output_dir",
+    "output_formats",
+    "result_store_max_mb",
+    "result_store_max_age_days",
+)
+
+Schedule = Dict[str, Dict[str, Dict[str, Any]]]
+
+
+@dataclass
+class StoredResult:
+    """A stored schedule; objective is build_model's weighted objective of the final schedule."""
+    schedule: Schedule
+    status: Optional[str]  # CP-SAT status name (None for the greedy strategy)
+    objective: int
+    time_limit: Optional[float]  # requested limit (None = budget scaled to model size)
+    parameters: Dict[str, Any] = field(default_factory=dict)
+    created: float = 0.0
+    ortools_version: str = ORTOOLS_VERSION
+
+    def answers(self, time_limit: Optional[float]) -> bool:
+        """Whether this result is as good as a new solve with time_limit would be asked to be."""
+        if self.status == "OPTIMAL":
+            return True
+        if self.time_limit is None or time_limit is None:
+            return self.time_limit == time_limit
+        return self.time_limit >= time_limit
+
+    def summary(self) -> str:
+        limit = "auto" if self.time_limit is None else f"{self.time_limit:g}s"
+        stored = time.strftime("%Y-%m-%d %H:%M", time.localtime(self.created))
+        return f"status {self.status or 'heuristic'}, objective {self.objective}, time limit {limit}, stored {stored}"
+
+
+def _normalize(value: Any) -> Any:
+    """JSON-ready form with a stable order: dicts by key, sets sorted, tuples as lists."""
+    if isinstance(value, dict):
+        return [[str(k), _normalize(v)] for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_normalize(v) for v in value), key=json.dumps)
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def result_key(
+    students: Dict[int, Dict[str, Any]],
+    teachers: Dict[str, Dict[str, Any]],
+    cfg: SchedulerConfig,
+    *,
+    strategy: str,
+    off_timetable_courses: List[str],
+    hints: Optional[Hints] = None,
+) -> str:
+    config = {k: v for k, v in asdict(cfg).items() if k not in _UNKEYED_FIELDS}
+    payload = json.dumps(
+        _normalize(
+            {
+                "version": STORE_VERSION,
+                "ortools": ORTOOLS_VERSION,
+                "students": students,
+                "teachers": teachers,
+                "config": config,
+                "strategy": strategy,
+                "off": off_timetable_courses,
+                "hints": None if hints is None else [hints.students, hints.teachers],
+            }
+        )
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def _entry_path(store_dir: str, key: str) -> str:
+    return os.path.join(store_dir, f"result_{key}.json.gz")
+
+
+def load_result(store_dir: str, key: str) -> Optional[StoredResult]:
+    """The entry stored under key, or None. Reading it marks it as recently used."""
+    path = _entry_path(store_dir, key)
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.pop("version", None) != STORE_VERSION:
+        return None
+    os.utime(path)
+    return StoredResult(**data)
+
+
+def store_result(store_dir: str, key: str, result: StoredResult) -> StoredResult:
+    """
+    Store result under key unless the stored entry has a better objective; then that one is kept,
+    with the larger time limit of the two so the longer run is not repeated. Returns the kept entry.
+    """
+    kept = result
+    previous = load_result(store_dir, key)
+    if previous is not None and previous.objective > result.objective:
+        kept = previous
+        if result.time_limit is None or previous.time_limit is None:
+            kept.time_limit = previous.time_limit if result.time_limit is None else result.time_limit
+        else:
+            kept.time_limit = max(previous.time_limit, result.time_limit)
+    os.makedirs(store_dir, exist_ok=True)
+    path = _entry_path(store_dir, key)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        json.dump({"version": STORE_VERSION, **asdict(kept)}, f)
+    os.replace(tmp, path)
+    return kept
+
+
+def evict(store_dir: str, *, max_mb: Optional[float], max_age_days: Optional[float]) -> int:
+    """
+    Delete entries not used for max_age_days, then least recently used ones until the store is
+    at most max_mb. None disables either limit. Returns the number of entries deleted.
+    """
+    try:
+        names = [n for n in os.listdir(store_dir) if n.startswith("result_") and n.endswith(".json.gz")]
+    except OSError:
+        return 0
+    entries = []
+    for name in names:
+        path = os.path.join(store_dir, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    entries.sort()  # least recently used first
+    now = time.time()
+    total = sum(size for _, size, _ in entries)
+    deleted = 0
+    for mtime, size, path in entries:
+        too_old = max_age_days is not None and now - mtime > max_age_days * 86400
+        too_big = max_mb is not None and total > max_mb * 2**20
+        if not (too_old or too_big):
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        deleted += 1
+    return deleted
@@ -0,0 +1,35 @@
+"""
+Small solver helpers shared by the solve, incremental, greedy and LNS modules.
+"""
+
+from typing import Any
+
+import numpy as np
+from ortools.sat.python import cp_model
+
+from scheduler.solver.model import ModelIndex
+
+
+def new_solver(time_limit: float, cfg: Any) -> cp_model.CpSolver:
+    """CpSolver with the time limit plus the config's worker count and relative gap."""
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = time_limit
+    if getattr(cfg, "solver_num_workers", 0) > 0:
+        solver.parameters.num_search_workers = cfg.solver_num_workers
+    if getattr(cfg, "solver_relative_gap", None) is not None:
+        solver.parameters.relative_gap_limit = cfg.solver_relative_gap
+    return solver
+
+
+def lock(var: cp_model.IntVar, value: int) -> None:
+    """Fix a variable to value by narrowing its domain in the model proto."""
+    var.Proto().domain[:] = [value, value]
+
+
+def course_overlap(index: ModelIndex) -> np.ndarray:
+    """overlap[i, j] = number of students requesting both courses[i] and courses[j]."""
+    pos = {c: i for i, c in enumerate(index.courses)}
+    incidence = np.zeros((len(index.student_courses), len(index.courses)), dtype=np.int32)
+    for row, courses in enumerate(index.student_courses.values()):
+        incidence[row, [pos[c] for c in courses]] = 1
+    return incidence.T @ incidence
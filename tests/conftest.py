@@ -0,0 +1,19 @@
+import os
+
+import pytest
+
+from scheduler.data import load_students, load_teachers
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "exampleInput")
+TEACHERS_PATH = os.path.join(EXAMPLE_DIR, "TeacherCourseMapping.xlsx")
+STUDENTS_PATH = os.path.join(EXAMPLE_DIR, "studentCourses.xlsx")
+
+
+@pytest.fixture(scope="session")
+def teachers():
+    return load_teachers(TEACHERS_PATH)
+
+
+@pytest.fixture(scope="session")
+def students():
+    return load_students(STUDENTS_PATH)
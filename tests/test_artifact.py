@@ -0,0 +1,65 @@
+import json
+import os
+from collections import Counter
+
+import pytest
+
+from scheduler.solver.artifact import INDEX_FILE, load_model, save_model, solve_saved
+from scheduler.solver.model import build_model
+from scheduler.solver.solve import solve_with_trace
+
+
+@pytest.fixture(scope="module")
+def few_students(students):
+    return {sid: students[sid] for sid in sorted(students)[:60]}
+
+
+def _indices(table):
+    return {key: var.Index() for key, var in table.items()}
+
+
+def test_variable_maps_round_trip(few_students, teachers, tmp_path):
+    model, SA, TA, size_vars = build_model(few_students, teachers, pool=False)
+    save_model(str(tmp_path), model, SA, TA, size_vars, students=few_students, teachers=teachers, periods=["S1P1"])
+    saved = load_model(str(tmp_path))
+    assert saved.model.Proto() == model.Proto()
+    assert _indices(saved.SA) == _indices(SA)
+    assert _indices(saved.TA) == _indices(TA)
+    assert _indices(saved.size_vars) == _indices(size_vars)
+    assert saved.student_names == {sid: s["name"] for sid, s in few_students.items()}
+    assert saved.periods == ["S1P1"]
+
+
+def test_solve_saved_names_pooled_teachers(few_students, teachers, tmp_path):
+    solve_with_trace(
+        few_students, teachers, strategy="monolithic", time_limit_seconds=2, repair_seconds=0,
+        save_model_dir=str(tmp_path),
+    )
+    saved = load_model(str(tmp_path))
+    assert saved.meta["strategy"] == "monolithic"
+    assert saved.teacher_pools
+    _, _, schedule = solve_saved(saved, time_limit=2, seed=1, workers=1)
+    assert schedule is not None
+
+    names = {s["name"] for s in few_students.values()}
+    teacher_names = {t["name"] for t in teachers.values()}
+    busy = Counter()
+    for p, courses in schedule.items():
+        for info in courses.values():
+            assert set(info["students"]) <= names
+            assert set(info["teachers"]) <= teacher_names
+            busy.update((p, name) for name in info["students"])
+    assert busy and max(busy.values()) == 1
+
+
+def test_unknown_version_is_rejected(few_students, teachers, tmp_path):
+    model, SA, TA, size_vars = build_model(few_students, teachers, pool=False)
+    save_model(str(tmp_path), model, SA, TA, size_vars)
+    path = os.path.join(tmp_path, INDEX_FILE)
+    with open(path) as f:
+        index = json.load(f)
+    index["version"] = -1
+    with open(path, "w") as f:
+        json.dump(index, f)
+    with pytest.raises(ValueError):
+        load_model(str(tmp_path))
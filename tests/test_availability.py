@@ -0,0 +1,70 @@
+import openpyxl
+import pytest
+
+from scheduler.config import TEACHER_AVAILABILITY_SHEET, get_config
+from scheduler.data import load_teachers
+from scheduler.solver.model import build_index, build_model
+
+HEADER = ["Last Name", "First Name", "Courses", "Classes", "Room Capcity"]
+
+
+def _workbook(path, rows, *, unavailable=None, sheet_rows=None):
+    book = openpyxl.Workbook()
+    ws = book.active
+    ws.append(HEADER + (["Unavailable Periods"] if unavailable is not None else []))
+    for i, row in enumerate(rows):
+        ws.append(row + ([unavailable[i]] if unavailable is not None else []))
+    if sheet_rows is not None:
+        extra = book.create_sheet(TEACHER_AVAILABILITY_SHEET)
+        extra.append(["Last Name", "First Name", "Unavailable Periods"])
+        for row in sheet_rows:
+            extra.append(row)
+    book.save(path)
+    return str(path)
+
+
+ROWS = [
+    ["Adams", "Ann", "MATH 9", 4, 30],
+    ["Brown", "Bo", "MATH 9", 4, 30],
+    ["Chen", "Cy", "ART 9", 4, 30],
+]
+
+
+def _away(teacher):
+    return {p for p, ok in teacher["availability"].items() if not ok}
+
+
+def test_column_and_sheet_are_combined(tmp_path):
+    path = _workbook(
+        tmp_path / "teachers.xlsx",
+        ROWS,
+        unavailable=["S2", "s1p1; S1P2", None],
+        sheet_rows=[["Adams", "Ann", "S1P4"], ["Chen", "Cy", "PM"]],
+    )
+    teachers = load_teachers(path)
+    groups = get_config().period_groups
+    assert _away(teachers["Adams_A"]) == set(groups["S2"]) | {"S1P4"}
+    assert _away(teachers["Brown_B"]) == {"S1P1", "S1P2"}
+    assert _away(teachers["Chen_C"]) == set(groups["PM"])
+
+    students = {1: {"name": "S1", "requests": ["MATH 9", "ART 9"]}}
+    index = build_index(students, teachers)
+    periods = get_config().periods
+    for tid, t in teachers.items():
+        assert index.teacher_periods[tid] == [p for p in periods if p not in _away(t)]
+    both_away = _away(teachers["Adams_A"]) & _away(teachers["Brown_B"])
+    assert index.course_periods["MATH 9"] == [p for p in periods if p not in both_away]
+    _, _, TA, _ = build_model(students, teachers, pool=False)
+    assert not any(p in _away(teachers[tid]) for tid, _, p in TA)
+
+
+def test_missing_column_means_always_available(tmp_path):
+    teachers = load_teachers(_workbook(tmp_path / "teachers.xlsx", ROWS))
+    assert all(not _away(t) for t in teachers.values())
+
+
+def test_bad_availability_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unknown period"):
+        load_teachers(_workbook(tmp_path / "a.xlsx", ROWS, unavailable=["S3", None, None]))
+    with pytest.raises(ValueError, match="unknown teachers"):
+        load_teachers(_workbook(tmp_path / "b.xlsx", ROWS, sheet_rows=[["Doe", "Di", "S1"]]))
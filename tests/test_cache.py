@@ -0,0 +1,77 @@
+import dataclasses
+import shutil
+
+from openpyxl import load_workbook
+
+from scheduler.config import get_config, set_config
+from scheduler.data.cache import load_cached
+
+from conftest import STUDENTS_PATH, TEACHERS_PATH
+
+
+def _copy_inputs(tmp_path):
+    teachers_path, students_path = tmp_path / "teachers.xlsx", tmp_path / "students.xlsx"
+    shutil.copy(TEACHERS_PATH, teachers_path)
+    shutil.copy(STUDENTS_PATH, students_path)
+    return str(teachers_path), str(students_path)
+
+
+def test_second_load_hits(tmp_path, teachers, students):
+    teachers_path, students_path = _copy_inputs(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    first = load_cached(teachers_path, students_path, cache_dir)
+    second = load_cached(teachers_path, students_path, cache_dir)
+    assert first[2] == {"teachers": False, "students": False}
+    assert second[2] == {"teachers": True, "students": True}
+    assert second[0] == teachers and second[1] == students
+
+
+def test_changed_file_is_reparsed(tmp_path):
+    teachers_path, students_path = _copy_inputs(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    load_cached(teachers_path, students_path, cache_dir)
+
+    wb = load_workbook(students_path)
+    ws = wb.active
+    name_col = next(cell.column for cell in ws[1] if cell.value == get_config().student_columns["name"])
+    ws.cell(row=2, column=name_col).value = "Renamed Student"
+    wb.save(students_path)
+
+    _, students, hits = load_cached(teachers_path, students_path, cache_dir)
+    assert hits == {"teachers": True, "students": False}
+    assert "Renamed Student" in {s["name"] for s in students.values()}
+
+
+def test_changed_config_is_reparsed(tmp_path):
+    teachers_path, students_path = _copy_inputs(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    load_cached(teachers_path, students_path, cache_dir)
+
+    cfg = get_config()
+    set_config(dataclasses.replace(cfg, max_teacher_sections=cfg.max_teacher_sections - 1))
+    try:
+        _, _, hits = load_cached(teachers_path, students_path, cache_dir)
+    finally:
+        set_config(cfg)
+    assert hits == {"teachers": False, "students": True}
+
+
+def test_only_latest_entry_per_file_is_kept(tmp_path):
+    teachers_path, students_path = _copy_inputs(tmp_path)
+    cache_dir = tmp_path / "cache"
+    load_cached(teachers_path, students_path, str(cache_dir))
+
+    cfg = get_config()
+    set_config(dataclasses.replace(cfg, max_teacher_sections=cfg.max_teacher_sections - 1))
+    try:
+        load_cached(teachers_path, students_path, str(cache_dir))
+    finally:
+        set_config(cfg)
+    names = sorted(p.name for p in cache_dir.iterdir())
+    assert [n.split("_")[0] for n in names] == ["students", "teachers"]
+
+    # A second copy of the same workbook elsewhere has its own entry
+    other = tmp_path / "other.xlsx"
+    shutil.copy(TEACHERS_PATH, other)
+    load_cached(str(other), students_path, str(cache_dir))
+    assert len(list(cache_dir.iterdir())) == 3
@@ -0,0 +1,54 @@
+import random
+from collections import Counter
+
+import pytest
+
+from scheduler.solver.cohort import _split_counts, group_cohorts
+
+
+def _check_split(counts, n_students):
+    out = _split_counts(counts, n_students)
+    assert len(out) == n_students
+    for student in out:
+        assert len(set(student.values())) == len(student)  # no two courses in one period
+    assert Counter((c, p) for student in out for c, p in student.items()) == Counter(
+        {key: m for key, m in counts.items() if m}
+    )
+
+
+def test_split_counts_full_matrix():
+    # 3 students x 3 courses, every course in every period once: a Latin square
+    counts = {(c, p): 1 for c in ("A", "B", "C") for p in ("1", "2", "3")}
+    _check_split(counts, 3)
+
+
+def test_split_counts_needs_path_flip():
+    # Greedy colouring in sorted order would put two courses in one period for a student
+    counts = {("A", "1"): 1, ("A", "2"): 1, ("B", "1"): 1, ("B", "3"): 1, ("C", "2"): 1, ("C", "3"): 1}
+    _check_split(counts, 2)
+
+
+def test_split_counts_random_matrices():
+    rng = random.Random(7)
+    courses, periods = [f"C{i}" for i in range(6)], [f"P{j}" for j in range(5)]
+    for _ in range(50):
+        n = rng.randint(1, 12)
+        row, col, counts = Counter(), Counter(), {}
+        for _ in range(rng.randint(0, 60)):
+            c, p = rng.choice(courses), rng.choice(periods)
+            if row[c] < n and col[p] < n:
+                counts[(c, p)] = counts.get((c, p), 0) + 1
+                row[c] += 1
+                col[p] += 1
+        _check_split(counts, n)
+
+
+def test_split_counts_rejects_overfull_course():
+    with pytest.raises(ValueError):
+        _split_counts({("A", "1"): 2, ("A", "2"): 1}, 2)
+
+
+def test_group_cohorts_ignores_request_order():
+    cohorts = group_cohorts({1: ["B", "A"], 2: ["A", "B"], 3: ["A"], 4: []})
+    by_courses = {tuple(c.courses): c.student_ids for c in cohorts}
+    assert by_courses == {("A", "B"): [1, 2], ("A",): [3]}
@@ -0,0 +1,90 @@
+import json
+import importlib.util
+
+import pandas as pd
+import pytest
+
+from scheduler.export import (
+    TABLE_COLUMNS,
+    check_output_formats,
+    export_school_schedule,
+    export_student_schedules,
+    export_table,
+    schedule_table,
+)
+from scheduler.solver.greedy import greedy_schedule
+
+
+@pytest.fixture(scope="module")
+def schedule(students, teachers):
+    return greedy_schedule(students, teachers)
+
+
+@pytest.fixture(scope="module")
+def table(schedule, students, teachers):
+    return schedule_table(schedule, students, teachers)
+
+
+def test_table_has_one_row_per_seat(table, schedule):
+    assert list(table.columns) == TABLE_COLUMNS
+    seats = sum(len(info["student_ids"]) for courses in schedule.values() for info in courses.values())
+    assert len(table) == seats
+    assert not table.duplicated(["student_id", "period"]).any()
+    assert (table["section_id"] == table["period"] + ":" + table["course"]).all()
+
+
+def test_csv_round_trips(tmp_path, table):
+    (path,) = export_table(table, str(tmp_path), ["excel", "csv"])
+    assert path.endswith("schedule.csv")
+    back = pd.read_csv(path)
+    assert list(back.columns) == TABLE_COLUMNS
+    assert back["student_id"].tolist() == table["student_id"].tolist()
+    assert back["section_id"].tolist() == table["section_id"].tolist()
+
+
+def test_json_lists_sections_and_students(tmp_path, table):
+    (path,) = export_table(table, str(tmp_path), ["json"])
+    with open(path, encoding="utf-8") as f:
+        doc = json.load(f)
+    assert set(doc) == {"periods", "sections", "students"}
+    assert sum(len(sec["student_ids"]) for sec in doc["sections"]) == len(table)
+    assert {sec["section_id"] for sec in doc["sections"]} == set(table["section_id"])
+    sections_of = {st["student_id"]: st["sections"] for st in doc["students"]}
+    first = table.iloc[0]
+    assert first["section_id"] in sections_of[int(first["student_id"])]
+
+
+@pytest.mark.skipif(
+    not any(importlib.util.find_spec(m) for m in ("pyarrow", "fastparquet")), reason="no Parquet engine installed"
+)
+def test_parquet_round_trips(tmp_path, table):
+    check_output_formats(["parquet"])
+    (path,) = export_table(table, str(tmp_path), ["parquet"])
+    pd.testing.assert_frame_equal(pd.read_parquet(path), table)
+
+
+def test_excel_matches_the_table(tmp_path, table, students):
+    school_path, students_path = str(tmp_path / "school.xlsx"), str(tmp_path / "students.xlsx")
+    export_school_schedule(table, output_path=school_path)
+    export_student_schedules(table, students, output_path=students_path)
+
+    school = pd.read_excel(school_path)
+    assert len(school) == table["section_id"].nunique()
+    assert school["Class Size"].sum() == len(table)
+    by_student = pd.read_excel(students_path).set_index("Student Number")
+    assert len(by_student) == len(students)
+    for row in table.head(50).itertuples():
+        assert by_student.at[row.student_id, row.period] == row.course
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        check_output_formats(["excel", "xml"])
+
+
+@pytest.mark.skipif(
+    any(importlib.util.find_spec(m) for m in ("pyarrow", "fastparquet")), reason="a Parquet engine is installed"
+)
+def test_parquet_needs_an_engine():
+    with pytest.raises(ValueError):
+        check_output_formats(["parquet"])
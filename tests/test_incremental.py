@@ -0,0 +1,62 @@
+import copy
+from collections import Counter
+
+import pytest
+
+from scheduler.solver.greedy import greedy_schedule
+from scheduler.solver.incremental import resolve_incremental
+
+
+@pytest.fixture(scope="module")
+def base(students, teachers):
+    return greedy_schedule(students, teachers)
+
+
+def _seats(schedule):
+    out = {}
+    for p, courses in schedule.items():
+        for c, info in courses.items():
+            for sid in info["student_ids"]:
+                out.setdefault(sid, set()).add((c, p))
+    return out
+
+
+def _check_unaffected_kept(base, result, students):
+    before, after = _seats(base), _seats(result.schedule)
+    for sid in students:
+        if sid in result.free_students or any(sec in result.free_sections for sec in before.get(sid, ())):
+            continue
+        assert after.get(sid, set()) == before.get(sid, set()), sid
+    busy = Counter((sid, p) for sid, secs in after.items() for _, p in secs)
+    assert max(busy.values()) == 1
+
+
+def test_add_and_drop_student(base, students, teachers):
+    edited = copy.deepcopy(students)
+    dropped = min(edited)
+    del edited[dropped]
+    new_sid = max(students) + 1
+    edited[new_sid] = dict(copy.deepcopy(students[min(students) + 1]), name="New Student")
+
+    result = resolve_incremental(base, edited, teachers, [dropped, new_sid], time_limit_seconds=10)
+    assert result.schedule is not None
+    assert result.free_students == {new_sid}
+    _check_unaffected_kept(base, result, edited)
+    after = _seats(result.schedule)
+    assert dropped not in after
+    assert after.get(new_sid)
+    assert sum(map(len, after.values())) >= sum(map(len, _seats(base).values())) - len(_seats(base)[dropped])
+
+
+def test_teacher_load_cap(base, students, teachers):
+    load = Counter(tid for courses in base.values() for info in courses.values() for tid in info["teacher_ids"])
+    tid = max(load, key=lambda t: (load[t], t))
+    edited = copy.deepcopy(teachers)
+    edited[tid]["max_sections"] = 2
+
+    result = resolve_incremental(base, students, edited, [tid], time_limit_seconds=10)
+    assert result.schedule is not None
+    new_load = Counter(t for courses in result.schedule.values() for info in courses.values() for t in info["teacher_ids"])
+    assert new_load[tid] <= 2
+    assert all(n <= edited[t]["max_sections"] for t, n in new_load.items() if t in load and n > load[t])
+    _check_unaffected_kept(base, result, students)
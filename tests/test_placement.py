@@ -0,0 +1,75 @@
+import copy
+
+import pytest
+
+from scheduler.config import get_config
+from scheduler.solver.greedy import greedy_schedule
+from scheduler.solver.placement import PlacementIndex
+
+
+@pytest.fixture(scope="module")
+def base(students, teachers):
+    return greedy_schedule(students, teachers)
+
+
+@pytest.fixture
+def index(base, students, teachers):
+    return PlacementIndex(copy.deepcopy(base), students, teachers)
+
+
+def test_enrolled_student_can_be_placed_again(index, students):
+    sid = min(students)
+    requests = students[sid]["requests"]
+    placement = index.place(requests, student_id=sid)
+    assert placement.complete
+    assert sorted(placement.periods) == sorted(c for c in requests if c not in index.off)
+    assert len(set(placement.periods.values())) == len(placement.periods)
+    for c, p in placement.periods.items():
+        assert index.schedule[p][c]["teachers"]
+
+
+def test_keep_leaves_course_in_its_period(index, students):
+    sid = min(students)
+    current = dict(index.occupancy[sid])
+    period, course = next(iter(current.items()))
+    placement = index.place(students[sid]["requests"], student_id=sid, keep=[course])
+    assert placement.periods[course] == period
+
+
+def test_blocked_reasons(index):
+    course, periods = next(iter(index.course_periods.items()))
+    for p in periods:
+        index.remaining[(course, p)] = 0
+    placement = index.place([course, "NO SUCH COURSE"])
+    assert not placement.complete
+    assert placement.blocked == {course: "all sections full", "NO SUCH COURSE": "no open section"}
+
+
+def test_off_timetable_course_is_not_placed(index):
+    off = get_config().off_timetable_courses
+    if not off:
+        pytest.skip("no off-timetable courses configured")
+    placement = index.place([off[0]])
+    assert placement.off_timetable == [off[0]]
+    assert not placement.periods and placement.complete
+
+
+def test_book_moves_the_student(index, students):
+    sid = min(students)
+    before = dict(index.occupancy[sid])
+    keep = list(before.values())[1:]
+    # Drop one course (the rest stay where they are), then request it again
+    dropped = list(before.values())[0]
+    drop_period = next(p for p, c in before.items() if c == dropped)
+    room_before = index.remaining[(dropped, drop_period)]
+    index.book(sid, index.place(keep, student_id=sid, keep=keep))
+    assert dropped not in index.occupancy[sid].values()
+    assert sid not in index.schedule[drop_period][dropped]["student_ids"]
+    assert index.remaining[(dropped, drop_period)] == room_before + 1
+
+    placement = index.place(students[sid]["requests"], student_id=sid, keep=keep)
+    assert placement.complete
+    index.book(sid, placement)
+    p = placement.periods[dropped]
+    assert sid in index.schedule[p][dropped]["student_ids"]
+    assert index.occupancy[sid][p] == dropped
@@ -0,0 +1,57 @@
+from collections import Counter
+
+from scheduler.config import get_config
+from scheduler.solver.model import build_index
+from scheduler.solver.pooling import assign_pool_teachers, pool_teachers
+
+
+def _teacher(courses, max_sections=6, periods=None):
+    cfg = get_config()
+    return {
+        "name": "",
+        "can_teach": courses,
+        "max_sections": max_sections,
+        "room_capacity": 30,
+        "availability": {p: periods is None or p in periods for p in cfg.periods},
+    }
+
+
+def test_identical_teachers_are_pooled():
+    periods = get_config().periods
+    teachers = {
+        "A": _teacher(["MATH 9", "MATH 10"]),
+        "B": _teacher(["MATH 10", "MATH 9"]),
+        "C": _teacher(["MATH 9", "MATH 10"], periods=periods[:4]),
+        "D": _teacher(["MATH 9", "MATH 10"], max_sections=3),
+        "E": _teacher(["MATH 9", "MATH 10"]),
+    }
+    students = {1: {"name": "S1", "requests": ["MATH 9", "MATH 10"]}}
+    index = pool_teachers(build_index(students, teachers), teachers)
+    assert index.teacher_pools == {"pool:A": ["A", "B", "E"]}
+    assert index.course_teachers["MATH 9"] == ["pool:A", "C", "D"]
+    assert set(index.teacher_courses) == {"pool:A", "C", "D"}
+    assert index.teacher_periods["pool:A"] == list(periods)
+
+
+def test_no_pool_leaves_index_unchanged():
+    teachers = {"A": _teacher(["MATH 9"]), "B": _teacher(["ART 9"])}
+    students = {1: {"name": "S1", "requests": ["MATH 9", "ART 9"]}}
+    index = build_index(students, teachers)
+    assert pool_teachers(index, teachers) is index
+
+
+def test_pooled_sections_get_distinct_members():
+    p1, p2 = get_config().periods[:2]
+    assignments = [
+        ("pool:A", "MATH 9", p2),
+        ("pool:A", "MATH 9", p1),
+        ("pool:A", "MATH 10", p1),
+        ("pool:A", "MATH 10", p2),
+        ("C", "MATH 9", p2),
+    ]
+    named = assign_pool_teachers(assignments, {"pool:A": ["A", "B"]})
+    assert len(named) == len(assignments)
+    assert ("C", "MATH 9", p2) in named
+    assert not any(tid.startswith("pool:") for tid, _, _ in named)
+    assert max(Counter((tid, p) for tid, _, p in named).values()) == 1
+    assert Counter(tid for tid, _, _ in named if tid != "C") == {"A": 2, "B": 2}
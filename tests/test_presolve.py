@@ -0,0 +1,61 @@
+import copy
+
+from scheduler.config import get_config
+from scheduler.solver.greedy import greedy_schedule
+from scheduler.solver.model import build_index
+from scheduler.solver.presolve import presolve
+
+
+def _teacher(courses, max_sections, periods=None):
+    cfg = get_config()
+    return {
+        "name": "",
+        "can_teach": courses,
+        "max_sections": max_sections,
+        "room_capacity": 30,
+        "availability": {p: periods is None or p in periods for p in cfg.periods},
+    }
+
+
+def test_bounds_on_small_input():
+    cfg = get_config()
+    min_size = cfg.min_class_size
+    teachers = {
+        "T1": _teacher(["MATH 9"], 2, periods=cfg.periods[:3]),
+        "T2": _teacher(["ART 9"], 0),
+        "T3": _teacher(["DRAMA 9"], 4),
+    }
+    students = {sid: {"name": f"S{sid}", "requests": ["MATH 9", "ART 9"]} for sid in range(3 * min_size)}
+    students[0]["requests"].append("DRAMA 9")
+    index = build_index(students, teachers)
+    before = copy.deepcopy(index)
+    result = presolve(index, teachers, cfg)
+
+    assert index == before
+    assert sorted(result.closed_courses) == ["ART 9", "DRAMA 9"]  # no teacher load / demand below minimum
+    assert result.index.courses == ["MATH 9"]
+    assert result.index.course_periods["MATH 9"] == cfg.periods[:3]
+    assert result.index.teacher_periods["T2"] == []
+    assert result.max_sections["MATH 9"] == 2  # T1's load, below 3 usable periods and demand // min size
+    assert result.index.caps["MATH 9"][2] == min(index.caps["MATH 9"][2], 3 * min_size)
+    assert result.demand["MATH 9"] == 3 * min_size
+    assert all(cs == ["MATH 9"] for cs in result.index.student_courses.values())
+    assert result.removed_vars > 0 and result.removed_constraints > 0
+
+
+def test_greedy_schedule_fits_presolved_bounds(students, teachers):
+    schedule = greedy_schedule(students, teachers)
+    result = presolve(build_index(students, teachers), teachers)
+    index = result.index
+    sections = {}
+    for p, courses in schedule.items():
+        for c, info in courses.items():
+            if not info["teachers"]:
+                continue
+            assert c in index.course_periods and p in index.course_periods[c], (c, p)
+            assert len(info["students"]) <= index.caps[c][2], (c, p)
+            for tid in info["teacher_ids"]:
+                assert tid in index.course_teachers[c] and p in index.teacher_periods[tid], (tid, c, p)
+            sections[c] = sections.get(c, 0) + 1
+    for c, n in sections.items():
+        assert n <= result.max_sections[c], c
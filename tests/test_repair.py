@@ -0,0 +1,56 @@
+import copy
+from collections import Counter
+
+from scheduler.solver.greedy import greedy_schedule
+from scheduler.solver.model import build_index
+from scheduler.solver.repair import repair_schedule
+
+
+def _section_students(info, sid_by_name):
+    return info.get("student_ids") or [sid_by_name[name] for name in info["students"]]
+
+
+def _check_feasible(schedule, students, teachers):
+    index = build_index(students, teachers)
+    sid_by_name = {s["name"]: sid for sid, s in students.items()}
+    busy = Counter()
+    for p, courses in schedule.items():
+        for c, info in courses.items():
+            if c not in index.caps:
+                continue
+            sids = _section_students(info, sid_by_name)
+            min_size, _, max_size = index.caps[c]
+            assert min_size <= len(sids) <= max_size, (p, c)
+            for sid in sids:
+                assert c in index.student_courses[sid], (sid, c)
+                busy[(sid, p)] += 1
+    assert max(busy.values()) == 1
+
+
+def test_repair_seats_dropped_students_feasibly(students, teachers):
+    index = build_index(students, teachers)
+    schedule = copy.deepcopy(greedy_schedule(students, teachers))
+    dropped = 0
+    for courses in schedule.values():
+        for c, info in courses.items():
+            while c in index.caps and len(info["students"]) > index.caps[c][0] and dropped < 100:
+                for key in ("students", "student_ids"):
+                    if key in info:
+                        info[key].pop()
+                dropped += 1
+    assert dropped == 100
+
+    result = repair_schedule(schedule, students, teachers, time_limit_seconds=10)
+    assert result.unassigned_before >= dropped
+    assert result.recovered > 0
+    assert result.unassigned_after == result.unassigned_before - result.recovered
+    _check_feasible(result.schedule, students, teachers)
+
+
+def test_repair_keeps_sections(students, teachers):
+    schedule = greedy_schedule(students, teachers)
+    result = repair_schedule(schedule, students, teachers, time_limit_seconds=10)
+    before = {(p, c, tuple(info["teachers"])) for p, courses in schedule.items() for c, info in courses.items()}
+    after = {(p, c, tuple(info["teachers"])) for p, courses in result.schedule.items() for c, info in courses.items()}
+    assert after == before
+    assert result.unassigned_after <= result.unassigned_before
@@ -0,0 +1,66 @@
+import os
+import time
+
+from scheduler.config import get_config
+from scheduler.solver.solve import solve_with_trace
+from scheduler.solver.store import StoredResult, evict, load_result, result_key, store_result
+
+SCHEDULE = {"S1P1": {"MATH 10": {"students": ["A"], "teachers": ["T"]}}}
+
+
+def _result(objective, time_limit=10.0, status="FEASIBLE"):
+    return StoredResult(schedule=SCHEDULE, status=status, objective=objective, time_limit=time_limit, created=time.time())
+
+
+def test_round_trip(tmp_path):
+    store_result(str(tmp_path), "k", _result(5))
+    loaded = load_result(str(tmp_path), "k")
+    assert loaded.schedule == SCHEDULE and loaded.objective == 5 and loaded.status == "FEASIBLE"
+    assert load_result(str(tmp_path), "other") is None
+
+
+def test_better_stored_result_is_kept_with_longer_limit(tmp_path):
+    store_result(str(tmp_path), "k", _result(9, time_limit=10.0))
+    kept = store_result(str(tmp_path), "k", _result(3, time_limit=60.0))
+    assert kept.objective == 9 and kept.time_limit == 60.0
+    assert load_result(str(tmp_path), "k").objective == 9
+    assert store_result(str(tmp_path), "k", _result(12, time_limit=5.0)).objective == 12
+
+
+def test_answers():
+    assert _result(1, time_limit=30.0).answers(20.0)
+    assert not _result(1, time_limit=10.0).answers(20.0)
+    assert _result(1, time_limit=1.0, status="OPTIMAL").answers(600.0)
+    assert _result(1, time_limit=None).answers(None)
+    assert not _result(1, time_limit=None).answers(20.0)
+
+
+def test_evict_by_age_then_size(tmp_path):
+    for i, key in enumerate(("old", "a", "b")):
+        store_result(str(tmp_path), key, _result(i))
+    old = os.path.join(tmp_path, "result_old.json.gz")
+    os.utime(old, (time.time() - 3 * 86400,) * 2)
+    assert evict(str(tmp_path), max_mb=None, max_age_days=1) == 1
+    assert not os.path.exists(old)
+    assert evict(str(tmp_path), max_mb=0, max_age_days=None) == 2
+    assert evict(str(tmp_path / "missing"), max_mb=0, max_age_days=0) == 0
+
+
+def test_key_depends_on_inputs(students, teachers):
+    cfg = get_config()
+    off = cfg.off_timetable_courses
+    key = result_key(students, teachers, cfg, strategy="greedy", off_timetable_courses=off)
+    assert key == result_key(dict(students), teachers, cfg, strategy="greedy", off_timetable_courses=off)
+    assert key != result_key(students, teachers, cfg, strategy="monolithic", off_timetable_courses=off)
+    fewer = {sid: s for sid, s in students.items() if sid != min(students)}
+    assert key != result_key(fewer, teachers, cfg, strategy="greedy", off_timetable_courses=off)
+
+
+def test_solve_reuses_stored_result(students, teachers, tmp_path):
+    kwargs = dict(strategy="greedy", repair_seconds=0, time_limit_seconds=5, result_store_dir=str(tmp_path))
+    first = solve_with_trace(students, teachers, **kwargs)
+    assert not first.reused
+    second = solve_with_trace(students, teachers, **kwargs)
+    assert second.reused and second.schedule == first.schedule
+    assert [p.source for p in second.trace] == ["stored"]
+    assert not solve_with_trace(students, teachers, resolve=True, **kwargs).reused